@@ -8,21 +8,34 @@ Description:
 
 Inputs:
     - difficulty (string) -- either "Easy", "Medium", or "Hard"
+    - board_mgr (BoardManager) -- the board being played, or the board_mgr of a
+      chunked_board.ChunkedGame (cell ids are then (chunk, offset) pairs)
+    - game (GameLogic or ChunkedGame, optional) -- supplies the incrementally maintained frontier;
+      without it the frontier is rebuilt from a full scan every turn (bounded boards only)
+    - seed (optional) -- seeds the solver's own RNG (random picks and guess tie-breaks),
+      so a seeded game plays out the same way every time
 Outputs:
-    - None -- it interacts with the board by revealing cells
+    - decide(cancel=None) -> list of move_log.Move (reveal/flag, row, col, confidence): the turn's
+      moves, worked out from a read-only look at the board (safe to run off the GUI thread; see
+      ai_worker.py). GameLogic.apply_moves makes them.
+    - play_turn(reveal, setFlag) -- older callback interface: decides, then makes the moves
+      through the given reveal/setFlag callbacks
     
 Authors: Connor Anderson, Mohamed Ashraq
 
 Creation Date: 10/01/2025
 """
 # imports all necessary classes and APIs
-from tkinter import messagebox
-from board_manager import BoardManager
 import random
+from board_manager import BoardManager
+from frontier import Frontier
+from constraint_solver import ConstraintSolver
+from mine_probability import MineProbability
+from move_log import FLAG, REVEAL, Move
 
 # creates GUI class object
 class AISolver:
-    def __init__(self, difficulty, board_mgr):
+    def __init__(self, difficulty, board_mgr, game=None, seed=None):
         # the difficulty it was initialized with ("Easy", "Medium", or "Hard")
         self.difficulty = difficulty
 
@@ -30,6 +43,18 @@ class AISolver:
         self.reveal = None 
 
         self.board_mgr = board_mgr
+
+        # the GameLogic whose frontier the medium and hard rules read (may be None)
+        self.game = game
+
+        # the deduction engine hard falls back on once the single-cell rules run dry
+        self.csp = ConstraintSolver()
+
+        # exact mine probabilities for best guesses (shares the solver's per-component cache)
+        self.probability = MineProbability(self.csp)
+
+        # the solver's own RNG, independent of the board's mine-placement RNG
+        self.rng = random.Random(seed)
         
         # set the 
         match difficulty:
@@ -44,194 +69,212 @@ class AISolver:
                 
                 
 
-    # this is for the AI to take its turn
+    # older callback interface for taking a turn: decide, then make each move through
+    # reveal/setFlag callbacks shaped like GameGUI's (prefer GameLogic.apply_moves(decide()))
     def play_turn(self, reveal, setFlag):
+        for move in self.decide():
+            prev = setFlag(move.kind == FLAG)
+            reveal(move.row, move.col)
+            setFlag(prev)
+
+    # Work out this turn's moves without making them: a list of Move objects, to be applied
+    # in order. The board is only read; the one thing changed is the game frontier's dirty set,
+    # which keeps every cell that may still need a look whether the moves are made, dropped or
+    # the turn is cancelled. So it can run off the GUI thread while input is locked.
+    # Returns [] if `cancel` (a threading.Event) gets set while thinking.
+    def decide(self, cancel=None):
         # this will call the respective function (easy, medium, or hard) determined during initialization
-        self.reveal(reveal,setFlag) 
+        return self.reveal(cancel)
 
+    @staticmethod
+    def _cancelled(cancel) -> bool:
+        return cancel is not None and cancel.is_set()
 
     # the easy function
-    def easy(self,reveal, setFLag):
-        # messagebox.showinfo(message=f"AI Solver (difficulty: {self.difficulty}) called self.easy()")
-        untouched = self.board_mgr.untouched_cells()
-        cell_to_uncover = random.choice(untouched)
-        #we have to set the flag state to false so that it doesn't place flags when flag_mode is on
-        flag_state = setFLag(False)
-        reveal(cell_to_uncover[0],cell_to_uncover[1])
-        setFLag(flag_state)
+    def easy(self, cancel=None):
+        row, col = self.board_mgr.random_untouched(self.rng) # O(1) pick from the covered-cell index
+        return [Move(REVEAL, row, col)]
+
+    # the frontier to reason about: the game's incrementally updated one, or a
+    # freshly scanned one when the solver was created without a GameLogic
+    def _frontier(self):
+        if self.game is not None:
+            return self.game.frontier
+        frontier = Frontier(self.board_mgr)
+        frontier.rebuild()
+        return frontier
+
+    # (hidden, flagged) neighbor counts of frontier cell i: cached by the game's
+    # frontier, recounted when there is no game keeping that cache current
+    def _counts(self, frontier, i):
+        if self.game is not None:
+            return frontier.cells[i]
+        revealed, flags = self.board_mgr.revealed, self.board_mgr.flags
+        hidden = [j for j in self.board_mgr.neighbor_ids(i) if not revealed[j]]
+        return len(hidden), sum(1 for j in hidden if flags[j])
+
+    # flags the game will still accept
+    def _flags_left(self) -> int:
+        if self.game is not None:
+            return self.board_mgr.mine_count - self.game.flags_placed
+        flags = self.board_mgr.flags
+        return self.board_mgr.mine_count - sum(1 for i in range(self.board_mgr.grid_size ** 2) if flags[i])
 
     # the medium function
-    def medium(self,reveal,setFlag):
-        #Iterate through the whole grid of cells
-        # messagebox.showinfo(message=f"AI Solver (difficulty: {self.difficulty}) called self.medium()")
-        size = len(self.board_mgr.grid)
-        for row in range(size):
-            for col in range(size):
-                cell = self.board_mgr.get_cell(row,col)
-                if cell.is_revealed:
-                    hidden = []
-                    flagged = 0
-                    #The next 5 lines get all the hidden and flagged cells
-                    neighboors = self.board_mgr.neighbors(row,col) #Gets list of neighboor coordinates
-                    for nrow,ncol in neighboors:
-                        #Iterates through the coordinates of each of the 8 neighboors
-                        neighboor = self.board_mgr.get_cell(nrow,ncol) 
-                        if not neighboor.is_revealed: hidden.append((nrow,ncol)) #checks if cell has been revealed
-                        if neighboor.has_flag: flagged += 1 #checks if cell is flagged
-                    if len(hidden) == cell.neighbor_count:
-                        #If the cell number is the same as the number of adjacent hidden tiles, flag all adjacent hidden tiles
-                        for hrow,hcol in hidden:
-                            if (not self.board_mgr.is_flagged(hrow,hcol)):
-                                flag_state = setFlag(True) 
-                                reveal(hrow,hcol)
-                                setFlag(flag_state)
-                    if flagged == cell.neighbor_count:
-                        #If the number of adjacent flagged cells is the same as the cell number, reveal all remaining adjecent non flagged cells
-                        for hrow,hcol in hidden: 
-                            if self.board_mgr.is_flagged(hrow,hcol):
-                                continue
-                            #we have to set the flag state to false so that it doesn't place flags when flag_mode is on
-                            flag_state = setFlag(False)
-                            reveal(hrow,hcol)
-                            setFlag(flag_state)
-                            return
-        # If none of the first two rules apply, choose a random cell 
-        self.easy(reveal, setFlag)
+    def medium(self, cancel=None):
+        # Only revisit frontier cells whose hidden/flag counts changed since the last look;
+        # the rules cannot newly apply to a cell whose neighborhood did not change.
+        frontier = self._frontier()
+        revealed, flags, counts = self.board_mgr.revealed, self.board_mgr.flags, self.board_mgr.counts
+        # flags decided this turn are not on the board yet, so they are tracked here
+        planned = set()
+        flags_left = self._flags_left()
+        moves = []
+        # cells taken from the dirty set, and those among them that need no second look
+        # whatever becomes of this turn's moves; the rest go back (see _give_back)
+        popped, settled = [], set()
+        try:
+            while frontier.dirty:
+                if self._cancelled(cancel):
+                    settled.clear()
+                    return []
+                i = frontier.dirty.pop()
+                popped.append(i)
+                hidden_count, flagged = self._counts(frontier, i) # neighbor counts of this revealed cell
+                hidden = [j for j in self.board_mgr.neighbor_ids(i) if not revealed[j]] #the hidden neighboors
+                flagged += sum(1 for j in hidden if j in planned)
+                # set when a mine here cannot be flagged (no flags left): looked at again next turn
+                stuck = False
+                if hidden_count == counts[i]:
+                    #If the cell number is the same as the number of adjacent hidden tiles, flag all adjacent hidden tiles
+                    for j in hidden:
+                        if flags[j] or j in planned:
+                            continue
+                        if flags_left == 0:
+                            stuck = True
+                            break
+                        planned.add(j)
+                        flags_left -= 1
+                        flagged += 1
+                        moves.append(Move(FLAG, *self.board_mgr.position(j), 1.0))
+                        # the new flag changes its neighbors' flag counts: look at them again this turn
+                        frontier.dirty.update(k for k in self.board_mgr.neighbor_ids(j) if k in frontier.cells)
+                if flagged == counts[i]:
+                    #If the number of adjacent flagged cells is the same as the cell number, reveal all remaining adjecent non flagged cells
+                    for j in hidden: 
+                        if flags[j] or j in planned:
+                            continue
+                        moves.append(Move(REVEAL, *self.board_mgr.position(j), 1.0))
+                        return moves
+                # nothing applies here, and nothing planned this turn went into that verdict
+                if not planned and not stuck:
+                    settled.add(i)
+            # If none of the first two rules apply, take a blind guess next to the frontier
+            if self._cancelled(cancel):
+                settled.clear()
+                return []
+            moves.append(self._random_guess(frontier, planned))
+            return moves
+        finally:
+            self._give_back(frontier, popped, settled)
 
    
     # the hard function
-    def hard(self, reveal, setFlag):
-        size = len(self.board_mgr.grid)
-
-        # Medium rules
-        for row in range(size):
-            for col in range(size):
-                cell = self.board_mgr.get_cell(row, col)
-                if not cell.is_revealed:
-                    continue
-
-                hidden = []
-                flagged = 0
-                #The next lines get all the hidden and flagged cells
-                neighbors = self.board_mgr.neighbors(row, col)  # Gets list of neighbor coordinates
-                for nrow, ncol in neighbors:
-                    #Iterates through the coordinates of each of the 8 neighbors
-                    ncell = self.board_mgr.get_cell(nrow, ncol)
-                    if not ncell.is_revealed:
-                        hidden.append((nrow, ncol))  # checks if cell has been revealed
-                    if ncell.has_flag:
-                        flagged += 1                # checks if cell is flagged
-
-                # Rule 1: if #hidden == number -> all hidden are mines
+    def hard(self, cancel=None):
+        frontier = self._frontier()
+        revealed, flags, counts = self.board_mgr.revealed, self.board_mgr.flags, self.board_mgr.counts
+
+        # Medium rules, over the frontier cells that changed since they were last checked.
+        # A cell we act on goes back into the dirty set, as does every cell looked at when
+        # the turn is cancelled (see _give_back).
+        flags_left = self._flags_left()
+        popped, settled = [], set()
+        try:
+            while frontier.dirty:
+                if self._cancelled(cancel):
+                    settled.clear()
+                    return []
+                i = frontier.dirty.pop()
+                popped.append(i)
+                hidden_count, flagged = self._counts(frontier, i)
+                #The hidden neighbors of this revealed cell
+                hidden = [j for j in self.board_mgr.neighbor_ids(i) if not revealed[j]]
+
+                # Rule 1: if #hidden == number -> all hidden are mines (only while flags are left;
+                # otherwise fall through to rule 2, and look at the cell again next turn)
                 # ChatGPT helped with debugging the issue of the AI taking more than 1 turn
-                if hidden and len(hidden) == cell.neighbor_count:
-                    for hr, hc in hidden:
-                        if not self.board_mgr.is_flagged(hr, hc):
-                            # we have to set the flag state to true so that it places a flag
-                            prev = setFlag(True)
-                            reveal(hr, hc)
-                            setFlag(prev)
-                            return
+                stuck = False
+                if hidden_count == counts[i]:
+                    for j in hidden:
+                        if not flags[j]:
+                            if flags_left > 0:
+                                return [Move(FLAG, *self.board_mgr.position(j), 1.0)]
+                            stuck = True
+                            break
 
                 # Rule 2: if #flagged == number -> remaining hidden are safe 
-                if hidden and flagged == cell.neighbor_count:
-                    for hr, hc in hidden:
-                        if not self.board_mgr.is_flagged(hr, hc):
-                            # we have to set the flag state to false so that it doesn't place flags when flag_mode is on
-                            prev = setFlag(False)
-                            reveal(hr, hc)
-                            setFlag(prev)
-                            return
+                if flagged == counts[i]:
+                    for j in hidden:
+                        if not flags[j]:
+                            return [Move(REVEAL, *self.board_mgr.position(j), 1.0)]
+                if not stuck:
+                    settled.add(i)
 
-        # 1-2-1 pattern from horizontal & vertical 
-        if self._apply_121_patterns(reveal, setFlag):
-            return
+            # Constraint solving over the whole frontier (covers 1-2-1 and every other
+            # pattern that can be settled without guessing); reveal a safe cell first
+            if self._cancelled(cancel):
+                settled.clear()
+                return []
+            move = self._deduction(frontier)
+            if move is not None:
+                return [move]
 
-        # If none of the rules apply choose a random cell easy mode
-        self.easy(reveal, setFlag)
+            # If none of the rules apply, reveal the cell least likely to be a mine
+            if self._cancelled(cancel):
+                settled.clear()
+                return []
+            return [self._guess(frontier)]
+        finally:
+            self._give_back(frontier, popped, settled)
 
 
     #Helpers
-    def _in_bounds(self, r, c) -> bool:
-        n = self.board_mgr.grid_size
-        return 0 <= r < n and 0 <= c < n
-
-    def _apply_121_patterns(self, reveal, setFlag) -> bool:
-        size = len(self.board_mgr.grid)
-
-        # Horizontal 1-2-1
-        # Guidance from ChatGPT used for 1-2-1 functions to understand how this pattern guarantees safe moves and help structure it cleanly
-
-        for r in range(size):
-            for c in range(1, size - 1):
-                left  = self.board_mgr.get_cell(r, c - 1)
-                mid   = self.board_mgr.get_cell(r, c)
-                right = self.board_mgr.get_cell(r, c + 1)
-                if not (left.is_revealed and mid.is_revealed and right.is_revealed):
-                    continue
-                if not (left.neighbor_count == 1 and mid.neighbor_count == 2 and right.neighbor_count == 1):
-                    continue
-
-                # Check the hidden strip directly above or below the 1-2-1 trio
-                for dr in (-1, 1):
-                    rr = r + dr
-                    if not self._in_bounds(rr, c):
-                        continue
-                    a = (rr, c - 1)  # outer (mine)
-                    b = (rr, c)      # inner (safe)
-                    d = (rr, c + 1)  # outer (mine)
-
-                    # Must be in-bounds and currently hidden
-                    if not (self._in_bounds(*a) and self._in_bounds(*b) and self._in_bounds(*d)):
-                        continue
-                    if self.board_mgr.get_cell(*a).is_revealed: 
-                        continue
-                    if self.board_mgr.get_cell(*b).is_revealed: 
-                        continue
-                    if self.board_mgr.get_cell(*d).is_revealed: 
-                        continue
-
-                    # Reveal the middle safe tile, then return
-                    prev = setFlag(False)
-                    reveal(*b)
-                    setFlag(prev)
-                    return True
-
-        # Vertical 1-2-1
-        for r in range(1, size - 1):
-            for c in range(size):
-                top = self.board_mgr.get_cell(r - 1, c)
-                mid = self.board_mgr.get_cell(r, c)
-                bot = self.board_mgr.get_cell(r + 1, c)
-                if not (top.is_revealed and mid.is_revealed and bot.is_revealed):
-                    continue
-                if not (top.neighbor_count == 1 and mid.neighbor_count == 2 and bot.neighbor_count == 1):
-                    continue
-
-                # Check the hidden strip directly left or right of the 1-2-1 
-                for dc in (-1, 1):
-                    cc = c + dc
-                    if not self._in_bounds(r, cc):
-                        continue
-                    a = (r - 1, cc)  # outer (mine)
-                    b = (r, cc)      # inner (safe)
-                    d = (r + 1, cc)  # outer (mine)
-
-                    if not (self._in_bounds(*a) and self._in_bounds(*b) and self._in_bounds(*d)):
-                        continue
-                    if self.board_mgr.get_cell(*a).is_revealed: 
-                        continue
-                    if self.board_mgr.get_cell(*b).is_revealed: 
-                        continue
-                    if self.board_mgr.get_cell(*d).is_revealed: 
-                        continue
-
-                    
-                    prev = setFlag(False)
-                    reveal(*b)
-                    setFlag(prev)
-                    return True
-
-        # No 1-2-1 action found
-        return False
+    # Put the cells a turn took from the frontier's dirty set back, except the settled ones (no rule
+    # applies to them on the board as it is). A cancelled turn settles nothing, and a cell that led
+    # to a move stays dirty until the move is made, so a turn whose moves are dropped loses nothing.
+    @staticmethod
+    def _give_back(frontier, popped, settled):
+        frontier.dirty.update(i for i in popped if i not in settled and i in frontier.cells)
+
+    # a move the constraint solver proves: a safe reveal, else a flag if one is left to place
+    def _deduction(self, frontier):
+        safe, mines = self.csp.deduce(self.board_mgr, frontier)
+        if safe:
+            return Move(REVEAL, *self.board_mgr.position(min(safe)), 1.0)
+        # only flag when a flag is left to place (wrong player flags can use them up)
+        if mines and (self.game is None or self.game.flags_placed < self.board_mgr.mine_count):
+            return Move(FLAG, *self.board_mgr.position(min(mines)), 1.0)
+        return None
+
+    # Medium's guess: a uniformly random covered, unflagged cell bordering the frontier (no
+    # probabilities, so medium stays weaker than hard), or any untouched cell when nothing
+    # borders it yet. Cells medium just planned to flag are never picked.
+    def _random_guess(self, frontier, planned=()):
+        revealed, flags = self.board_mgr.revealed, self.board_mgr.flags
+        candidates = sorted({j for i in frontier.cells for j in self.board_mgr.neighbor_ids(i)
+                             if not revealed[j] and not flags[j] and j not in planned})
+        if candidates:
+            return Move(REVEAL, *self.board_mgr.position(self.rng.choice(candidates)))
+        row, col = self.board_mgr.random_untouched(self.rng)
+        return Move(REVEAL, row, col)
 
+    # Best-guess move: reveal the covered cell with the lowest exact mine probability.
+    # With nothing revealed yet every covered cell is equally likely, so this is a random pick.
+    def _guess(self, frontier):
+        if self.game is not None:
+            flags_placed = self.game.flags_placed
+        else:
+            flags_placed = sum(1 for i in range(self.board_mgr.grid_size ** 2) if self.board_mgr.flags[i])
+        probabilities = self.probability.compute(self.board_mgr, frontier, flags_placed)
+        (row, col), p = probabilities.best_guess(self.rng)
+        return Move(REVEAL, row, col, 1.0 - p)
@@ -7,6 +7,8 @@ Description:
 Purpose: 
     - To display a GUI that can be interacted with by the user while maintaining the logic of the game.
 Inputs:
+    - Board size and renderer ("buttons", "canvas" or "auto") passed to GameGUI
+    - no_guess: deal boards solvable without guessing (no_guess.py), when one is ready in time
     - User specified mine count
     - User inputs in the form of button clicking. 
     - Cell coordinates 
@@ -15,6 +17,8 @@ Outputs:
     - Updates screen according to game logic and inputs from the user
     - Update the mine count
     - Produces warning messages as needed when out of bounds
+    - Runs the AI's decision on a worker thread (ai_worker.py) and applies its moves from
+      the Tk loop; the board is locked and can be cancelled (Escape) while it thinks
     
 Authors: Genea Dinnall, Sam Kelemen, Meg Taggart, Matthew Eagleman
 
@@ -23,15 +27,44 @@ Creation Date: 09/17/2025
 # imports all necessary classes and APIs
 import time
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import messagebox
 from board_manager import BoardManager
 from game_logic import GameLogic
 from AI_Solver import AISolver
+from ai_worker import AIWorker
+from move_log import AI, PLAYER
+from no_guess import NoGuessPool
+from canvas_renderer import COVERED, CanvasBoard
+
+# boards with more cells per side than this use the canvas renderer when renderer="auto"
+CANVAS_THRESHOLD = 20
+# most cells repainted per flush; the rest are left for the next frame
+FLUSH_BUDGET = 2000
+# how often (ms) the Tk loop checks whether the AI has decided its move
+AI_POLL_MS = 20
 
 # creates GUI class object
 class GameGUI:
-    def __init__(self):
+    def __init__(self, grid_size: int = 10, renderer: str = "auto", no_guess: bool = False):
+        if renderer not in ("auto", "buttons", "canvas"):
+            raise ValueError("renderer must be 'auto', 'buttons' or 'canvas'")
         # Initializes all necessary variables for GUI management to make updates to the user interface
+        self.grid_size = grid_size
+        # one tk.Button per cell, or a single scrollable canvas (see canvas_renderer.py) for large boards
+        if renderer == "auto":
+            renderer = "canvas" if grid_size > CANVAS_THRESHOLD else "buttons"
+        self.renderer = renderer
+        self.canvas_board = None
+        # cells waiting to be repainted: (row, col) -> (text, bg), flushed once per frame
+        self.pending = {}
+        # what each button currently shows, so unchanged cells are not reconfigured
+        self.shown = {}
+        self.flush_id = None
+        # the one font every cell uses (created with the board, never per update)
+        self.cell_font = None
+        # the mine that ended the game, once one has been hit
+        self.exploded = None
         self.game = None
         self.board = None
         self.root = tk.Tk()
@@ -59,12 +92,17 @@ class GameGUI:
         self.ai = None # to be initialized in startGame if the player chooses to play againt the AI (after the AI difficulty was selected)
         self.ai_diff = None # to hold the string corelating to the ai difficulty
         self.ai_active = False # indicate if there is an active AI Solver
+        self.ai_worker = None # runs the AI's decision off the Tk thread (see ai_worker.py)
+        self.thinking = False # True while the AI is deciding; board input is locked meanwhile
+        self.cancel_button = None # shown while the AI is thinking
+        # background generator of no-guess boards; started now so boards are ready by the first click
+        self.board_pool = NoGuessPool() if no_guess else None
 
         # calls the get mine count upon initialization to prompt user for mine count
         self.getMineCount()
         self.getAIDifficulty()
 
-    # renders board as grid of buttons based on length 10
+    # renders board as grid of buttons (or one canvas) based on grid_size
     def renderBoard(self):
         if (self.ai_active): # if playing against the ai, show both the timer and turns
             # show timer
@@ -75,29 +113,40 @@ class GameGUI:
             # show timer
             self.timer_label.grid(row=0, column=0,columnspan=10, pady=5, sticky="n") # stretch it across all 10 columns, center it, and pad it
 
+        self.cell_font = tkfont.Font(root=self.root, family='Arial', size=10)
+        if self.renderer == "canvas":
+            # the canvas hit-tests clicks itself and asks cellStyle how each visible cell looks
+            self.canvas_board = CanvasBoard(self.root, self.grid_size, self.reveal, self.cellStyle,
+                                            font=self.cell_font)
+            self.canvas_board.frame.grid(row=1, column=0, columnspan=10, rowspan=len(self.board))
+            return
+
         for y in range(len(self.board)):
             for x in range(len(self.board)):
-                button = tk.Button(self.root, text=' ', width=4, height=2, font=('Arial', 10), command=lambda y=y, x=x: self.reveal(y,x))
+                button = tk.Button(self.root, text=' ', width=4, height=2, font=self.cell_font, command=lambda y=y, x=x: self.reveal(y,x))
                 button.grid(row=(y+1), column=(x+1))
                 self.buttons[y][x] = button
 
     # loops GUI to maintain display 
     def run(self):
         self.root.mainloop()
+        if self.board_pool is not None:
+            self.board_pool.close()
 
     # adds graphic to cell depending on status
     def renderCell(self, row:int, col:int, flag:bool):
         cell = self.board[row][col]
         # handles if cell is a flag cell
         if flag:
-            self.buttons[row][col].config(text='🚩',bg="yellow", font=('Arial', 10))
+            self.paintCell(row, col, '🚩', "yellow")
         # mine cell handling - show mine if it was revealed OR if game is over
         elif cell.has_mine and (cell.is_revealed or self.game.is_game_over):
             
             # stop the timer
             self.stop_timer()
 
-            self.buttons[row][col].config(text='*', bg='red', font=('Arial', 10)) # show the mine
+            self.exploded = (row, col) # the canvas renderer shows only this mine
+            self.paintCell(row, col, '*', 'red') # show the mine
             if (not self.ai_turn): # if the player revealed the bomb, show loss message
                 self.updateStatus("Game Over")
                 messagebox.showinfo("Game Over", "You have hit a mine\n\nYour final time was: "+str(self.final_time)+" second(s)")
@@ -108,10 +157,47 @@ class GameGUI:
         # revealed neighbor handling
         elif cell.is_revealed:
             # Show the neighbor count including zero
-            self.buttons[row][col].config(text=str(cell.neighbor_count), bg='lightgray', font=('Arial', 10))
+            self.paintCell(row, col, str(cell.neighbor_count), 'lightgray')
         # return to covered state if not flagged and not revealed
         else:
-            self.buttons[row][col].config(text=' ', bg='SystemButtonFace',font=('Arial',10))
+            self.paintCell(row, col, ' ', 'SystemButtonFace')
+
+    # queues the given look for the cell; repeated updates to a cell before the next flush collapse into one
+    def paintCell(self, row: int, col: int, text: str, bg: str):
+        self.pending[(row, col)] = (text, bg)
+        if self.flush_id is None:
+            self.flush_id = self.root.after_idle(self.flushCells)
+
+    # repaints queued cells whose look changed (at most FLUSH_BUDGET per call, the rest on the next frame);
+    # the canvas renderer redraws queued cells from cellStyle and skips the ones it already shows
+    def flushCells(self):
+        self.flush_id = None
+        pending, shown = self.pending, self.shown
+        for _ in range(min(len(pending), FLUSH_BUDGET)):
+            (row, col), look = pending.popitem()
+            if self.canvas_board is not None:
+                self.canvas_board.draw(row, col)
+            elif shown.get((row, col)) != look:
+                self.buttons[row][col].config(text=look[0], bg=look[1])
+                shown[(row, col)] = look
+        if pending:
+            self.flush_id = self.root.after(1, self.flushCells)
+
+    # (text, fill colour) of a cell for the canvas renderer, following the same rules as renderCell
+    def cellStyle(self, row: int, col: int):
+        cell = self.board[row][col]
+        if cell.has_flag:
+            return '🚩', "yellow"
+        if cell.has_mine and (row, col) == self.exploded:
+            return '*', 'red'
+        if cell.is_revealed:
+            return str(cell.neighbor_count), 'lightgray'
+        return '', COVERED
+
+    # allowed mine counts: 10-20 on the standard 10x10 board, the same 10%-20% density on other sizes
+    def mineRange(self):
+        cells = self.grid_size * self.grid_size
+        return max(1, round(cells * 0.10)), max(1, min(round(cells * 0.20), cells - 9))
 
     # creates initial frame for user input of mines
     def getMineCount(self):
@@ -132,6 +218,9 @@ class GameGUI:
 
     # reveals selected cell or adds flag if in flag mode, also handles win/loss functionality
     def reveal(self, row: int, col: int):
+        # the board must not change while the AI is deciding its move
+        if self.thinking:
+            return
         if self.flag_mode:
             self.addFlag(row, col)
             return
@@ -141,11 +230,26 @@ class GameGUI:
             self.start_timer()
 
         # reveal the cell in GameLogic (if it is the first click, this will set is_first_click to False)
-        revealed_cells = self.game.reveal_cell(row, col) # returns a list of the cells that were revealed by this call (empty list if nothing was revealed -- ex. clicking on a flagged cell)
+        revealed_cells = self.game.reveal_cell(row, col, self.actor()) # returns a list of the cells that were revealed by this call (empty list if nothing was revealed -- ex. clicking on a flagged cell)
         for r, c in revealed_cells:
             self.renderCell(r, c, False)
         
-        # check if the board was completed -- game over
+        self.checkBoardComplete()
+        
+        # if...
+        #   1. the game is not over
+        #   2. the ai solver is on
+        #   3. cells were revealed (i.e. the player did not just click on a flagged cell)
+        # then control is passed to the ai solver...
+        if (not self.game.is_game_over) and (self.ai_active) and (revealed_cells): 
+            self.ai_active = False # this is making it so that this section only runs after the players turn
+            self.startAITurn() # the ai decides in the background; pollAI makes its moves
+            return
+
+        if (self.ai_diff != "None"): self.ai_active = True # if it is in two-player mode, make sure to change ai_active back to True
+
+    # check if the board was completed -- game over
+    def checkBoardComplete(self):
         if self.game.revealed_safe_cells == self.game.total_safe_cells:
             # stop timer
             self.stop_timer()
@@ -158,23 +262,47 @@ class GameGUI:
                 # indicate victory
                 messagebox.showinfo("Victory!", "You revealed all safe cells. You win!\n\nYour final time was: "+str(self.final_time)+" second(s)")
                 self.updateStatus("Winner")
-        
-        # if...
-        #   1. the game is not over
-        #   2. the ai solver is on
-        #   3. cells were revealed (i.e. the player did not just click on a flagged cell)
-        # then control is passed to the ai solver...
-        if (not self.game.is_game_over) and (self.ai_active) and (revealed_cells): 
-            self.ai_active = False # this is making it so that this section only runs after the players turn
-            
-            self.ai_turn = True # indicate that it is the ai solver taking its turn
-            self.ai.play_turn(self.reveal, self.setFlag) # the ai makes its decision
-            if (not self.game.is_game_over): # if the game is not over after the ai solver's turn -- increment the turn counter
-                self.turn += 1
-                self.update_turn(self.turn)
-            self.ai_turn = False # indicate that it is no longer the ai solver taking its turn
 
-        if (self.ai_diff != "None"): self.ai_active = True # if it is in two-player mode, make sure to change ai_active back to True
+    # hands the decision to the worker thread, locks the board and shows the thinking state
+    def startAITurn(self):
+        self.thinking = True
+        self.updateStatus("AI thinking...")
+        self.cancel_button.grid(row=len(self.board)+3, column=0, columnspan=len(self.board), pady=5)
+        self.ai_worker.start()
+        self.root.after(AI_POLL_MS, self.pollAI)
+
+    # checks for the AI's decision; once it is in, GameLogic makes the moves here on the Tk thread
+    # and the cells they changed are redrawn (no trip through the click handler)
+    def pollAI(self):
+        result = self.ai_worker.poll()
+        if result is None:
+            self.root.after(AI_POLL_MS, self.pollAI)
+            return
+        moves, cancelled = result
+        self.thinking = False
+        self.cancel_button.grid_remove()
+        self.ai_active = True
+        if cancelled:
+            self.updateStatus("AI turn cancelled")
+            return
+        self.updateStatus("Mode: " + ("Flag" if self.flag_mode else "Reveal"))
+
+        self.ai_turn = True # indicate that it is the ai solver taking its turn
+        n = self.grid_size
+        for i in self.game.apply_moves(moves, AI):
+            row, col = divmod(i, n)
+            self.renderCell(row, col, self.board[row][col].has_flag)
+        self.checkBoardComplete()
+        if (not self.game.is_game_over): # if the game is not over after the ai solver's turn -- increment the turn counter
+            self.turn += 1
+            self.update_turn(self.turn)
+        self.ai_turn = False # indicate that it is no longer the ai solver taking its turn
+
+    # asks the thinking AI to give up its turn (the board unlocks once the worker has stopped)
+    def cancelAI(self):
+        if self.thinking:
+            self.ai_worker.cancel()
+            self.updateStatus("Cancelling AI...")
 
     # validates input to mine count and begins building board and initializing game
     def startGame(self):
@@ -183,22 +311,36 @@ class GameGUI:
         except ValueError:
             messagebox.showerror("Invalid Input", "Mine Count must be entered as a number.")
             return
-        if self.mine_count < 10 or self.mine_count > 20:
-            messagebox.showwarning("Invalid number of mines!", "Please enter a number between 10 and 20")
+        low, high = self.mineRange()
+        if self.mine_count < low or self.mine_count > high:
+            messagebox.showwarning("Invalid number of mines!", f"Please enter a number between {low} and {high}")
             return
 
-        self.board_manager = BoardManager(grid_size=10, mine_count=self.mine_count)
-        self.game = GameLogic(board_mgr=self.board_manager)
+        # large canvas boards also use the compact one-byte-per-cell storage and only
+        # count the neighbors of cells that get looked at
+        large = self.renderer == "canvas"
+        self.board_manager = BoardManager(grid_size=self.grid_size, mine_count=self.mine_count,
+                                          compact=large, lazy_counts=large)
+        # with no-guess boards on, the first click takes a pre-generated board for that cell if one is ready
+        board_source = None
+        if self.board_pool is not None:
+            self.board_pool.prefetch(self.grid_size, self.mine_count)
+            board_source = self.board_pool.take
+        self.game = GameLogic(board_mgr=self.board_manager, board_source=board_source)
         
         self.ai_diff = self.AI_diff_choice.get() # retrieve the ai difficulty value (string) from the dropdown
         self.game.AI_diff = self.ai_diff # share the string to the GameLogic
         # if the player wants to play against the ai (i.e. they did not select "None"), initialize the AI Solver and set ai_active to True
         if self.ai_diff != "None":
             self.ai_active = True
-            self.ai = AISolver(self.ai_diff, self.board_manager)
+            self.ai = AISolver(self.ai_diff, self.board_manager, self.game)
+            self.ai_worker = AIWorker(self.ai)
+            self.cancel_button = tk.Button(self.root, text="Cancel AI turn", command=self.cancelAI)
+            self.root.bind("<Escape>", lambda event: self.cancelAI())
 
         self.board = self.board_manager.grid
-        self.buttons = [[None for _ in range(len(self.board))] for _ in range(len(self.board))]
+        if self.renderer == "buttons":
+            self.buttons = [[None for _ in range(len(self.board))] for _ in range(len(self.board))]
         # destroys unnecessary components to render board
         self.label.destroy()
         self.mine_entry.destroy()
@@ -206,6 +348,16 @@ class GameGUI:
         self.renderBoard()
         flag_toggle = tk.Button(self.root, text="Toggle Flag Mode", command=self.toggleFlag)
         flag_toggle.grid(row=len(self.board)+1, column=0,columnspan=len(self.board),pady=10) # Added +1 to the row so its not overlapping with the board
+        hint = tk.Button(self.root, text="Hint", command=self.showHint)
+        hint.grid(row=len(self.board)+2, column=0, columnspan=len(self.board), pady=5)
+        # undo/redo in single-player games (Ctrl+Z / Ctrl+Y)
+        if self.ai_diff == "None":
+            undo = tk.Button(self.root, text="Undo", command=self.undoMove)
+            undo.grid(row=len(self.board)+3, column=0, columnspan=len(self.board) // 2, pady=5)
+            redo = tk.Button(self.root, text="Redo", command=self.redoMove)
+            redo.grid(row=len(self.board)+3, column=len(self.board) // 2, columnspan=len(self.board) // 2, pady=5)
+            self.root.bind("<Control-z>", lambda event: self.undoMove())
+            self.root.bind("<Control-y>", lambda event: self.redoMove())
         # Button for testing easy AI difficulty
         # easy = tk.Button(self.root, text="Easy AI Test", command=self.easy)
         # easy.grid(row=len(self.board)+2,column=0, columnspan=3)
@@ -229,6 +381,42 @@ class GameGUI:
         self.game.hard(self.reveal, self.setFlag)
 
 
+    # takes back the last move and repaints only the cells it changed; undoing the losing click resumes the timer
+    def undoMove(self):
+        was_over = self.game.is_game_over
+        changed = self.game.undo(PLAYER)
+        if not changed:
+            return
+        if was_over and not self.game.is_game_over:
+            self.exploded = None
+            self.running = True
+            self.update_timer()
+        n = self.grid_size
+        for i in changed:
+            row, col = divmod(i, n)
+            self.renderCell(row, col, self.board_manager.flags[i])
+        self.updateStatus("Move undone")
+
+    # makes the last undone move again (a redone losing click ends the game as before)
+    def redoMove(self):
+        changed = self.game.redo(PLAYER)
+        n = self.grid_size
+        for i in changed:
+            row, col = divmod(i, n)
+            self.renderCell(row, col, self.board_manager.flags[i])
+        if changed:
+            self.checkBoardComplete()
+
+    # shows the covered cell least likely to hold a mine, with its exact probability
+    def showHint(self):
+        if self.game.is_game_over:
+            return
+        if self.game.is_first_click:
+            messagebox.showinfo("Hint", "Your first click is always safe.")
+            return
+        (row, col), chance = self.game.mine_probabilities().best_guess()
+        messagebox.showinfo("Hint", f"Safest cell: row {row+1}, column {col+1}\n\nChance of a mine: {chance:.0%}")
+
     # sets flag mode to be the given value
     def setFlag(self, value): # This function is mainly for the AI to be able to place flags
         cur_flag_state = self.flag_mode
@@ -241,10 +429,14 @@ class GameGUI:
         mode = "Flag" if self.flag_mode else "Reveal"
         self.updateStatus(f"Mode: {mode}")
 
+    # who is making the current move, for the game's move log
+    def actor(self) -> int:
+        return AI if self.ai_turn else PLAYER
+
     # adds flags to cells, and prints warning if out of flags
     def addFlag(self, row, col):
         # Ask game logic to toggle the flag state; it enforces rules
-        result = self.game.toggle_flag(row, col)
+        result = self.game.toggle_flag(row, col, self.actor())
         cell = self.board_manager.get_cell(row, col)
         # If no change occurred, warn only when trying to place a new flag but at limit
         if result == 0:
@@ -0,0 +1,76 @@
+"""
+File: ai_worker.py
+Module: AIWorker
+Purpose:
+    Runs the AI solver's decision step (AISolver.decide) on a background
+    thread so the Tk window stays responsive while the solver thinks. The
+    chosen moves come back through a queue that the GUI polls from its own
+    loop (root.after) and applies on the Tk thread. The worker thread only
+    calls the solver, which never imports or touches tkinter.
+
+Inputs:
+    solver: AISolver
+    start() to begin a turn, cancel() to abandon it
+
+Outputs:
+    poll() -> None while thinking, else (moves, cancelled)
+        moves: list of move_log.Move from AISolver.decide
+        cancelled: True if cancel() was called; the moves are then to be dropped
+
+Notes:
+    The game must not change while a turn is being decided (the GUI locks
+    board input until poll() returns a result). Cancellation is cooperative:
+    the solver checks the event between steps, and poll() only reports the
+    cancelled turn once the thread has actually stopped reading the board.
+
+Created: 2026-10-17
+"""
+
+import queue
+import threading
+
+
+class AIWorker:
+    def __init__(self, solver):
+        self.solver = solver
+        self.results = queue.Queue()
+        self.thread = None
+        self.cancel_event = None
+
+    # True from start() until poll() hands back that turn's result
+    @property
+    def busy(self) -> bool:
+        return self.thread is not None
+
+    def start(self):
+        if self.busy:
+            raise RuntimeError("the AI is already deciding a turn")
+        cancel = threading.Event()
+        self.cancel_event = cancel
+        self.thread = threading.Thread(target=self._run, args=(cancel,), name="ai-solver", daemon=True)
+        self.thread.start()
+
+    # worker thread: decide and post the result (or the error) to the queue, nothing else
+    def _run(self, cancel):
+        try:
+            self.results.put((self.solver.decide(cancel), None))
+        except Exception as error:
+            self.results.put(([], error))
+
+    def cancel(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+
+    # Non-blocking check for the turn's result. Re-raises an exception from the solver
+    # unless the turn was cancelled anyway.
+    def poll(self):
+        try:
+            moves, error = self.results.get_nowait()
+        except queue.Empty:
+            return None
+        self.thread.join()
+        self.thread = None
+        cancelled = self.cancel_event.is_set()
+        if error is not None and not cancelled:
+            raise error
+        return (moves if not cancelled else []), cancelled
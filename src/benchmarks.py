@@ -0,0 +1,413 @@
+"""
+File: benchmarks.py
+Module: benchmarks
+Purpose:
+    Command-line timing and memory comparisons for the board model.
+    Nothing here imports tkinter; run it directly from the src directory.
+
+Inputs:
+    Command line: python3 benchmarks.py storage [--sizes 100 500 1000] [--repeat 3]
+                  python3 benchmarks.py counts [--sizes ...] [--density 0.15] [--compact]
+                  python3 benchmarks.py placement [--sizes 100 1000 3000] [--densities 0.001 0.15] [--repeat 3]
+                  python3 benchmarks.py firstclick [--sizes 500 1000 2000] [--density 0.15] [--seed 0] [--repeat 3]
+                  python3 benchmarks.py snapshot [--sizes 1000 2000 4000] [--density 0.15] [--repeat 3]
+                  python3 benchmarks.py chunked [--density 0.15] [--clicks 1000] [--seed 0] [--cache 1024]
+                  python3 benchmarks.py suite [--sizes 10 100 500 2000] [--densities 0.1 0.15 0.2]
+                                              [--layout cells|compact|lazy] [--seed 0] [--repeat 3]
+                                              [--out results.json] [--baseline baseline.json] [--threshold 0.25]
+
+Outputs:
+    A plain-text table printed to stdout. suite also writes its timings as
+    JSON (--out) and, given a --baseline file written the same way, marks
+    every operation more than --threshold slower than the baseline and
+    exits with status 1.
+
+Created: 2026-10-17
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from AI_Solver import AISolver
+from board_manager import BoardManager
+from chunked_board import ChunkedGame
+from game_logic import GameLogic
+from snapshot import load_snapshot, save_snapshot
+
+
+# Return the best (minimum) wall time in seconds of `repeat` calls to fn.
+def best_time(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Return the bytes still allocated by the object fn() builds (traced separately
+# from timing, since tracemalloc slows allocation down considerably).
+def retained_bytes(fn: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+# Compare the Cell-object layout against compact storage planes:
+# retained memory, construction time and reset time per board size.
+def bench_storage(sizes: List[int], repeat: int):
+    print(f"{'size':>6} {'layout':>8} {'memory MB':>10} {'init s':>9} {'reset s':>9}")
+    for size in sizes:
+        for compact in (False, True):
+            layout = "compact" if compact else "cells"
+            build = lambda: BoardManager(size, 0, compact=compact)
+            memory = retained_bytes(build) / (1024 * 1024)
+            init_s = best_time(build, repeat)
+            board = build()
+            reset_s = best_time(lambda: board.reset(0), repeat)
+            del board
+            print(f"{size:>6} {layout:>8} {memory:>10.2f} {init_s:>9.4f} {reset_s:>9.4f}")
+
+
+# Legacy neighbor counting: one count_adjacent_mines() call per cell.
+def per_cell_counts(board: BoardManager):
+    n = board.grid_size
+    for r in range(n):
+        for c in range(n):
+            board.counts[r * n + c] = board.count_adjacent_mines(r, c)
+
+
+# Compare per-cell neighbor counting against the batched compute_adjacent_mines(),
+# plus the cost of one incremental add_mine()/remove_mine() pair.
+def bench_counts(sizes: List[int], density: float, compact: bool, repeat: int):
+    print(f"{'size':>6} {'per-cell s':>11} {'batched s':>10} {'speedup':>8} {'add+remove us':>14}")
+    for size in sizes:
+        board = BoardManager(size, int(size * size * density), compact=compact)
+        board.place_mines(size // 2, size // 2)
+        slow = best_time(lambda: per_cell_counts(board), repeat)
+        fast = best_time(board.compute_adjacent_mines, repeat)
+        # time the incremental path on a cell that does not already hold a mine
+        r, c = divmod(random.choice([i for i in range(size * size) if not board.mines[i]]), size)
+        toggle = best_time(lambda: (board.add_mine(r, c), board.remove_mine(r, c)), repeat)
+        print(f"{size:>6} {slow:>11.4f} {fast:>10.4f} {slow / fast:>7.1f}x {toggle * 1e6:>14.1f}")
+
+
+# Legacy mine placement: list every candidate coordinate, then sample from the list.
+def list_placement(board: BoardManager, safe_row: int, safe_col: int):
+    n = board.grid_size
+    safe_zone = set(board.neighbors(safe_row, safe_col))
+    safe_zone.add((safe_row, safe_col))
+    all_coords = [(r, c) for r in range(n) for c in range(n) if (r, c) not in safe_zone]
+    for r, c in board.rng.sample(all_coords, board.mine_count):
+        board.mines[r * n + c] = True
+
+
+# Compare the legacy coordinate-list placement with place_mines()' index sampling, per board
+# size and mine density. Neighbor counting is left out of both (lazy counts), as is construction.
+def bench_placement(sizes: List[int], densities: List[float], repeat: int):
+    print(f"{'size':>6} {'density':>8} {'mines':>9} {'list s':>9} {'sampled s':>10} {'speedup':>8}")
+    for size in sizes:
+        for density in densities:
+            mines = int(size * size * density)
+            board = BoardManager(size, mines, compact=True, lazy_counts=True)
+            center = size // 2
+            legacy = best_time(lambda: list_placement(board, center, center), repeat)
+            sampled = best_time(lambda: board.place_mines(center, center), repeat)
+            print(f"{size:>6} {density:>8} {mines:>9} {legacy:>9.4f} {sampled:>10.4f} "
+                  f"{legacy / sampled:>7.1f}x")
+
+
+# Time the first click (mine placement plus the opening cascade) on a compact board with
+# eager neighbor counts against one with lazy counts; board construction is not timed.
+def bench_first_click(sizes: List[int], density: float, seed: int, repeat: int):
+    print(f"{'size':>6} {'eager s':>9} {'lazy s':>9} {'speedup':>8} {'revealed':>9}")
+    for size in sizes:
+        mines = int(size * size * density)
+        times = {}
+        for lazy in (False, True):
+            best = float("inf")
+            for _ in range(repeat):
+                game = GameLogic(BoardManager(size, mines, compact=True, seed=seed, lazy_counts=lazy))
+                gc.collect()
+                start = time.perf_counter()
+                game.reveal_cell_ids(size // 2, size // 2)
+                best = min(best, time.perf_counter() - start)
+            times[lazy] = best
+        print(f"{size:>6} {times[False]:>9.4f} {times[True]:>9.4f} {times[False] / times[True]:>7.1f}x "
+              f"{game.revealed_safe_cells:>9}")
+
+
+# Snapshot a compact board after its first click: full save, an incremental save after a
+# few more reveals (only the changed tiles are appended), file size and load time.
+def bench_snapshot(sizes: List[int], density: float, repeat: int):
+    print(f"{'size':>6} {'cells':>10} {'file KB':>9} {'save s':>8} {'tiles':>9} {'append s':>9} {'load s':>8}")
+    rng = random.Random(0)
+    path = os.path.join(tempfile.mkdtemp(), "board.snap")
+    for size in sizes:
+        game = GameLogic(BoardManager(size, int(size * size * density), compact=True, lazy_counts=True))
+        game.reveal_cell_ids(size // 2, size // 2)
+        save_s = best_time(lambda: save_snapshot(path, game).close(), repeat)
+        writer = save_snapshot(path, game)
+        for _ in range(20):
+            game.reveal_cell_ids(*game.board_mgr.random_untouched(rng))
+            if game.is_game_over:
+                break
+        start = time.perf_counter()
+        appended = writer.save()
+        append_s = time.perf_counter() - start
+        writer.close()
+        load_s = best_time(lambda: load_snapshot(path), repeat)
+        tiles = -(-size * size // writer.tile_cells)
+        print(f"{size:>6} {size * size:>10} {os.path.getsize(path) / 1024:>9.0f} {save_s:>8.4f} "
+              f"{f'{appended}/{tiles}':>9} {append_s:>9.4f} {load_s:>8.4f}")
+    os.remove(path)
+
+
+# Explore an unbounded board with `clicks` reveals of safe covered cells near the explored
+# area, reporting revealed cells, chunks held and memory as the explored area grows.
+def bench_chunked(density: float, clicks: int, seed: int, cache_chunks: int):
+    print(f"{'clicks':>7} {'revealed':>9} {'player chunks':>14} {'cached':>7} {'generated':>10} "
+          f"{'memory MB':>10} {'s':>8}")
+    rng = random.Random(seed)
+    tracemalloc.start()
+    game = ChunkedGame(density, seed, cache_chunks=cache_chunks)
+    board = game.board
+    start = time.perf_counter()
+    game.reveal_cell(0, 0)
+    report = 1
+    radius = board.chunk_size
+    for click in range(1, clicks + 1):
+        # a few tries at a covered, safe cell within `radius` of the origin; the radius grows
+        # with the square root of the clicks, like an area explored outwards from the start
+        for _ in range(50):
+            r, c = rng.randint(-radius, radius), rng.randint(-radius, radius)
+            if not board.is_revealed(r, c) and not board.is_mine(r, c):
+                game.reveal_cell(r, c)
+                break
+        radius = board.chunk_size * (1 + int(click ** 0.5) // 4)
+        if click == report or click == clicks:
+            stats = board.stats()
+            memory = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+            print(f"{click:>7} {game.revealed_safe_cells:>9} {stats['player_chunks']:>14} "
+                  f"{stats['mine_chunks_cached']:>7} {stats['chunks_generated']:>10} {memory:>10.2f} "
+                  f"{time.perf_counter() - start:>8.3f}")
+            report *= 4
+    tracemalloc.stop()
+
+
+# Seconds per fn(state) call, best of `repeat`. Each timed batch runs fn on states built
+# untimed by setup(); calls that take under min_time are batched up (up to 1000 at a time)
+# so that one timing spans at least min_time, as long as building the batch's states stays
+# within setup_budget seconds (so a batch never holds many large boards at once; shared
+# states from built_once cost nothing to hand out again).
+def per_call_time(setup: Callable[[], object], fn: Callable[[object], object], repeat: int,
+                  min_time: float = 0.005, setup_budget: float = 0.05) -> float:
+    def batch(number):
+        start = time.perf_counter()
+        states = [setup() for _ in range(number)]
+        built = time.perf_counter() - start
+        gc.collect()
+        start = time.perf_counter()
+        # results are kept until the clock stops, so freeing them is not timed
+        results = [fn(state) for state in states]
+        elapsed = time.perf_counter() - start
+        del results
+        return elapsed / number, built / number
+
+    first, setup_time = batch(1)
+    if getattr(setup, "shared", False):
+        setup_time = 0.0
+    number = max(1, min(1000, int(min_time / max(first, 1e-9)), int(setup_budget / max(setup_time, 1e-9))))
+    best = first if number == 1 else float("inf")
+    for _ in range(repeat):
+        best = min(best, batch(number)[0])
+    return best
+
+
+SUITE_LAYOUTS = {"cells": {}, "compact": {"compact": True}, "lazy": {"compact": True, "lazy_counts": True}}
+
+
+# Setup that builds its state on the first call and hands the same object back afterwards.
+# Marked `shared`, so per_call_time does not hold its one slow build against batching.
+def built_once(build: Callable[[], object]) -> Callable[[], object]:
+    state = []
+
+    def setup():
+        if not state:
+            state.append(build())
+        return state[0]
+    setup.shared = True
+    return setup
+
+
+# The core operations timed by `suite`, as (name, setup, fn) for one board configuration.
+# Every setup builds what the operation needs (a board with mines, a game after its first
+# click, ...) outside the timing; operations that change their state get a fresh one per call,
+# read-only ones share one. Cases are generated one at a time so that only one case's boards
+# are alive at once (a 2000x2000 board of Cell objects takes gigabytes).
+def suite_cases(size: int, mines: int, layout: dict, seed: int):
+    center = size // 2
+    cell = center * size + center
+
+    def fresh(**options):
+        return BoardManager(size, mines, seed=seed, **{**layout, **options})
+
+    def placed():
+        board = fresh()
+        board.place_mines(center, center)
+        return board
+
+    def opened():
+        game = GameLogic(fresh())
+        game.reveal_cell_ids(center, center)
+        return game
+
+    def flood_ready():
+        game = GameLogic(placed())
+        game.is_first_click = False
+        return game
+
+    yield "BoardManager.__init__", lambda: None, lambda _: fresh()
+    yield "BoardManager.reset", built_once(fresh), lambda board: board.reset(mines, seed)
+    # placement alone: lazy counts keep compute_adjacent_mines out of it
+    yield ("BoardManager.place_mines", lambda: fresh(lazy_counts=True),
+           lambda board: board.place_mines(center, center))
+    yield "BoardManager.compute_adjacent_mines", built_once(placed), lambda board: board.compute_adjacent_mines()
+    yield "BoardManager.neighbors", built_once(fresh), lambda board: board.neighbors(center, center)
+    yield ("BoardManager.untouched_cells", built_once(lambda: opened().board_mgr),
+           lambda board: board.untouched_cells())
+    yield "GameLogic._flood_reveal", flood_ready, lambda game: game._flood_reveal(cell)
+    yield "GameLogic._all_mines_flagged", built_once(opened), lambda game: game._all_mines_flagged()
+    for difficulty in ("Easy", "Medium", "Hard"):
+        def solver(difficulty=difficulty):
+            game = opened()
+            return AISolver(difficulty, game.board_mgr, game, seed=seed)
+        # a fresh solver and game per turn: decide() updates the frontier's bookkeeping
+        yield f"AISolver.{difficulty.lower()} turn", solver, lambda ai: ai.decide()
+
+
+# Time every core operation at every size and density, print the table and return the results
+# as JSON-ready rows. With a baseline (a previous suite --out file), each row also shows the
+# change against it and rows slower by more than `threshold` are flagged.
+def bench_suite(sizes: List[int], densities: List[float], layout: str, seed: int, repeat: int,
+                baseline: dict = None, threshold: float = 0.25) -> List[dict]:
+    before = {}
+    if baseline is not None:
+        if baseline.get("layout") != layout:
+            print(f"warning: baseline was taken with layout {baseline.get('layout')!r}, not {layout!r}")
+        before = {(row["op"], row["size"], row["density"]): row["seconds"] for row in baseline["results"]}
+    print(f"{'operation':<36} {'size':>5} {'density':>8} {'mines':>8} {'us':>12} {'baseline us':>12} {'change':>8}")
+    rows = []
+    for size in sizes:
+        for density in densities:
+            mines = max(0, min(int(size * size * density), size * size - 9))
+            for op, setup, fn in suite_cases(size, mines, SUITE_LAYOUTS[layout], seed):
+                seconds = per_call_time(setup, fn, repeat)
+                row = {"op": op, "size": size, "density": density, "mines": mines, "seconds": seconds}
+                line = f"{op:<36} {size:>5} {density:>8} {mines:>8} {seconds * 1e6:>12.2f}"
+                old = before.get((op, size, density))
+                if old:
+                    row["change"] = seconds / old - 1
+                    row["regressed"] = row["change"] > threshold
+                    line += f" {old * 1e6:>12.2f} {row['change'] * 100:>+7.1f}%"
+                    if row["regressed"]:
+                        line += "  REGRESSION"
+                print(line)
+                rows.append(row)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Minesweeper core benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    storage = sub.add_parser("storage", help="Cell objects vs compact planes")
+    storage.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000])
+    storage.add_argument("--repeat", type=int, default=3)
+
+    counts = sub.add_parser("counts", help="per-cell vs batched neighbor counts")
+    counts.add_argument("--sizes", type=int, nargs="+", default=[100, 500])
+    counts.add_argument("--density", type=float, default=0.15)
+    counts.add_argument("--compact", action="store_true")
+    counts.add_argument("--repeat", type=int, default=3)
+
+    placement = sub.add_parser("placement", help="coordinate-list vs index-sampled mine placement")
+    placement.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 3000])
+    placement.add_argument("--densities", type=float, nargs="+", default=[0.001, 0.15])
+    placement.add_argument("--repeat", type=int, default=3)
+
+    first = sub.add_parser("firstclick", help="first-click cost with eager vs lazy neighbor counts")
+    first.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000])
+    first.add_argument("--density", type=float, default=0.15)
+    first.add_argument("--seed", type=int, default=0)
+    first.add_argument("--repeat", type=int, default=3)
+
+    snap = sub.add_parser("snapshot", help="bit-packed snapshot save, append and load times")
+    snap.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000])
+    snap.add_argument("--density", type=float, default=0.15)
+    snap.add_argument("--repeat", type=int, default=3)
+
+    chunked = sub.add_parser("chunked", help="memory of an unbounded board as it is explored")
+    chunked.add_argument("--density", type=float, default=0.15)
+    chunked.add_argument("--clicks", type=int, default=1000)
+    chunked.add_argument("--seed", type=int, default=0)
+    chunked.add_argument("--cache", type=int, default=1024, help="hot chunks kept in the LRU")
+
+    suite = sub.add_parser("suite", help="core operations across sizes and densities, with a JSON baseline")
+    suite.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    suite.add_argument("--densities", type=float, nargs="+", default=[0.1, 0.15, 0.2])
+    suite.add_argument("--layout", choices=sorted(SUITE_LAYOUTS), default="cells",
+                       help="Cell objects, compact planes, or compact planes with lazy counts")
+    suite.add_argument("--seed", type=int, default=0)
+    suite.add_argument("--repeat", type=int, default=3)
+    suite.add_argument("--out", help="write the results here as JSON")
+    suite.add_argument("--baseline", help="results JSON of an earlier run to compare against")
+    suite.add_argument("--threshold", type=float, default=0.25,
+                       help="slowdown over the baseline counted as a regression (0.25 = 25%%)")
+
+    args = parser.parse_args(argv)
+    if args.command == "storage":
+        bench_storage(args.sizes, args.repeat)
+    elif args.command == "counts":
+        bench_counts(args.sizes, args.density, args.compact, args.repeat)
+    elif args.command == "placement":
+        bench_placement(args.sizes, args.densities, args.repeat)
+    elif args.command == "firstclick":
+        bench_first_click(args.sizes, args.density, args.seed, args.repeat)
+    elif args.command == "snapshot":
+        bench_snapshot(args.sizes, args.density, args.repeat)
+    elif args.command == "chunked":
+        bench_chunked(args.density, args.clicks, args.seed, args.cache)
+    elif args.command == "suite":
+        baseline = None
+        if args.baseline:
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        rows = bench_suite(args.sizes, args.densities, args.layout, args.seed, args.repeat,
+                           baseline, args.threshold)
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump({"layout": args.layout, "seed": args.seed, "repeat": args.repeat,
+                           "python": platform.python_version(), "machine": platform.machine(),
+                           "results": rows}, f, indent=1)
+        if any(row.get("regressed") for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,33 @@ Purpose:
     place mines after the first click with a safe zone, and maintain neighbor counts.
     UI-agnostic; used by higher-level game logic.
 
+    Cells are stored either as a grid of Cell objects (default) or, with
+    compact=True, as flat one-byte-per-cell planes read through CellView.
+    With lazy_counts=True, place_mines() does not count neighbors up front;
+    each cell's count is worked out the first time it is read and kept.
+
 Inputs:
     grid_size: int (>0)
     mine_count: int (0..grid_size^2)
+    compact: bool (optional, default False)
+    seed: int (optional; drawn at random when omitted, kept in .seed)
+    lazy_counts: bool (optional, default False; neighbor counts computed on first read)
     place_mines(safe_row: int, safe_col: int)
+    place_mine_ids(mine_ids) (a given layout of linear ids instead of a random one)
 
 Outputs:
-    get_cell(row, col) -> Cell
+    get_cell(row, col) -> Cell (CellView on compact boards)
+    untouched_cells() -> list[tuple[int, int]], random_untouched() -> tuple[int, int]
+    covered -> CoveredIndex of unrevealed, unflagged linear cell ids
+    mines / flags / revealed / counts -> flat planes indexed by row * grid_size + col
     neighbors(row, col) -> list[tuple[int, int]]
+    neighbor_ids(index) -> list of linear neighbor ids (worked out from row/col)
+    cell_id(row, col) -> linear id, position(index) -> (row, col)
     count_adjacent_mines(row, col) -> int
     compute_adjacent_mines() -> None
-    reset(mine_count) -> None
+    add_mine(row, col) / remove_mine(row, col) -> None (incremental count update;
+        board edits only: a GameLogic playing this board keeps its own totals)
+    reset(mine_count, seed=None) -> None
 
 Errors:
     ValueError for invalid sizes or unsafe mine_count
@@ -27,107 +43,377 @@ Created Date: 2025-09-17
 
 """
 
+from array import array
+from operator import attrgetter
 from typing import List, Tuple
-from cell import Cell
+from cell import Cell, CellView
+from covered_index import CoveredIndex
 import random
 
+
+# Flat, index-addressable view over one Cell attribute across an object-mode
+# board, so code written against the storage planes works for both modes.
+class _CellPlane:
+    __slots__ = ("_cells", "_attr", "_get")
+
+    def __init__(self, cells: List[Cell], attr: str):
+        self._cells = cells
+        self._attr = attr
+        self._get = attrgetter(attr)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __getitem__(self, index):
+        if index.__class__ is slice:
+            return list(map(self._get, self._cells[index]))
+        return self._get(self._cells[index])
+
+    def __setitem__(self, index, value):
+        if index.__class__ is slice:
+            for cell, v in zip(self._cells[index], value):
+                setattr(cell, self._attr, v)
+        else:
+            setattr(self._cells[index], self._attr, value)
+
+
+# Neighbor-count plane that fills itself in on demand. Every cell starts at the
+# `unknown` sentinel (255 in a bytearray, -1 on Cell objects); the first read of
+# a cell counts the mines around it and stores the result, so only cells that
+# are actually looked at (revealed, flood-filled, read by a solver) are counted.
+class _LazyCounts:
+    __slots__ = ("_board", "_raw", "_unknown", "counted")
+
+    def __init__(self, board, raw, unknown: int):
+        self._board = board
+        self._raw = raw
+        self._unknown = unknown
+        # whether any cell may hold a count (lets forget_all skip a fresh plane)
+        self.counted = False
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if index.__class__ is slice:
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        value = self._raw[index]
+        if value == self._unknown:
+            value = self._resolve(index)
+        return value
+
+    def __setitem__(self, index, value):
+        self._raw[index] = value
+        self.counted = True
+
+    def _resolve(self, index: int) -> int:
+        mines = self._board.mines
+        value = sum(1 for j in self._board.neighbor_ids(index) if mines[j])
+        self._raw[index] = value
+        self.counted = True
+        return value
+
+    # drop one memoized count (its neighborhood's mines changed)
+    def forget(self, index: int):
+        self._raw[index] = self._unknown
+
+    # drop every memoized count; free when nothing has been counted yet
+    def forget_all(self):
+        if self.counted:
+            self._raw[:] = [self._unknown] * len(self._raw)
+            self.counted = False
+
+
+# Cell of an object-mode board with lazy counts. neighbor_count is read through the
+# board's _LazyCounts, so every way of reaching the cell (get_cell, board.grid[r][c],
+# the counts plane) sees a real count, never the sentinel; the memoized value (or -1)
+# lives in _count.
+class _LazyCell(Cell):
+    def __init__(self, board, index: int):
+        self._board = board
+        self._index = index
+        super().__init__()
+        self._count = -1
+
+    @property
+    def neighbor_count(self) -> int:
+        return self._board.counts[self._index]
+
+    @neighbor_count.setter
+    def neighbor_count(self, value: int):
+        self._count = value
+
+
+# Stand-ins for the list-of-lists grid on compact boards: board.grid[r][c]
+# and len(board.grid) keep working, handing out CellViews on demand.
+class _GridRow:
+    __slots__ = ("_board", "_start")
+
+    def __init__(self, board, row: int):
+        self._board = board
+        self._start = row * board.grid_size
+
+    def __len__(self):
+        return self._board.grid_size
+
+    def __getitem__(self, column: int):
+        if not 0 <= column < self._board.grid_size:
+            raise IndexError("column out of range")
+        return CellView(self._board, self._start + column)
+
+    def __iter__(self):
+        for column in range(self._board.grid_size):
+            yield CellView(self._board, self._start + column)
+
+
+class _GridView:
+    __slots__ = ("_board",)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return self._board.grid_size
+
+    def __getitem__(self, row: int):
+        if not 0 <= row < self._board.grid_size:
+            raise IndexError("row out of range")
+        return _GridRow(self._board, row)
+
+    def __iter__(self):
+        for row in range(self._board.grid_size):
+            yield _GridRow(self._board, row)
+
+
 """a square grid of Cell objects. Mines are
     placed after the user’s first click so that the first cell—and its 8
     neighbors are guaranteed safe, also computes per-cell neighbor mine counts."""
 class BoardManager:
     """Inits an empty grid (no mines yet) of size grid_size×grid_size.
-        Mine count is stored for later placement via place_mines()."""
-    def __init__(self, grid_size: int, mine_count: int):
+        Mine count is stored for later placement via place_mines().
+        compact=True stores the board as flat bytearray planes instead of Cell objects.
+        lazy_counts=True leaves neighbor counts to be computed when first read.
+        Mine placement draws from this board's own RNG seeded with `seed`, so the
+        same seed and first click always give the same board."""
+    def __init__(self, grid_size: int, mine_count: int, compact: bool = False, seed: int = None,
+                 lazy_counts: bool = False):
         if grid_size <= 0:
             raise ValueError("grid_size must be positive")
         if mine_count > grid_size * grid_size:
             raise ValueError("mine_count cannot exceed total number of cells")
 
         self.grid_size = grid_size
+        # id offsets of the eight neighbors of an interior cell, in neighbors() order
+        n = grid_size
+        self._steps = (-n - 1, -n, -n + 1, -1, 1, n - 1, n, n + 1)
         self.mine_count = mine_count
+        self.compact = compact
+        self.lazy_counts = lazy_counts
+        self._seed_rng(seed)
         # fresh cells: no mines, neighbor_count = 0
-        self.grid = [[Cell() for _ in range(grid_size)] for _ in range(grid_size)]
-    
+        self._allocate()
+
+    def _seed_rng(self, seed):
+        # per-board RNG; an unseeded board still records the seed it drew so the game can be replayed
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.rng = random.Random(self.seed)
+
+    def _allocate(self):
+        # build empty storage for the current grid_size in the selected layout.
+        # Both layouts expose the mines/flags/revealed/counts planes, indexed by
+        # row * grid_size + col.
+        n = self.grid_size
+        # every cell starts covered and unflagged
+        self.covered = CoveredIndex(n * n)
+        if self.compact:
+            # one byte per cell per plane instead of a Cell object per cell
+            self.mines = bytearray(n * n)
+            self.flags = bytearray(n * n)
+            self.revealed = bytearray(n * n)
+            if self.lazy_counts:
+                self.counts = _LazyCounts(self, bytearray(b"\xff") * (n * n), 0xFF)
+            else:
+                self.counts = bytearray(n * n)
+            self.grid = _GridView(self)
+        else:
+            if self.lazy_counts:
+                self.grid = [[_LazyCell(self, r * n + c) for c in range(n)] for r in range(n)]
+            else:
+                self.grid = [[Cell() for _ in range(n)] for _ in range(n)]
+            cells = [cell for row in self.grid for cell in row]
+            self.mines = _CellPlane(cells, "has_mine")
+            self.flags = _CellPlane(cells, "has_flag")
+            self.revealed = _CellPlane(cells, "is_revealed")
+            if self.lazy_counts:
+                # counted on first read, through the cells' raw _count
+                self.counts = _LazyCounts(self, _CellPlane(cells, "_count"), -1)
+            else:
+                self.counts = _CellPlane(cells, "neighbor_count")
+
     def place_mines(self, safe_row: int, safe_col: int):
         """randomly place mines while keeping the first-clicked cell and all of
-        its neighbors mine-free. After placement, compute neighbor counts."""
-        # all possible coordinates except the first clicked cell
-        # exclude the first-click cell and all of its neighbors
-        safe_zone = set(self.neighbors(safe_row, safe_col))
-        safe_zone.add((safe_row, safe_col))
-        # candidate cells exclude the entire safe zone
-        all_coords = [
-            (r, c)
-            for r in range(self.grid_size)
-            for c in range(self.grid_size)
-            if not (r == safe_row and c == safe_col)
-            if (r, c) not in safe_zone
-        ]
-        if self.mine_count > len(all_coords):
+        its neighbors mine-free. After placement, compute neighbor counts
+        (on lazy_counts boards they are left to be counted when read)."""
+        n = self.grid_size
+        if not (0 <= safe_row < n and 0 <= safe_col < n):
+            raise IndexError("cell coordinates out of range")
+        # the first-click cell and its neighbors, as sorted linear ids
+        first = safe_row * n + safe_col
+        safe_ids = sorted([first, *self.neighbor_ids(first)])
+        # the other cells, numbered 0 .. free - 1 in row-major order, are the candidates;
+        # only their count is needed, not the list itself
+        free = n * n - len(safe_ids)
+        if self.mine_count > free:
             raise ValueError("mine_count too large for first-click safe zone")
-         # choose unique mine positions
-        mine_coords = random.sample(all_coords, self.mine_count)
-        
-        for r, c in mine_coords:
-            self.grid[r][c].has_mine = True
+        # choose unique candidate numbers, then map each back to its cell id by stepping
+        # over the safe ids at or before it. random.sample picks positions from the
+        # population's length alone, so this gives the same mines for a seed as sampling
+        # a row-major list of the candidate coordinates would, in O(mine_count) time.
+        mines = self.mines
+        for k in self.rng.sample(range(free), self.mine_count):
+            for safe in safe_ids:
+                if safe > k:
+                    break
+                k += 1
+            mines[k] = True
+        self._count_placed()
+
+    def place_mine_ids(self, mine_ids) -> None:
+        """put the mines exactly on the given linear ids (a prebuilt layout, e.g. a
+        no-guess board) instead of drawing them, then count neighbors as place_mines does."""
+        if len(mine_ids) != self.mine_count:
+            raise ValueError("layout does not hold mine_count mines")
+        mines = self.mines
+        for i in mine_ids:
+            mines[i] = True
+        self._count_placed()
+
+    def _count_placed(self) -> None:
+        if self.lazy_counts:
+            # anything counted before the mines went in is stale
+            self.counts.forget_all()
+            return
         # populate neighbor counts for every cell
-        for r in range(self.grid_size):
-            for c in range(self.grid_size):
-                self.grid[r][c].neighbor_count = self.count_adjacent_mines(r, c)
+        self.compute_adjacent_mines()
 
 
     def get_cell(self, row: int, column: int):
         # return the Cell at (row, column); raise if out of bounds.
         if not (0 <= row < self.grid_size and 0 <= column < self.grid_size):
             raise IndexError("cell coordinates out of range")
+        if self.compact:
+            return CellView(self, row * self.grid_size + column)
         return self.grid[row][column]
 
     def untouched_cells(self):
-        # return coordinates of all unrevealed or unflagged cells
-        coords = []
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                cell = self.get_cell(row,col)
-                if not cell.has_flag and not cell.is_revealed: coords.append((row,col))
-        return coords
+        # return coordinates of all unrevealed and unflagged cells, read from the
+        # covered index (GameLogic keeps it in sync as cells are revealed/flagged)
+        n = self.grid_size
+        return [divmod(i, n) for i in self.covered]
+
+    def random_untouched(self, rng=random) -> Tuple[int, int]:
+        # return one uniformly random unrevealed, unflagged cell in O(1)
+        return divmod(self.covered.choice(rng), self.grid_size)
     
     def is_flagged(self,row,col):
         # return whether a cell at the given coordinates is flagged
-        return self.get_cell(row,col).has_flag
+        return bool(self.get_cell(row,col).has_flag)
+
+    def cell_id(self, row: int, column: int) -> int:
+        # linear id of (row, column); the solvers work in ids and move in (row, col)
+        return row * self.grid_size + column
+
+    def position(self, index: int) -> Tuple[int, int]:
+        return divmod(index, self.grid_size)
+
+    def neighbor_ids(self, index: int) -> List[int]:
+        # linear ids of the cells around linear id `index`, from its row and column
+        # (no table needed); interior cells just add the fixed offsets
+        n = self.grid_size
+        row, col = divmod(index, n)
+        if 0 < row < n - 1 and 0 < col < n - 1:
+            return [index + step for step in self._steps]
+        return [(row + dr) * n + col + dc
+                for dr in (-1, 0, 1) if 0 <= row + dr < n
+                for dc in (-1, 0, 1) if (dr or dc) and 0 <= col + dc < n]
 
     def neighbors(self, row: int, column: int) -> List[Tuple[int, int]]:
         # return valid Moore-neighborhood coordinates (up to eight surrounding cells)
-        coords = []
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                r, c = row + dr, column + dc
-                if 0 <= r < self.grid_size and 0 <= c < self.grid_size:
-                    coords.append((r, c))
-        return coords
+        n = self.grid_size
+        return [(r, c)
+                for r in (row - 1, row, row + 1) if 0 <= r < n
+                for c in (column - 1, column, column + 1) if (r != row or c != column) and 0 <= c < n]
 
     def count_adjacent_mines(self, row: int, column: int) -> int:
         # compute how many of (row, column)’s neighbors contain mines
+        mines = self.mines
         return sum(
-            1 for r, c in self.neighbors(row, column) 
-            if self.grid[r][c].has_mine)
+            1 for j in self.neighbor_ids(row * self.grid_size + column)
+            if mines[j])
 
     # sets cell.neighbor_count to num of adjacent mines
     def compute_adjacent_mines(self) -> None:
-        # recompute neighbor_count for all cells (useful after manual changes)
-        for r in range (self.grid_size):
-            for c in range (self.grid_size):
-                self.grid[r][c].neighbor_count = self.count_adjacent_mines(r,c)
+        # recompute neighbor_count for all cells (useful after manual changes).
+        # Works a row at a time on the mine plane: add the rows above and below
+        # to get 3-high column sums, then add each column sum to its left and
+        # right neighbors to get the 3x3 window, minus the cell itself.
+        n = self.grid_size
+        mines = self.mines
+        zeros = [0] * n
+        above = zeros
+        row = mines[0:n]
+        for r in range(n):
+            below = mines[(r + 1) * n:(r + 2) * n] if r + 1 < n else zeros
+            column_sums = [a + b + c for a, b, c in zip(above, row, below)]
+            left = [0] + column_sums[:-1]
+            right = column_sums[1:] + [0]
+            self.counts[r * n:(r + 1) * n] = [
+                l + m + rt - own
+                for l, m, rt, own in zip(left, column_sums, right, row)]
+            above, row = row, below
+
+    def add_mine(self, row: int, column: int) -> None:
+        # put a mine on one cell and bump only its neighbors' counts.
+        # Only for boards no game is being played on: mine_count changes, but a GameLogic
+        # attached to this board keeps its safe-cell target, flag mismatches and frontier.
+        n = self.grid_size
+        i = row * n + column
+        if self.mines[i]:
+            return
+        self.mines[i] = True
+        self.mine_count += 1
+        self._shift_counts(i, 1)
+
+    def remove_mine(self, row: int, column: int) -> None:
+        # take the mine off one cell and lower only its neighbors' counts
+        # (the same caveat as add_mine: not on a board a GameLogic is playing)
+        n = self.grid_size
+        i = row * n + column
+        if not self.mines[i]:
+            return
+        self.mines[i] = False
+        self.mine_count -= 1
+        self._shift_counts(i, -1)
+
+    def _shift_counts(self, index: int, delta: int) -> None:
+        # a mine appeared (+1) or went (-1) at `index`: update its neighbors' counts,
+        # or on lazy boards just forget them so they are recounted when next read
+        counts = self.counts
+        if self.lazy_counts:
+            for j in self.neighbor_ids(index):
+                counts.forget(j)
+            return
+        for j in self.neighbor_ids(index):
+            counts[j] += delta
 
     #reinits board, does not place mines
     """clear the board to a fresh, mine-free state and update mine_count.
         Mines are not placed here; call place_mines() after the first click."""
-    def reset(self, mine_count: int):
+    def reset(self, mine_count: int, seed: int = None):
         if mine_count > self.grid_size * self.grid_size:
             raise ValueError(" mine_count too large ")
         self.mine_count = mine_count
+        self._seed_rng(seed)
         # brand-new cells; neighbor counts will be recalculated after placement
-        self.grid = [[Cell() for _ in range(self.grid_size)]
-                     for _ in range(self.grid_size)]
+        self._allocate()
 
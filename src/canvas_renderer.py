@@ -0,0 +1,168 @@
+"""
+File: canvas_renderer.py
+Module: CanvasBoard
+Purpose:
+    Board renderer for large grids: the whole board is one scrollable
+    tk.Canvas instead of a tk.Button per cell. A fixed pool of rectangle/text
+    item pairs, created up front, covers only the visible part of the board;
+    when the view scrolls, pool slots are handed to the cells that came into
+    view. Clicks are hit-tested from canvas coordinates.
+
+Inputs:
+    master: tk widget to build the canvas in
+    grid_size: int, cells per side
+    on_click(row, col): called for a left click on a cell
+    style(row, col) -> (text, fill colour): current look of a cell
+    cell_px: int, cell size in pixels; max_view: cells per side shown without scrolling
+    font: tk font for the cell labels (created once by the caller)
+
+Outputs:
+    frame: tk.Frame holding the canvas and its scrollbars (grid/pack it yourself)
+    draw(row, col): refresh one cell (no-op while it is scrolled out of view or unchanged)
+    redraw(): refresh every visible cell
+
+Notes:
+    Slot (r % pool_rows, c % pool_cols) belongs to cell (r, c). The pool is
+    one row and column larger than the view, so every visible cell has its
+    own slot and scrolling only restyles the cells that moved into view.
+
+Created: 2026-10-17
+"""
+
+import tkinter as tk
+
+# canvas colours (Windows-only system colour names do not exist on a canvas)
+COVERED = "#c8c8c8"
+OUTLINE = "#808080"
+
+
+class CanvasBoard:
+    def __init__(self, master, grid_size: int, on_click, style, cell_px: int = 24, max_view: int = 30,
+                 font=("Arial", 10)):
+        self.grid_size = grid_size
+        self.font = font
+        self.on_click = on_click
+        self.style = style
+        self.cell_px = cell_px
+        side = min(grid_size, max_view) * cell_px
+        extent = grid_size * cell_px
+
+        self.frame = tk.Frame(master)
+        self.canvas = tk.Canvas(self.frame, width=side, height=side, highlightthickness=0,
+                                scrollregion=(0, 0, extent, extent), xscrollincrement=cell_px,
+                                yscrollincrement=cell_px)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        if grid_size > max_view:
+            xbar = tk.Scrollbar(self.frame, orient="horizontal", command=self._xview)
+            ybar = tk.Scrollbar(self.frame, orient="vertical", command=self._yview)
+            xbar.grid(row=1, column=0, sticky="ew")
+            ybar.grid(row=0, column=1, sticky="ns")
+            self.canvas.config(xscrollcommand=xbar.set, yscrollcommand=ybar.set)
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        # pool of (rectangle id, text id) pairs, the cell each slot currently shows and its look
+        self.pool_rows = 0
+        self.pool_cols = 0
+        self.items = []
+        self.slot_cell = []
+        self.slot_style = []
+        self._view = (0, 0, 0, 0)
+
+        self.canvas.bind("<Button-1>", self._click)
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+        self.canvas.bind("<MouseWheel>", self._wheel)
+        self.canvas.bind("<Button-4>", lambda event: self._yview("scroll", -3, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self._yview("scroll", 3, "units"))
+        self._layout()
+
+    # scrollbar / wheel entry points: scroll, then move the pool onto the new view
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self._layout()
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._layout()
+
+    def _wheel(self, event):
+        self._yview("scroll", -3 if event.delta > 0 else 3, "units")
+
+    # cell under a canvas click, ignoring clicks past the board's edge
+    def _click(self, event):
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y)
+        row, col = int(y // self.cell_px), int(x // self.cell_px)
+        if 0 <= row < self.grid_size and 0 <= col < self.grid_size:
+            self.on_click(row, col)
+
+    # range of rows and columns currently inside the canvas window
+    def _visible(self):
+        px, n = self.cell_px, self.grid_size
+        width = max(self.canvas.winfo_width(), int(self.canvas["width"]))
+        height = max(self.canvas.winfo_height(), int(self.canvas["height"]))
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        col0, row0 = max(0, int(left // px)), max(0, int(top // px))
+        col1 = min(n, int((left + width) // px) + 1)
+        row1 = min(n, int((top + height) // px) + 1)
+        return row0, row1, col0, col1
+
+    # make sure the pool has a slot for every cell of a view this large (it never shrinks)
+    def _grow_pool(self, rows: int, cols: int):
+        rows, cols = min(self.grid_size, rows + 1), min(self.grid_size, cols + 1)
+        if rows <= self.pool_rows and cols <= self.pool_cols:
+            return
+        self.canvas.delete("cell")
+        self.pool_rows, self.pool_cols = max(rows, self.pool_rows), max(cols, self.pool_cols)
+        self.items = []
+        for _ in range(self.pool_rows * self.pool_cols):
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, fill=COVERED, outline=OUTLINE, tags="cell")
+            text = self.canvas.create_text(0, 0, text="", font=self.font, tags="cell")
+            self.items.append((rect, text))
+        self.slot_cell = [None] * len(self.items)
+        self.slot_style = [("", COVERED)] * len(self.items)
+
+    # hand each visible cell its slot, moving and restyling only slots that changed cells
+    def _layout(self):
+        row0, row1, col0, col1 = view = self._visible()
+        self._grow_pool(row1 - row0, col1 - col0)
+        self._view = view
+        px, pr, pc = self.cell_px, self.pool_rows, self.pool_cols
+        coords = self.canvas.coords
+        for r in range(row0, row1):
+            base = (r % pr) * pc
+            for c in range(col0, col1):
+                slot = base + c % pc
+                if self.slot_cell[slot] == (r, c):
+                    continue
+                self.slot_cell[slot] = (r, c)
+                rect, text = self.items[slot]
+                x, y = c * px, r * px
+                coords(rect, x, y, x + px, y + px)
+                coords(text, x + px / 2, y + px / 2)
+                self._paint(slot, r, c)
+
+    # restyle a slot, touching only the canvas items whose look changed
+    def _paint(self, slot: int, row: int, col: int):
+        look = self.style(row, col)
+        old = self.slot_style[slot]
+        if look == old:
+            return
+        self.slot_style[slot] = look
+        rect, text = self.items[slot]
+        if look[1] != old[1]:
+            self.canvas.itemconfig(rect, fill=look[1])
+        if look[0] != old[0]:
+            self.canvas.itemconfig(text, text=look[0])
+
+    # refresh one cell if it is on screen; off-screen cells are styled when scrolled into view
+    def draw(self, row: int, col: int):
+        row0, row1, col0, col1 = self._view
+        if row0 <= row < row1 and col0 <= col < col1:
+            self._paint((row % self.pool_rows) * self.pool_cols + col % self.pool_cols, row, col)
+
+    def redraw(self):
+        row0, row1, col0, col1 = self._view
+        for r in range(row0, row1):
+            for c in range(col0, col1):
+                self.draw(r, c)
@@ -2,6 +2,7 @@
 File: cell.py
 Purpose:
     Represents a single cell on the Minesweeper board.
+    CellView offers the same interface over a compact board's flat storage planes.
 
 Uses:
     - Store state about whether the cell has a mine, flag, or is revealed.
@@ -15,6 +16,7 @@ Inputs:
 Outputs:
     - State changes are in-memory attributes (has_mine, has_flag, etc.).
     - These attributes are later consumed by GameLogic and GameGUI.
+    - CellView reads and writes the same attributes through its BoardManager.
 
 Author: Sam Kelemen, Jenny Tsotezo
 Created: 2025-09-16
@@ -49,4 +51,63 @@ class Cell:
   # Remove a mine from this cell
   def remove_mine(self):
     # Set the mine state back to False.
+    self.has_mine = False
+
+class CellView:
+  # A compact board keeps no Cell objects; get_cell() hands out one of these
+  # instead. It only stores the owning board and the cell's linear index, and
+  # every attribute is read from / written to the board's storage planes.
+  __slots__ = ("_board", "_index")
+
+  def __init__(self, board, index: int):
+    self._board = board
+    self._index = index
+
+  # Indicates whether this cell contains a mine.
+  @property
+  def has_mine(self) -> bool:
+    return bool(self._board.mines[self._index])
+
+  @has_mine.setter
+  def has_mine(self, value: bool):
+    self._board.mines[self._index] = bool(value)
+
+  # Indicates whether the player has placed a flag on this cell.
+  @property
+  def has_flag(self) -> bool:
+    return bool(self._board.flags[self._index])
+
+  @has_flag.setter
+  def has_flag(self, value: bool):
+    self._board.flags[self._index] = bool(value)
+
+  # Indicates whether the player has revealed (clicked on) this cell.
+  @property
+  def is_revealed(self) -> bool:
+    return bool(self._board.revealed[self._index])
+
+  @is_revealed.setter
+  def is_revealed(self, value: bool):
+    self._board.revealed[self._index] = bool(value)
+
+  # Number of mines in the 8 neighboring cells (0–8).
+  @property
+  def neighbor_count(self) -> int:
+    return self._board.counts[self._index]
+
+  @neighbor_count.setter
+  def neighbor_count(self, value: int):
+    self._board.counts[self._index] = value
+
+  # Same helpers as Cell.
+  def flag(self):
+    self.has_flag = True
+
+  def unflag(self):
+    self.has_flag = False
+
+  def add_mine(self):
+    self.has_mine = True
+
+  def remove_mine(self):
     self.has_mine = False
\ No newline at end of file
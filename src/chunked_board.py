@@ -0,0 +1,374 @@
+"""
+File: chunked_board.py
+Module: ChunkedBoard, ChunkedGame
+Purpose:
+    Unbounded Minesweeper board. The plane is cut into chunk_size x chunk_size
+    chunks that only exist once something looks at them. Each chunk's mines
+    are derived from the board seed and the chunk's coordinates alone, so a
+    chunk can be dropped and rebuilt identically at any time: mine and
+    neighbor-count planes live in a small LRU of hot chunks. Only the player's
+    state (revealed cells and flags) is kept for good, and only for chunks the
+    player has touched, so memory follows the explored area, not the board.
+    ChunkedGame.board_mgr shows the board to the AI the way a BoardManager
+    does, with (chunk, offset) pairs as cell ids, and the game keeps a
+    Frontier over those ids, so AISolver (Hard included), ConstraintSolver and
+    MineProbability play it unchanged.
+
+Inputs:
+    ChunkedBoard(density, seed=None, chunk_size=32, cache_chunks=1024)
+    ChunkedGame(density, seed=None, chunk_size=32, flood_limit=1_000_000)
+    Coordinates are any integers (negative ones included).
+
+Outputs:
+    ChunkedBoard: is_mine / count / is_revealed / is_flagged (row, col), neighbors(row, col),
+                  set_safe_zone(row, col), stats() -> dict of chunk counts
+    ChunkedGame:  reveal_cell(row, col) -> list[(row, col)] newly revealed,
+                  toggle_flag(row, col) -> +1 / -1 / 0, window(row0, col0, rows, cols) -> list[str],
+                  apply_moves(moves) -> list[(row, col)] changed, mine_probabilities() -> ProbabilityMap,
+                  frontier (frontier.Frontier), board_mgr (ChunkedBoardView)
+    ChunkedBoardView: revealed / flags / counts indexed by cell id, neighbor_ids(cell),
+                  cell_id(row, col), position(cell), random_untouched(rng); mine_count is
+                  infinite (no flag limit) and density is the board's
+
+Notes:
+    Every chunk holds round(density * chunk_size^2) mines, placed by a
+    random.Random seeded with "seed:chunk_row:chunk_col". The first click's
+    3x3 block is then forced mine-free, as on BoardManager boards.
+    One reveal opens at most flood_limit cells; zeros left covered at the cut
+    keep the cascade going when clicked.
+
+Created: 2026-10-17
+"""
+
+import random
+from collections import OrderedDict, deque
+from math import inf
+from typing import Dict, List, Tuple
+
+from frontier import Frontier
+from move_log import FLAG
+
+Chunk = Tuple[int, int]
+# a cell as the solvers see it: (chunk, index inside the chunk), as from ChunkedBoard.locate
+CellId = Tuple[Chunk, int]
+
+
+class ChunkedBoard:
+    def __init__(self, density: float, seed: int = None, chunk_size: int = 32, cache_chunks: int = 1024):
+        if not 0 <= density < 1:
+            raise ValueError("density must be in [0, 1)")
+        if chunk_size < 3:
+            raise ValueError("chunk_size must be at least 3")
+        if cache_chunks < 9:
+            raise ValueError("cache_chunks must hold at least a 3x3 block of chunks")
+        self.density = density
+        self.seed = seed if seed is not None else random.randrange(2 ** 63)
+        self.chunk_size = chunk_size
+        self.mines_per_chunk = round(density * chunk_size * chunk_size)
+        # cells kept mine-free whatever the chunk generator says (the first click's 3x3 block)
+        self.safe_zone = frozenset()
+        # derived planes, rebuilt on demand: chunk -> bytearray of chunk_size^2 cells
+        self._mines: "OrderedDict[Chunk, bytearray]" = OrderedDict()
+        self._counts: "OrderedDict[Chunk, bytearray]" = OrderedDict()
+        self.cache_chunks = cache_chunks
+        # player state, kept for every chunk the player has touched
+        self.revealed: Dict[Chunk, bytearray] = {}
+        self.flags: Dict[Chunk, bytearray] = {}
+        self.generated = 0
+
+    # (chunk, index inside the chunk) of a cell; floor division keeps negative coordinates consistent
+    def locate(self, row: int, col: int) -> Tuple[Chunk, int]:
+        cr, r = divmod(row, self.chunk_size)
+        cc, c = divmod(col, self.chunk_size)
+        return (cr, cc), r * self.chunk_size + c
+
+    # LRU lookup; `build` makes the plane when it is not cached
+    def _cached(self, cache: OrderedDict, key: Chunk, build) -> bytearray:
+        plane = cache.get(key)
+        if plane is not None:
+            cache.move_to_end(key)
+            return plane
+        plane = build(key)
+        cache[key] = plane
+        if len(cache) > self.cache_chunks:
+            cache.popitem(last=False)
+        return plane
+
+    def _build_mines(self, key: Chunk) -> bytearray:
+        self.generated += 1
+        cs = self.chunk_size
+        plane = bytearray(cs * cs)
+        rng = random.Random(f"{self.seed}:{key[0]}:{key[1]}")
+        for k in rng.sample(range(cs * cs), self.mines_per_chunk):
+            plane[k] = 1
+        for row, col in self.safe_zone:
+            where, k = self.locate(row, col)
+            if where == key:
+                plane[k] = 0
+        return plane
+
+    # neighbor counts of a chunk from the mine planes of the 3x3 chunks around it,
+    # a row at a time as in BoardManager.compute_adjacent_mines
+    def _build_counts(self, key: Chunk) -> bytearray:
+        cs = self.chunk_size
+        cr, cc = key
+        block = [[self.mine_plane((cr + dr, cc + dc)) for dc in (-1, 0, 1)] for dr in (-1, 0, 1)]
+
+        # mines of board row `r` (relative to this chunk, -1..cs) over columns -1..cs
+        def padded_row(r):
+            band, k = divmod(r, cs)
+            left, mid, right = block[band + 1]
+            return [left[k * cs + cs - 1], *mid[k * cs:(k + 1) * cs], right[k * cs]]
+
+        counts = bytearray(cs * cs)
+        above, here = padded_row(-1), padded_row(0)
+        for r in range(cs):
+            below = padded_row(r + 1)
+            col_sums = [a + b + c for a, b, c in zip(above, here, below)]
+            base = r * cs
+            for c in range(cs):
+                counts[base + c] = col_sums[c] + col_sums[c + 1] + col_sums[c + 2] - here[c + 1]
+            above, here = here, below
+        return counts
+
+    def mine_plane(self, key: Chunk) -> bytearray:
+        return self._cached(self._mines, key, self._build_mines)
+
+    def count_plane(self, key: Chunk) -> bytearray:
+        return self._cached(self._counts, key, self._build_counts)
+
+    # Keep (row, col) and its neighbors mine-free. Cached planes are dropped so they are rebuilt with the zone.
+    def set_safe_zone(self, row: int, col: int):
+        self.safe_zone = frozenset((row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+        self._mines.clear()
+        self._counts.clear()
+
+    def is_mine(self, row: int, col: int) -> bool:
+        key, k = self.locate(row, col)
+        return bool(self.mine_plane(key)[k])
+
+    def count(self, row: int, col: int) -> int:
+        key, k = self.locate(row, col)
+        return self.count_plane(key)[k]
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        key, k = self.locate(row, col)
+        plane = self.revealed.get(key)
+        return plane is not None and bool(plane[k])
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        key, k = self.locate(row, col)
+        plane = self.flags.get(key)
+        return plane is not None and bool(plane[k])
+
+    # player-state plane of a chunk, created on first write
+    def state_plane(self, planes: Dict[Chunk, bytearray], key: Chunk) -> bytearray:
+        plane = planes.get(key)
+        if plane is None:
+            plane = planes[key] = bytearray(self.chunk_size * self.chunk_size)
+        return plane
+
+    @staticmethod
+    def neighbors(row: int, col: int) -> List[Tuple[int, int]]:
+        return [(row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+    # how much of the board exists right now
+    def stats(self) -> dict:
+        return {
+            "mine_chunks_cached": len(self._mines),
+            "count_chunks_cached": len(self._counts),
+            "player_chunks": len(self.revealed.keys() | self.flags.keys()),
+            "chunks_generated": self.generated,
+        }
+
+
+# The 0/1 state of each cell of one ChunkedBoard plane dict (revealed or flags), by cell id.
+class _StatePlane:
+    def __init__(self, planes: Dict[Chunk, bytearray]):
+        self.planes = planes
+
+    def __getitem__(self, cell: CellId) -> int:
+        plane = self.planes.get(cell[0])
+        return plane[cell[1]] if plane is not None else 0
+
+
+# Neighbor counts by cell id, built through the board's chunk cache.
+class _CountPlane:
+    def __init__(self, board: ChunkedBoard):
+        self.board = board
+
+    def __getitem__(self, cell: CellId) -> int:
+        return self.board.count_plane(cell[0])[cell[1]]
+
+
+# A ChunkedBoard as the AI solvers read a BoardManager: planes indexed by cell id, neighbor ids,
+# and conversions between ids and (row, col). Nothing here writes to the board.
+class ChunkedBoardView:
+    def __init__(self, board: ChunkedBoard):
+        self.board = board
+        self.revealed = _StatePlane(board.revealed)
+        self.flags = _StatePlane(board.flags)
+        self.counts = _CountPlane(board)
+        self.density = board.density
+        # no fixed mine total, so no limit on flags
+        self.mine_count = inf
+        cs = board.chunk_size
+        self._steps = (-cs - 1, -cs, -cs + 1, -1, 1, cs - 1, cs, cs + 1)
+
+    def cell_id(self, row: int, col: int) -> CellId:
+        return self.board.locate(row, col)
+
+    def position(self, cell: CellId) -> Tuple[int, int]:
+        (cr, cc), k = cell
+        cs = self.board.chunk_size
+        r, c = divmod(k, cs)
+        return cr * cs + r, cc * cs + c
+
+    # ids of the 8 cells around `cell`; inside a chunk they are fixed offsets of the same chunk
+    def neighbor_ids(self, cell: CellId) -> List[CellId]:
+        key, k = cell
+        cs = self.board.chunk_size
+        r, c = divmod(k, cs)
+        if 0 < r < cs - 1 and 0 < c < cs - 1:
+            return [(key, k + step) for step in self._steps]
+        row, col = self.position(cell)
+        return [self.board.locate(nr, nc) for nr, nc in self.board.neighbors(row, col)]
+
+    # A random covered, unflagged cell in the explored area or the band of chunks around it
+    # (around chunk (0, 0) before anything is touched).
+    def random_untouched(self, rng=random) -> Tuple[int, int]:
+        board = self.board
+        touched = board.revealed.keys() | board.flags.keys() or {(0, 0)}
+        cs = board.chunk_size
+        rows = [cr for cr, _ in touched]
+        cols = [cc for _, cc in touched]
+        while True:
+            row = rng.randrange((min(rows) - 1) * cs, (max(rows) + 2) * cs)
+            col = rng.randrange((min(cols) - 1) * cs, (max(cols) + 2) * cs)
+            if not board.is_revealed(row, col) and not board.is_flagged(row, col):
+                return row, col
+
+
+class ChunkedGame:
+    def __init__(self, density: float, seed: int = None, chunk_size: int = 32,
+                 flood_limit: int = 1_000_000, cache_chunks: int = 1024):
+        self.board = ChunkedBoard(density, seed, chunk_size, cache_chunks)
+        # the board as the AI solvers read it, and the revealed numbers bordering covered cells
+        self.board_mgr = ChunkedBoardView(self.board)
+        self.frontier = Frontier(self.board_mgr)
+        self.flood_limit = flood_limit
+        self.is_first_click = True
+        self.is_game_over = False
+        self.revealed_safe_cells = 0
+        self.flags_placed = 0
+        # exact probabilities for hints, built on first use
+        self.probability = None
+
+    # +1 flag placed, -1 flag removed, 0 nothing changed (revealed cell or game over).
+    # There is no flag limit on an unbounded board.
+    def toggle_flag(self, row: int, col: int) -> int:
+        board = self.board
+        if self.is_game_over or board.is_revealed(row, col):
+            return 0
+        key, k = board.locate(row, col)
+        plane = board.state_plane(board.flags, key)
+        plane[k] ^= 1
+        self.flags_placed += 1 if plane[k] else -1
+        self.frontier.on_flag((key, k), bool(plane[k]))
+        return 1 if plane[k] else -1
+
+    # Reveal a cell (the first reveal fixes the safe zone). Returns the newly revealed cells,
+    # or [(row, col)] for the mine that ended the game.
+    def reveal_cell(self, row: int, col: int) -> List[Tuple[int, int]]:
+        board = self.board
+        if self.is_game_over or board.is_revealed(row, col) or board.is_flagged(row, col):
+            return []
+        if self.is_first_click:
+            board.set_safe_zone(row, col)
+            self.is_first_click = False
+        if board.is_mine(row, col):
+            self.is_game_over = True
+            return [(row, col)]
+        revealed = self._flood_reveal(row, col)
+        self.frontier.on_revealed(board.locate(r, c) for r, c in revealed)
+        return revealed
+
+    # Make a batch of solver moves (move_log.Move, from AISolver.decide) in order, stopping once
+    # the game is over. Returns the cells whose state changed, as GameLogic.apply_moves does.
+    def apply_moves(self, moves) -> List[Tuple[int, int]]:
+        changed = []
+        for move in moves:
+            if self.is_game_over:
+                break
+            if move.kind == FLAG:
+                if self.toggle_flag(move.row, move.col):
+                    changed.append((move.row, move.col))
+            else:
+                changed.extend(self.reveal_cell(move.row, move.col))
+        return changed
+
+    # Mine probability of the cells around the explored area (everything else is at the density),
+    # as GameLogic.mine_probabilities gives for a bounded board.
+    def mine_probabilities(self):
+        if self.probability is None:
+            # imported here so playing without hints or a solver never loads the engines
+            from mine_probability import MineProbability
+            self.probability = MineProbability()
+        return self.probability.compute(self.board_mgr, self.frontier, self.flags_placed)
+
+    # Open the zero region around (row, col) and its numbered edge, up to flood_limit cells.
+    # Breadth-first, so a cascade cut short by the limit is a compact patch around the click
+    # (touching few chunks) rather than a long thin trail. The revealed planes double as
+    # the visited set; a cell is marked when it is taken off the queue, and neighbors already
+    # open or flagged are never queued, so the queue stays near the cascade's edge in size.
+    def _flood_reveal(self, row: int, col: int) -> List[Tuple[int, int]]:
+        board = self.board
+        cs = board.chunk_size
+        revealed, flags = board.revealed, board.flags
+        out = []
+        queue = deque([(row, col)])
+        while queue and len(out) < self.flood_limit:
+            r, c = queue.popleft()
+            cr, rr = divmod(r, cs)
+            cc, rc = divmod(c, cs)
+            key, k = (cr, cc), rr * cs + rc
+            plane = revealed.get(key)
+            if plane is not None and plane[k]:
+                continue
+            flag_plane = flags.get(key)
+            if flag_plane is not None and flag_plane[k]:
+                continue
+            if plane is None:
+                plane = board.state_plane(revealed, key)
+            plane[k] = 1
+            out.append((r, c))
+            # zeros never border a mine, so every neighbor pushed here is safe
+            if board.count_plane(key)[k] == 0:
+                for nr, nc in board.neighbors(r, c):
+                    nkey, nk = board.locate(nr, nc)
+                    seen = revealed.get(nkey)
+                    flagged = flags.get(nkey)
+                    if (seen is None or not seen[nk]) and (flagged is None or not flagged[nk]):
+                        queue.append((nr, nc))
+        self.revealed_safe_cells += len(out)
+        return out
+
+    # Text rows for the window starting at (row0, col0): '#' covered, 'F' flag,
+    # '*' mines (only once the game is lost), '.' empty, digits for counts.
+    def window(self, row0: int, col0: int, rows: int, cols: int) -> List[str]:
+        board = self.board
+        lines = []
+        for r in range(row0, row0 + rows):
+            line = []
+            for c in range(col0, col0 + cols):
+                if board.is_flagged(r, c):
+                    line.append("F")
+                elif board.is_revealed(r, c):
+                    n = board.count(r, c)
+                    line.append(str(n) if n else ".")
+                elif self.is_game_over and board.is_mine(r, c):
+                    line.append("*")
+                else:
+                    line.append("#")
+            lines.append("".join(line))
+        return lines
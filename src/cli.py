@@ -0,0 +1,402 @@
+"""
+File: cli.py
+Module: TerminalGame
+Purpose:
+    Terminal front-end for Minesweeper. Plays the same games as the Tk GUI
+    (single player, or taking turns with an AI solver where the first to hit
+    a mine loses) on top of GameLogic/BoardManager, reading typed commands
+    and printing the board as text. Nothing here imports tkinter, and the
+    AI solver and the no-guess board pool are only imported when asked for,
+    so the game starts in milliseconds and runs where there is no display.
+    With --chunked it plays the unbounded board of chunked_board.ChunkedGame
+    instead, through a view that moves around it.
+
+Inputs:
+    Command line: python3 cli.py [--size 10] [--mines 15] [--ai None|Easy|Medium|Hard]
+                                 [--seed 0] [--no-guess]
+                  python3 cli.py --chunked [--size 10 (view)] [--density 0.15] [--ai ...] [--seed 0]
+    Commands (rows and columns count from 1):
+      ROW COL / r ROW COL   reveal a cell          f ROW COL   toggle a flag
+      u / y                 undo / redo (single player)
+      h                     hint (safest covered cell)
+      n                     new game     q   quit     ?   help
+    Unbounded board only (rows and columns may be 0 or negative):
+      w / a / s / d         move the view up / left / down / right by half its size
+      g ROW COL             center the view on a cell
+
+Outputs:
+    The board after every move ('#' covered, 'F' flag, '.' empty, digits for
+    counts, '*' mines once the game is over) with a status line, and a
+    message when the game is won, lost or drawn.
+
+Created: 2026-10-17
+"""
+
+import argparse
+from typing import Callable, Iterable, Optional
+
+from board_manager import BoardManager
+from game_logic import GameLogic
+from move_log import AI, PLAYER, REVEAL
+from replay import render_text
+
+HELP = """commands (rows and columns count from 1):
+  ROW COL or r ROW COL   reveal a cell
+  f ROW COL              toggle a flag
+  u / y                  undo / redo the last move (single player)
+  h                      hint: the covered cell least likely to hold a mine
+  n                      new game
+  q                      quit"""
+
+CHUNKED_HELP = """commands (rows and columns as labelled; the board has no edges):
+  ROW COL or r ROW COL   reveal a cell
+  f ROW COL              toggle a flag
+  h                      hint: the covered cell least likely to hold a mine
+  w / a / s / d          move the view up / left / down / right
+  g ROW COL              center the view on a cell
+  n                      new game
+  q                      quit"""
+
+DIFFICULTIES = ("None", "Easy", "Medium", "Hard")
+
+
+# Default mine count: 15% of the cells, the middle of the GUI's 10%-20% range.
+def default_mines(grid_size: int) -> int:
+    cells = grid_size * grid_size
+    return max(1, min(round(cells * 0.15), cells - 9))
+
+
+class TerminalGame:
+    # ai: "Easy", "Medium" or "Hard" to take turns with that solver, None (or "None") to play alone;
+    # write: where output lines go (print by default)
+    def __init__(self, grid_size: int = 10, mine_count: Optional[int] = None, ai: Optional[str] = None,
+                 seed: Optional[int] = None, no_guess: bool = False, write: Callable[[str], None] = print):
+        self.grid_size = grid_size
+        self.mine_count = default_mines(grid_size) if mine_count is None else mine_count
+        if not 0 < self.mine_count <= grid_size * grid_size - 9:
+            raise ValueError(f"mine count must be between 1 and {grid_size * grid_size - 9}")
+        self.ai_diff = None if ai in (None, "None") else ai
+        self.seed = seed
+        self.write = write
+        # imported here so single-player games never load the solver or the process pool
+        self.board_pool = None
+        if no_guess:
+            from no_guess import NoGuessPool
+            self.board_pool = NoGuessPool()
+        self.game = None
+        self.ai = None
+        self.new_game()
+
+    # Fresh board and game (and solver, when playing against one). A seed only fixes the first board.
+    def new_game(self):
+        board = BoardManager(self.grid_size, self.mine_count, seed=self.seed)
+        self.seed = None
+        board_source = None
+        if self.board_pool is not None:
+            self.board_pool.prefetch(self.grid_size, self.mine_count)
+            board_source = self.board_pool.take
+        self.game = GameLogic(board, board_source=board_source)
+        if self.ai_diff is not None:
+            from AI_Solver import AISolver
+            self.ai = AISolver(self.ai_diff, board, self.game)
+
+    # The board with row and column numbers, and a status line under it.
+    def render(self) -> str:
+        n = self.grid_size
+        game = self.game
+        width = len(str(n))
+        rows = render_text(game.board_mgr, show_mines=game.is_game_over).split("\n")
+        # column numbers written downwards, one digit per text line
+        labels = [str(c + 1).rjust(width) for c in range(n)]
+        lines = [" " * (width + 1) + " ".join(label[k] for label in labels) for k in range(width)]
+        for r, row in enumerate(rows):
+            lines.append(f"{r + 1:>{width}} " + " ".join(row))
+        lines.append(f"mines: {self.game.board_mgr.mine_count}  flags: {game.flags_placed}  "
+                     f"revealed: {game.revealed_safe_cells}/{game.total_safe_cells}")
+        return "\n".join(lines)
+
+    # Handle one command line. Returns False once the player quits.
+    def command(self, line: str) -> bool:
+        words = line.split()
+        if not words:
+            return True
+        verb = words[0].lower()
+        if verb in ("q", "quit", "exit"):
+            return False
+        if verb in ("?", "help"):
+            self.write(HELP)
+        elif verb == "n":
+            self.new_game()
+            self.write(self.render())
+        elif verb == "u":
+            self.undoMove()
+        elif verb == "y":
+            self.redoMove()
+        elif verb == "h":
+            self.showHint()
+        elif verb in ("r", "f") or verb.isdigit():
+            cell = self.parseCell(words if verb.isdigit() else words[1:])
+            if cell is not None:
+                if verb == "f":
+                    self.addFlag(*cell)
+                else:
+                    self.reveal(*cell)
+        else:
+            self.write(f"unknown command {words[0]!r} (? for help)")
+        return True
+
+    # (row, col) from 1-based "ROW COL" words, or None (with a message) if they are not a cell
+    def parseCell(self, words):
+        n = self.grid_size
+        try:
+            row, col = (int(word) - 1 for word in words)
+        except ValueError:
+            self.write("expected a row and a column, e.g. 3 5")
+            return None
+        if not (0 <= row < n and 0 <= col < n):
+            self.write(f"rows and columns run from 1 to {n}")
+            return None
+        return row, col
+
+    # the player's reveal, then (against a solver) the solver's turn
+    def reveal(self, row: int, col: int):
+        game = self.game
+        if game.is_game_over:
+            self.write("the game is over (n for a new game)")
+            return
+        revealed = game.reveal_cell_ids(row, col, PLAYER)
+        if not len(revealed):
+            self.write("that cell is already open or flagged")
+            return
+        if not game.is_game_over and self.ai is not None:
+            moves = self.ai.decide()
+            game.apply_moves(moves, AI)
+            made = [f"{'reveal' if move.kind == REVEAL else 'flag'} {move.row + 1} {move.col + 1}" for move in moves]
+            self.write("AI: " + (", ".join(made) if made else "passes"))
+            self.showBoard(AI)
+        else:
+            self.showBoard(PLAYER)
+
+    def addFlag(self, row: int, col: int):
+        game = self.game
+        if game.toggle_flag(row, col, PLAYER) == 0:
+            if game.is_game_over:
+                self.write("the game is over (n for a new game)")
+            elif game.board_mgr.revealed[row * self.grid_size + col]:
+                self.write("that cell is already open")
+            else:
+                self.write("you are out of flags")
+            return
+        self.showBoard(PLAYER)
+
+    # undo/redo only make sense without a solver taking turns (as in the GUI)
+    def undoMove(self):
+        if self.ai is not None:
+            self.write("undo is only available in single-player games")
+        elif len(self.game.undo(PLAYER)):
+            self.showBoard(PLAYER)
+        else:
+            self.write("nothing to undo")
+
+    def redoMove(self):
+        if self.ai is not None:
+            self.write("redo is only available in single-player games")
+        elif len(self.game.redo(PLAYER)):
+            self.showBoard(PLAYER)
+        else:
+            self.write("nothing to redo")
+
+    def showHint(self):
+        game = self.game
+        if game.is_game_over:
+            return
+        if game.is_first_click:
+            self.write("Your first click is always safe.")
+            return
+        (row, col), chance = game.mine_probabilities().best_guess()
+        self.write(f"Safest cell: row {row + 1}, column {col + 1} (chance of a mine: {chance:.0%})")
+
+    # print the board, and how the game ended if it just did (`last`: who made the last move)
+    def showBoard(self, last: int):
+        game = self.game
+        self.write(self.render())
+        if not game.is_game_over:
+            return
+        if game.did_win:
+            self.write("Draw... no one blew up!" if self.ai is not None else "You revealed all safe cells. You win!")
+        elif last == AI:
+            self.write("The Solver blew up! You win!")
+        else:
+            self.write("You have hit a mine. Game over.")
+        self.write("n for a new game, q to quit")
+
+    # Read commands until quit or end of input (standard input by default).
+    def run(self, lines: Optional[Iterable[str]] = None):
+        self.write(self.render())
+        self.write("? for help")
+        try:
+            if lines is None:
+                while True:
+                    try:
+                        line = input("> ")
+                    except EOFError:
+                        break
+                    if not self.command(line):
+                        break
+            else:
+                for line in lines:
+                    if not self.command(line):
+                        break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if self.board_pool is not None:
+                self.board_pool.close()
+
+
+# The unbounded board of chunked_board.ChunkedGame, seen through a view of view_size x view_size
+# cells that the player moves around, alone or taking turns with a solver (which reads the
+# game's board_mgr and frontier as it would a bounded game's). No undo and no flag limit, and
+# the game only ends on a mine.
+class ChunkedTerminalGame(TerminalGame):
+    def __init__(self, view_size: int = 10, density: float = 0.15, seed: Optional[int] = None,
+                 write: Callable[[str], None] = print, ai: Optional[str] = None):
+        if view_size < 1:
+            raise ValueError("the view needs at least one cell per side")
+        if not 0 < density < 1:
+            raise ValueError("density must be between 0 and 1")
+        # grid_size is the view's side here
+        self.grid_size = view_size
+        self.density = density
+        self.seed = seed
+        self.write = write
+        self.board_pool = None
+        self.ai_diff = None if ai in (None, "None") else ai
+        self.ai = None
+        self.game = None
+        self.new_game()
+
+    def new_game(self):
+        # imported here so bounded games never load it
+        from chunked_board import ChunkedGame
+        self.game = ChunkedGame(self.density, seed=self.seed)
+        self.seed = None
+        if self.ai_diff is not None:
+            from AI_Solver import AISolver
+            self.ai = AISolver(self.ai_diff, self.game.board_mgr, self.game)
+        # top-left cell of the view
+        self.top = self.left = 0
+
+    # The view with row and column labels, and a status line under it.
+    def render(self) -> str:
+        n = self.grid_size
+        game = self.game
+        row_labels = [str(r + 1) for r in range(self.top, self.top + n)]
+        col_labels = [str(c + 1) for c in range(self.left, self.left + n)]
+        width = max(len(label) for label in row_labels + col_labels)
+        labels = [label.rjust(width) for label in col_labels]
+        lines = [" " * (width + 1) + " ".join(label[k] for label in labels) for k in range(width)]
+        for label, row in zip(row_labels, game.window(self.top, self.left, n, n)):
+            lines.append(f"{label:>{width}} " + " ".join(row))
+        lines.append(f"density: {game.board.density:.0%}  flags: {game.flags_placed}  "
+                     f"revealed: {game.revealed_safe_cells}  chunks: {game.board.stats()['player_chunks']}")
+        return "\n".join(lines)
+
+    def command(self, line: str) -> bool:
+        words = line.split()
+        verb = words[0].lower() if words else ""
+        step = max(1, self.grid_size // 2)
+        if verb in ("?", "help"):
+            self.write(CHUNKED_HELP)
+        elif verb in ("w", "a", "s", "d"):
+            self.top += {"w": -step, "s": step}.get(verb, 0)
+            self.left += {"a": -step, "d": step}.get(verb, 0)
+            self.write(self.render())
+        elif verb == "g":
+            cell = self.parseCell(words[1:])
+            if cell is not None:
+                self.top, self.left = cell[0] - self.grid_size // 2, cell[1] - self.grid_size // 2
+                self.write(self.render())
+        elif verb.lstrip("-").isdigit():
+            # negative coordinates are cells too
+            cell = self.parseCell(words)
+            if cell is not None:
+                self.reveal(*cell)
+        else:
+            return super().command(line)
+        return True
+
+    # any (row, col) is on the board
+    def parseCell(self, words):
+        try:
+            row, col = (int(word) - 1 for word in words)
+        except ValueError:
+            self.write("expected a row and a column, e.g. 3 5")
+            return None
+        return row, col
+
+    def reveal(self, row: int, col: int):
+        game = self.game
+        if game.is_game_over:
+            self.write("the game is over (n for a new game)")
+        elif not game.reveal_cell(row, col):
+            self.write("that cell is already open or flagged")
+        elif not game.is_game_over and self.ai is not None:
+            moves = self.ai.decide()
+            game.apply_moves(moves)
+            made = [f"{'reveal' if move.kind == REVEAL else 'flag'} {move.row + 1} {move.col + 1}" for move in moves]
+            self.write("AI: " + ", ".join(made))
+            self.showBoard(AI)
+        else:
+            self.showBoard(PLAYER)
+
+    def addFlag(self, row: int, col: int):
+        game = self.game
+        if game.toggle_flag(row, col) != 0:
+            self.showBoard(PLAYER)
+        elif game.is_game_over:
+            self.write("the game is over (n for a new game)")
+        else:
+            self.write("that cell is already open")
+
+    def undoMove(self):
+        self.write("undo is not available on the unbounded board")
+
+    def redoMove(self):
+        self.write("redo is not available on the unbounded board")
+
+    def showBoard(self, last: int):
+        self.write(self.render())
+        if self.game.is_game_over:
+            self.write("The Solver blew up! You win!" if last == AI else "You have hit a mine. Game over.")
+            self.write("n for a new game, q to quit")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Minesweeper in the terminal")
+    parser.add_argument("--size", type=int, default=10,
+                        help="cells per side (default 10); with --chunked, of the view")
+    parser.add_argument("--mines", type=int, default=None, help="mine count (default 15%% of the cells)")
+    parser.add_argument("--ai", choices=DIFFICULTIES, default="None", help="take turns with an AI solver")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the first board's mine layout")
+    parser.add_argument("--no-guess", action="store_true",
+                        help="deal boards that can be solved without guessing")
+    parser.add_argument("--chunked", action="store_true",
+                        help="play an unbounded board (chunked_board.py) through a movable view")
+    parser.add_argument("--density", type=float, default=0.15,
+                        help="share of mines on the unbounded board (default 0.15)")
+    args = parser.parse_args(argv)
+    if args.chunked and (args.mines is not None or args.no_guess):
+        parser.error("--chunked takes --density instead of --mines, and has no no-guess boards")
+    try:
+        if args.chunked:
+            game = ChunkedTerminalGame(args.size, args.density, args.seed, ai=args.ai)
+        else:
+            game = TerminalGame(args.size, args.mines, args.ai, args.seed, args.no_guess)
+    except ValueError as e:
+        parser.error(str(e))
+    game.run()
+
+
+if __name__ == "__main__":
+    main()
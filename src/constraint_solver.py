@@ -0,0 +1,257 @@
+"""
+File: constraint_solver.py
+Module: ConstraintSolver
+Purpose:
+    Deduction engine for the Hard AI. Every frontier cell gives a constraint
+    "exactly `target` of these covered cells are mines". The engine
+    - settles trivially full/empty constraints and reduces overlapping
+      constraints (if A is a subset of B, then B - A holds tB - tA mines),
+    - splits what is left into independent connected components, and
+    - enumerates every solution of each component, memoizing the result per
+      component so unchanged parts of the board are not solved twice.
+    A cell that is a mine in every solution (or in none) is a forced move.
+
+Inputs:
+    board_mgr: BoardManager (planes and neighbor ids are read, never written)
+    frontier: Frontier with the revealed numbered cells bordering covered cells
+    max_component_vars / max_nodes bound the per-turn enumeration work.
+
+Outputs:
+    deduce(board_mgr, frontier) -> (safe ids, mine ids) as sets of linear cell ids
+    solve_component(constraints) -> ComponentSolution or None if over budget
+
+Created: 2026-10-17
+"""
+
+from collections import OrderedDict, deque
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+# (covered cell ids, number of mines among them)
+Constraint = Tuple[FrozenSet[int], int]
+
+
+# All solutions of one component, tallied by how many mines the solution uses:
+# by_mines[k] = (number of solutions with k mines, per-variable mine hits in those solutions)
+class ComponentSolution:
+    __slots__ = ("variables", "by_mines")
+
+    def __init__(self, variables: Tuple[int, ...], by_mines: Dict[int, Tuple[int, List[int]]]):
+        self.variables = variables
+        self.by_mines = by_mines
+
+    # Total number of solutions and how many of them put a mine on each variable.
+    def totals(self) -> Tuple[int, List[int]]:
+        total = 0
+        hits = [0] * len(self.variables)
+        for count, var_hits in self.by_mines.values():
+            total += count
+            hits = [a + b for a, b in zip(hits, var_hits)]
+        return total, hits
+
+
+class ConstraintSolver:
+    def __init__(self, max_component_vars: int = 48, max_nodes: int = 200_000,
+                 max_reduction_rounds: int = 8, cache_size: int = 512):
+        # components larger than this (or needing more search nodes) are left unsolved
+        self.max_component_vars = max_component_vars
+        self.max_nodes = max_nodes
+        # subset-reduction passes per call (each pass can derive new constraints)
+        self.max_reduction_rounds = max_reduction_rounds
+        # component key -> ComponentSolution (or None when it blew the budget)
+        self._cache: "OrderedDict[tuple, Optional[ComponentSolution]]" = OrderedDict()
+        self._cache_size = cache_size
+
+    # One constraint per frontier cell over its covered, unflagged neighbors (flags count as mines).
+    # Constraints a wrong flag made impossible are dropped; duplicates collapse.
+    def constraints(self, board_mgr, frontier) -> List[Constraint]:
+        revealed, flags, counts = board_mgr.revealed, board_mgr.flags, board_mgr.counts
+        neighbor_ids = board_mgr.neighbor_ids
+        found = {}
+        for i in frontier.cells:
+            around = neighbor_ids(i)
+            unknown = frozenset(j for j in around if not revealed[j] and not flags[j])
+            if not unknown:
+                continue
+            target = counts[i] - sum(1 for j in around if flags[j])
+            if 0 <= target <= len(unknown):
+                found[unknown] = target
+        return list(found.items())
+
+    # Settle trivial constraints and apply subset reduction until nothing changes.
+    # Returns (safe ids, mine ids, remaining constraints over still-unknown cells).
+    def reduce(self, constraints: List[Constraint]) -> Tuple[Set[int], Set[int], List[Constraint]]:
+        safe: Set[int] = set()
+        mines: Set[int] = set()
+        pending = dict(constraints)
+        rounds = 0
+        changed = True
+        while changed:
+            changed = False
+            # substitute known cells and settle constraints that are all-safe or all-mine
+            current = {}
+            for cells, target in pending.items():
+                known_mines = len(cells & mines)
+                cells = cells - safe - mines
+                target -= known_mines
+                if not cells or target < 0 or target > len(cells):
+                    continue
+                if target == 0:
+                    safe |= cells
+                    changed = True
+                elif target == len(cells):
+                    mines |= cells
+                    changed = True
+                else:
+                    current[cells] = target
+            if changed or rounds >= self.max_reduction_rounds:
+                pending = current
+                continue
+            rounds += 1
+            # subset reduction between constraints that share a cell
+            by_cell: Dict[int, List[FrozenSet[int]]] = {}
+            for cells in current:
+                for j in cells:
+                    by_cell.setdefault(j, []).append(cells)
+            derived = {}
+            for a, ta in current.items():
+                partners = set()
+                for j in a:
+                    partners.update(by_cell[j])
+                for b in partners:
+                    if len(b) > len(a) and a < b:
+                        rest = b - a
+                        if rest not in current and rest not in derived:
+                            derived[rest] = current[b] - ta
+            if derived:
+                current.update(derived)
+                changed = True
+            pending = current
+        return safe, mines, list(pending.items())
+
+    # Group constraints into independent components (no shared cells between groups).
+    @staticmethod
+    def components(constraints: List[Constraint]) -> List[List[Constraint]]:
+        parent: Dict[int, int] = {}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for cells, _ in constraints:
+            first = None
+            for j in cells:
+                parent.setdefault(j, j)
+                if first is None:
+                    first = find(j)
+                else:
+                    root = find(j)
+                    if root != first:
+                        parent[root] = first
+        groups: Dict[int, List[Constraint]] = {}
+        for constraint in constraints:
+            groups.setdefault(find(next(iter(constraint[0]))), []).append(constraint)
+        return list(groups.values())
+
+    # Enumerate every mine assignment satisfying the component (memoized).
+    # Returns None when the component is over the variable or search-node budget.
+    def solve_component(self, component: List[Constraint]) -> Optional[ComponentSolution]:
+        key = tuple(sorted((tuple(sorted(cells)), target) for cells, target in component))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        result = self._enumerate(component)
+        self._cache[key] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def _enumerate(self, component: List[Constraint]) -> Optional[ComponentSolution]:
+        # order variables so each new one shares constraints with earlier ones (early pruning)
+        touching: Dict[int, List[int]] = {}
+        for c, (cells, _) in enumerate(component):
+            for j in cells:
+                touching.setdefault(j, []).append(c)
+        if len(touching) > self.max_component_vars:
+            return None
+        order: List[int] = []
+        seen = set()
+        for start in sorted(touching):
+            if start in seen:
+                continue
+            queue = deque([start])
+            seen.add(start)
+            while queue:
+                v = queue.popleft()
+                order.append(v)
+                for c in touching[v]:
+                    for j in sorted(component[c][0]):
+                        if j not in seen:
+                            seen.add(j)
+                            queue.append(j)
+        position = {v: k for k, v in enumerate(order)}
+        var_constraints = [touching[v] for v in order]
+        need = [target for _, target in component]          # mines still needed per constraint
+        open_cells = [len(cells) for cells, _ in component]  # unassigned cells per constraint
+        assignment = [0] * len(order)
+        by_mines: Dict[int, Tuple[int, List[int]]] = {}
+        nodes = 0
+
+        def search(k: int, mines: int) -> bool:
+            nonlocal nodes
+            nodes += 1
+            if nodes > self.max_nodes:
+                return False
+            if k == len(order):
+                count, hits = by_mines.get(mines, (0, [0] * len(order)))
+                for idx, value in enumerate(assignment):
+                    if value:
+                        hits[idx] += 1
+                by_mines[mines] = (count + 1, hits)
+                return True
+            cs = var_constraints[k]
+            for value in (0, 1):
+                ok = True
+                for c in cs:
+                    open_cells[c] -= 1
+                    need[c] -= value
+                for c in cs:
+                    if need[c] < 0 or need[c] > open_cells[c]:
+                        ok = False
+                        break
+                if ok:
+                    assignment[k] = value
+                    if not search(k + 1, mines + value):
+                        return False
+                for c in cs:
+                    open_cells[c] += 1
+                    need[c] += value
+            assignment[k] = 0
+            return True
+
+        if not search(0, 0):
+            return None
+        # report hits in sorted-variable order
+        variables = tuple(sorted(order))
+        remap = [position[v] for v in variables]
+        by_mines = {k: (count, [hits[p] for p in remap]) for k, (count, hits) in by_mines.items()}
+        return ComponentSolution(variables, by_mines)
+
+    # Every forced move on the board: (cells that are safe in all solutions,
+    # cells that are mines in all solutions).
+    def deduce(self, board_mgr, frontier) -> Tuple[Set[int], Set[int]]:
+        safe, mines, remaining = self.reduce(self.constraints(board_mgr, frontier))
+        for component in self.components(remaining):
+            solution = self.solve_component(component)
+            if solution is None:
+                continue
+            total, hits = solution.totals()
+            if not total:
+                continue
+            for v, h in zip(solution.variables, hits):
+                if h == 0:
+                    safe.add(v)
+                elif h == total:
+                    mines.add(v)
+        return safe, mines
@@ -0,0 +1,132 @@
+"""
+File: covered_index.py
+Module: CoveredIndex
+Purpose:
+    Live set of the covered, unflagged cells of a board (by linear cell id),
+    so a random untouched cell can be picked without scanning the grid.
+
+Inputs:
+    size: int -- number of cells; the index starts out holding every id 0..size-1.
+    CoveredIndex.from_mask(mask) instead starts from a 0/1 byte per cell (e.g. a loaded snapshot).
+    discard(i) / add(i) as cells are revealed, flagged and unflagged.
+
+Outputs:
+    choice(rng) -> int: a uniformly random id still in the set.
+    len(), `in`, iteration over the ids in the set.
+
+Notes:
+    Ids live in a virtual array of slots; the first `len()` slots hold the
+    members. Removing an id swaps it with the last member, re-adding swaps it
+    back into the member range, so every operation is O(1). Only slots whose
+    contents differ from the identity layout are stored, which makes building
+    the index O(1) and its memory proportional to the cells touched so far.
+    An index built from a mask keeps using the mask (add/discard flip bytes)
+    until choice() first needs the slot layout, which is then built once.
+
+Created: 2026-10-17
+"""
+
+import random
+from typing import Dict, Iterator
+
+
+class CoveredIndex:
+    def __init__(self, size: int):
+        # number of member slots (slots 0..size-1 hold the members)
+        self.size = size
+        # id -> slot and slot -> id, only where they differ from id == slot
+        self._slot_of: Dict[int, int] = {}
+        self._id_at: Dict[int, int] = {}
+        # membership bytes of an index from from_mask() whose slots are not laid out yet
+        self._mask = None
+
+    # Index of the ids whose byte in `mask` is 1. Only counts the members now.
+    @classmethod
+    def from_mask(cls, mask) -> "CoveredIndex":
+        index = cls(mask.count(1))
+        index._mask = bytearray(mask)
+        return index
+
+    # Lay the mask's members out in slots 0..size-1: every member id at or past `size`
+    # trades places with a non-member id below it; the rest stay in the identity layout.
+    def _lay_out(self):
+        mask, size = self._mask, self.size
+        self._mask = None
+        hole = mask.find(0, 0, size)
+        outsider = mask.find(1, size)
+        while hole != -1:
+            self._place(outsider, hole)
+            self._place(hole, outsider)
+            hole = mask.find(0, hole + 1, size)
+            outsider = mask.find(1, outsider + 1)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, i: int) -> bool:
+        if self._mask is not None:
+            return bool(self._mask[i])
+        return self._slot_of.get(i, i) < self.size
+
+    def __iter__(self) -> Iterator[int]:
+        mask = self._mask
+        if mask is not None:
+            i = mask.find(1)
+            while i != -1:
+                yield i
+                i = mask.find(1, i + 1)
+            return
+        id_at = self._id_at
+        for slot in range(self.size):
+            yield id_at.get(slot, slot)
+
+    # put id i into slot, dropping the entries again once they match the identity layout
+    def _place(self, i: int, slot: int):
+        if i == slot:
+            self._slot_of.pop(i, None)
+            self._id_at.pop(slot, None)
+        else:
+            self._slot_of[i] = slot
+            self._id_at[slot] = i
+
+    # Swap the contents of two slots.
+    def _swap(self, a: int, b: int):
+        id_a = self._id_at.get(a, a)
+        id_b = self._id_at.get(b, b)
+        self._place(id_a, b)
+        self._place(id_b, a)
+
+    # Remove id i (cell revealed or flagged); no-op if it is not a member.
+    def discard(self, i: int):
+        if self._mask is not None:
+            if self._mask[i]:
+                self._mask[i] = 0
+                self.size -= 1
+            return
+        slot = self._slot_of.get(i, i)
+        if slot >= self.size:
+            return
+        self.size -= 1
+        self._swap(slot, self.size)
+
+    # Re-insert id i (cell unflagged); no-op if it is already a member.
+    def add(self, i: int):
+        if self._mask is not None:
+            if not self._mask[i]:
+                self._mask[i] = 1
+                self.size += 1
+            return
+        slot = self._slot_of.get(i, i)
+        if slot < self.size:
+            return
+        self._swap(slot, self.size)
+        self.size += 1
+
+    # Return a uniformly random member id; IndexError when the set is empty.
+    def choice(self, rng=random) -> int:
+        if not self.size:
+            raise IndexError("no covered cells left")
+        if self._mask is not None:
+            self._lay_out()
+        slot = rng.randrange(self.size)
+        return self._id_at.get(slot, slot)
@@ -0,0 +1,113 @@
+"""
+File: frontier.py
+Module: Frontier
+Purpose:
+    Track the revealed numbered cells that still border covered cells, with
+    cached hidden/flagged neighbor counts, so the solvers only revisit the
+    cells whose surroundings changed since they last looked.
+
+Inputs:
+    board_mgr: BoardManager whose planes and neighbor ids are read.
+    on_revealed(ids) after cells are revealed, on_covered(ids) after they are covered
+    again (undo), on_flag(i, placed) after a flag toggle,
+    rebuild(candidates=None) to start over from the board.
+
+Outputs:
+    cells: dict linear id -> [hidden neighbors, flagged neighbors]
+           ("hidden" counts every unrevealed neighbor, flagged or not).
+    dirty: set of frontier ids whose counts changed since a solver last popped them.
+
+Created: 2026-10-17
+"""
+
+from typing import Dict, Iterable, List, Set
+
+
+class Frontier:
+    def __init__(self, board_mgr):
+        self.board_mgr = board_mgr
+        self.cells: Dict[int, List[int]] = {}
+        self.dirty: Set[int] = set()
+
+    # Start tracking revealed cell i if it shows a number and still has covered neighbors.
+    def _track(self, i: int):
+        board = self.board_mgr
+        if not board.counts[i]:
+            return
+        revealed, flags = board.revealed, board.flags
+        hidden = flagged = 0
+        for j in board.neighbor_ids(i):
+            if not revealed[j]:
+                hidden += 1
+                if flags[j]:
+                    flagged += 1
+        if hidden:
+            self.cells[i] = [hidden, flagged]
+            self.dirty.add(i)
+
+    # Rebuild from a full scan of the board (for boards not updated incrementally), or
+    # from just the revealed cells in `candidates` when the caller already knows which
+    # cells can border covered ones (e.g. a loaded snapshot).
+    def rebuild(self, candidates: Iterable[int] = None):
+        self.cells.clear()
+        self.dirty.clear()
+        revealed = self.board_mgr.revealed
+        if candidates is None:
+            candidates = range(self.board_mgr.grid_size ** 2)
+        for i in candidates:
+            if revealed[i]:
+                self._track(i)
+
+    # Update after the cells in `ids` were revealed: their frontier neighbors lose a
+    # hidden neighbor (and leave the frontier at zero), then the new cells join it.
+    def on_revealed(self, ids: Iterable[int]):
+        ids = list(ids)
+        cells, dirty = self.cells, self.dirty
+        neighbor_ids = self.board_mgr.neighbor_ids
+        for i in ids:
+            for j in neighbor_ids(i):
+                entry = cells.get(j)
+                if entry is None:
+                    continue
+                entry[0] -= 1
+                if entry[0]:
+                    dirty.add(j)
+                else:
+                    del cells[j]
+                    dirty.discard(j)
+        for i in ids:
+            self._track(i)
+
+    # Update after the cells in `ids` were covered again (an undone reveal): they leave the
+    # frontier, their tracked neighbors gain a hidden neighbor, and revealed neighbors that
+    # had none are tracked afresh once every cell is covered.
+    def on_covered(self, ids: Iterable[int]):
+        cells, dirty = self.cells, self.dirty
+        for i in ids:
+            if cells.pop(i, None) is not None:
+                dirty.discard(i)
+        revealed = self.board_mgr.revealed
+        neighbor_ids = self.board_mgr.neighbor_ids
+        fresh = set()
+        for i in ids:
+            for j in neighbor_ids(i):
+                if not revealed[j] or j in fresh:
+                    continue
+                entry = cells.get(j)
+                if entry is None:
+                    fresh.add(j)
+                else:
+                    entry[0] += 1
+                    dirty.add(j)
+        for j in fresh:
+            self._track(j)
+
+    # Update after a flag was placed (placed=True) or removed on cell i.
+    def on_flag(self, i: int, placed: bool):
+        delta = 1 if placed else -1
+        cells, dirty = self.cells, self.dirty
+        for j in self.board_mgr.neighbor_ids(i):
+            entry = cells.get(j)
+            if entry is not None:
+                entry[1] += delta
+                dirty.add(j)
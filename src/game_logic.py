@@ -8,29 +8,54 @@ Purpose:
 Inputs:
     - A BoardManager instance supplied at construction. The UI
       calls GameLogic methods in response to user actions.
+    - Optionally a board_source asked for the mine layout on the first click
+      (no_guess.NoGuessPool.take deals boards solvable without guessing).
 
 Outputs:
     - toggle_flag(...) -> int: row, col for flags placed/removed.
     - reveal_cell(...) -> List[Tuple[int,int]]: coordinates newly revealed cells.
+    - reveal_cell_ids(...) -> array('i'): the same cells as linear ids (row * grid_size + col).
+    - apply_moves(moves, actor) -> array('i'): makes a batch of AI solver moves (move_log.Move)
+      directly and returns the ids of the cells that changed.
     - Game state mutations on the underlying BoardManager grid (cell flags,
       cell revealed states, mine placement) and GameLogic state (counters, flags).
+    - frontier: Frontier of revealed numbered cells bordering covered cells,
+      updated from every reveal and flag toggle.
+    - mine_probabilities() -> ProbabilityMap: exact per-cell mine probabilities (hints).
+    - move_log: MoveLog of every reveal / flag toggle that changed the game and
+      who made it; with board_mgr.seed it rebuilds the game (see replay.py).
+    - undo() / redo() -> array('i'): step back / forward one move, returning the ids of
+      the cells that changed. History holds deltas only (the cells a reveal opened, the
+      flag toggled) and keeps the latest `history` moves.
 
 Author: Jenny Tsotezo, Matthew Eagleman, Mohamed Ashraq
 
 Created: 2025-09-17
 """
 
+from array import array
+from collections import deque
 from typing import List, Tuple
 from board_manager import BoardManager
-import random
+from frontier import Frontier
+from mine_probability import MineProbability, ProbabilityMap
+from move_log import AI, FLAG, PLAYER, REDO, REVEAL, UNDO, MoveLog
+
+# moves kept for undo unless GameLogic is given another history size
+UNDO_LIMIT = 1000
 
 class GameLogic:
     # Construct a GameLogic bound to a specific BoardManager.
     # Parameters: board_mgr (BoardManager): The board service that stores cells and performs mine placement / neighboring computations.
+    #           - board_source (optional): callable (grid_size, mine_count, row, col) -> linear mine ids or None,
+    #             asked for a ready-made layout on the first click (e.g. NoGuessPool.take); None falls back to random placement.
+    #           - history (int): most moves kept for undo(); older ones are forgotten.
     # Returns: None
     # Initializes gameplay state and computes initial total_safe_cells from the current board_mgr.mine_count.
-    def __init__(self, board_mgr: BoardManager):
+    def __init__(self, board_mgr: BoardManager, board_source=None, history: int = UNDO_LIMIT):
         self.board_mgr = board_mgr
+        # Where first-click layouts come from when not drawn at random
+        self.board_source = board_source
         # Delay mine placement until first reveal to guarantee safety.
         self.is_first_click: bool = True
         # Blocks further actions when True (loss or win).
@@ -42,18 +67,44 @@ class GameLogic:
         self.total_safe_cells: int = self.board_mgr.grid_size ** 2 - self.board_mgr.mine_count
          # Tracks how many flags the user has placed
         self.flags_placed: int = 0
+        # Linear ids of the flagged cells
+        self.flagged_ids: set = set()
+        # Cells whose mine and flag state differ (mined but unflagged, or flagged but safe).
+        # Zero means every mine is flagged and nothing else is; kept current on every
+        # flag toggle and at mine placement, so the flag-win check never scans the board.
+        self.mismatches: int = 0
+        # Set once the game is won (read together with is_game_over).
+        self.did_win: bool = False
         # Stores the difficulty of the AI
         self.AI_diff = None
+        # Revealed numbered cells that still border covered cells (read by the AI solvers)
+        self.frontier = Frontier(board_mgr)
+        # Probability engine behind mine_probabilities() (keeps its per-component cache between calls)
+        self.probability = MineProbability()
+        # Append-only record of the moves that changed this game
+        self.move_log = MoveLog()
+        # Undo entries, newest last: (FLAG, id, did_win before) or
+        # (REVEAL, id, ids revealed, hit a mine, did_win before); a reveal only happens while the game is on
+        self.undo_stack = deque(maxlen=history)
+        # (kind, id) of undone moves, newest last; any new move clears it
+        self.redo_stack = []
+        # True while redo() re-makes a move
+        self._redoing = False
+        # Callables told which cells' mine, flag or revealed bits changed: each gets the linear
+        # ids, or None when the whole board may have (mines placed, board reset). Used by
+        # snapshot.SnapshotWriter to repack only the tiles a move touched.
+        self.watchers = []
 
     # Start a brand-new round with a specified mine count. Clears prior state and prepares for a safe first click (mines not yet placed).
     # Parameters: mine_count (int): Number of mines for the new game (e.g., 10–20).
+    #           - seed (int, optional): seed of the new board's mine layout (random when omitted).
     # Returns: None
-    # Calls BoardManager.reset(mine_count) to rebuild an empty grid.
+    # Calls BoardManager.reset(mine_count, seed) to rebuild an empty grid.
     # Resets is_first_click, is_game_over, revealed_safe_cells, flags_placed, and recomputes total_safe_cells.
     # Reset all state for a new game with a given mine count
-    def reset_game(self, mine_count: int):
+    def reset_game(self, mine_count: int, seed: int = None):
          # Recreate an empty grid with new mine count.
-        self.board_mgr.reset(mine_count)
+        self.board_mgr.reset(mine_count, seed)
         # Next reveal will be treated as the first click.
         self.is_first_click = True
         # Re-initialize all variables to zero inorder to restart the game
@@ -62,17 +113,28 @@ class GameLogic:
         self.revealed_safe_cells = 0
         # Number of flags reset to zero.
         self.flags_placed = 0
+        self.flagged_ids = set()
+        # No mines and no flags yet.
+        self.mismatches = 0
         # Recompute safe cells in case mine_count changed
         self.total_safe_cells = self.board_mgr.grid_size ** 2 - self.board_mgr.mine_count
         self.did_win: bool = False
+        # Nothing is revealed on the new board yet.
+        self.frontier = Frontier(self.board_mgr)
+        # The new game starts with an empty move log and no history.
+        self.move_log = MoveLog()
+        self.undo_stack.clear()
+        self.redo_stack = []
+        self._notify(None)
 
     # Place or remove a flag on a covered cell, enforcing the rule that you cannot place more flags than the total number of mines.
     # Parameters: row (int): Row index of the target cell.
     #           - col (int): Column index of the target cell.
+    #           - actor (int): move_log.PLAYER or move_log.AI, recorded in the move log.
     # Returns: int: +1  if a flag was successfully placed,
     #               -1  if an existing flag was removed,
     #                0  if no change (e.g., game over, cell already revealed, or flag limit would be exceeded).
-    def toggle_flag(self, row: int, col: int) -> int:
+    def toggle_flag(self, row: int, col: int, actor: int = PLAYER) -> int:
         # Do not allow flagging after the game ended.
         if self.is_game_over:
             return 0
@@ -84,56 +146,100 @@ class GameLogic:
         # You cannot place more flags than total mines.
         if not cell.has_flag and self.flags_placed >= self.board_mgr.mine_count:
             return 0
-        cell.has_flag = not cell.has_flag
-        # Keep the running count in sync.
-        self.flags_placed += 1 if cell.has_flag else -1
+        i = row * self.board_mgr.grid_size + col
+        self._record(FLAG, actor, i, (FLAG, i, self.did_win))
+        self._apply_flag(i)
         # If the number of flags you've placed equals the total number of mines
         # AND every mine location actually has a flag on it
         if self.flags_placed == self.board_mgr.mine_count and self._all_mines_flagged():
             # self.is_game_over = True   # end the game…
             self.did_win = True        # and mark it as a victory.
         return 1 if cell.has_flag else -1
+
+    # Flip the flag on cell i and keep every counter in step (no rule checks, no logging);
+    # shared by toggle_flag and undo().
+    def _apply_flag(self, i: int):
+        board = self.board_mgr
+        placed = not board.flags[i]
+        board.flags[i] = placed
+        # Keep the running count in sync.
+        self.flags_placed += 1 if placed else -1
+        # Flagged cells leave the covered index; unflagged ones return to it.
+        if placed:
+            board.covered.discard(i)
+            self.flagged_ids.add(i)
+        else:
+            board.covered.add(i)
+            self.flagged_ids.discard(i)
+        # A flag on a mine fixes a mismatch, a flag anywhere else adds one (removal is the reverse).
+        self.mismatches += -1 if placed == bool(board.mines[i]) else 1
+        # Neighboring frontier cells now see one more/less flag.
+        self.frontier.on_flag(i, placed)
+        self._notify((i,))
     
     # Reveal a cell. On the very first reveal, place mines *after* the click to guarantee safety at (row, col). If the cell is a mine, set loss. 
     # If the cell is safe: Reveal it, and if its neighbor_count is zero, flood-reveal adjacent cells (including diagonals).
     #                    - Track victory when all non-mine cells are revealed.
     # Parameters: row (int): Row index of the cell to reveal.
     #           - col (int): Column index of the cell to reveal.
+    #           - actor (int): move_log.PLAYER or move_log.AI, recorded in the move log.
     # Returns: List[Tuple[int,int]]: Coordinates of all cells newly revealed during this action. If a mine is revealed, returns
     # a single coordinate [(row, col)] to allow the UI to mark the hit.
     # On first-click, calls BoardManager.place_mines(row, col) and recomputes total_safe_cells.
-    def reveal_cell(self, row: int, col: int) -> List[Tuple[int, int]]:
+    def reveal_cell(self, row: int, col: int, actor: int = PLAYER) -> List[Tuple[int, int]]:
+        n = self.board_mgr.grid_size
+        return [divmod(i, n) for i in self.reveal_cell_ids(row, col, actor)]
+
+    # Same as reveal_cell, but returns the newly revealed cells as a compact array of
+    # linear ids (row * grid_size + col), which is what large cascades should use.
+    def reveal_cell_ids(self, row: int, col: int, actor: int = PLAYER) -> array:
         # Ignore reveals after win/loss.
         if self.is_game_over:
-            return []
+            return array("i")
         # Get the cell to reveal.
         cell = self.board_mgr.get_cell(row, col)
         # Don’t reveal cell if it is already open or if the user flagged it.
         if cell.is_revealed or cell.has_flag:
-            return []
+            return array("i")
 
         # First reveal of the game. make the board safe for this click.
         if self.is_first_click:
-            # Place mines now, excluding the first-click (and maybe neighbors).
-            self.board_mgr.place_mines(row, col)
+            # Place mines now, excluding the first-click (and maybe neighbors): a ready
+            # layout from the board source if it has one, a random one otherwise.
+            layout = None
+            if self.board_source is not None:
+                layout = self.board_source(self.board_mgr.grid_size, self.board_mgr.mine_count, row, col)
+            if layout is None:
+                self.board_mgr.place_mines(row, col)
+            else:
+                self.board_mgr.place_mine_ids(layout)
+            # Flags placed before the first click now meet the mines.
+            self._count_mismatches()
+            self._notify(None)
             # Recompute safe target in case mine_count differs.
             self.total_safe_cells = self.board_mgr.grid_size ** 2 - self.board_mgr.mine_count
             # Make subsequent reveals are normal.
             self.is_first_click = False
+        i = row * self.board_mgr.grid_size + col
+        was_won = self.did_win
 
         # If we hit a mine 
         if cell.has_mine:
+            # Every reveal that gets this far changes the game.
+            self._record(REVEAL, actor, i, (REVEAL, i, array("i", (i,)), True, was_won))
             # The game ends
             self.is_game_over = True
             # Player loses the game
             self.did_win = False
-            #return the detonated coordinate for the UI to render.
-            return [(row, col)]
+            #return the detonated cell for the UI to render.
+            return array("i", (i,))
 
-        # Collect every cell that becomes visible from this action.
-        newly_revealed = []
         # Reveal clicked cell; if it’s a 0, cascade to neighbors.
-        self._flood_reveal(row, col, newly_revealed)
+        newly_revealed = self._flood_reveal(i)
+        self._record(REVEAL, actor, i, (REVEAL, i, newly_revealed, False, was_won))
+        # Let the frontier absorb the newly revealed cells.
+        self.frontier.on_revealed(newly_revealed)
+        self._notify(newly_revealed)
 
         # All safe cells are revealed, player wins the game
         if self.revealed_safe_cells >= self.total_safe_cells and not self.is_game_over:
@@ -141,77 +247,187 @@ class GameLogic:
             self.did_win = True
         return newly_revealed
     
+    # Make a batch of solver moves (move_log.Move, e.g. from AISolver.decide) in order, stopping
+    # once the game is over. Flag moves toggle the flag, like toggle_flag.
+    # Parameters: moves (iterable of Move), actor (int): recorded in the move log (AI by default).
+    # Returns: array('i') of linear ids whose state changed: every newly revealed cell (or the
+    # detonated mine) and every cell whose flag was toggled.
+    def apply_moves(self, moves, actor: int = AI) -> array:
+        n = self.board_mgr.grid_size
+        changed = array("i")
+        for move in moves:
+            if self.is_game_over:
+                break
+            if move.kind == FLAG:
+                if self.toggle_flag(move.row, move.col, actor):
+                    changed.append(move.row * n + move.col)
+            else:
+                changed.extend(self.reveal_cell_ids(move.row, move.col, actor))
+        return changed
+
+    # Log a move that changed the game and keep its undo entry. A new move clears the redo
+    # stack; a move re-made by redo() is logged as REDO instead.
+    def _record(self, kind: int, actor: int, i: int, entry: tuple):
+        self.undo_stack.append(entry)
+        if self._redoing:
+            self.move_log.append(REDO, actor, 0)
+        else:
+            self.move_log.append(kind, actor, i)
+            self.redo_stack.clear()
+
+    def _notify(self, ids):
+        for watcher in self.watchers:
+            watcher(ids)
+
+    # Take back the latest move (including the one that ended the game), in time proportional
+    # to the cells it changed. Undoing the first reveal keeps the mines where they were placed.
+    # Parameters: actor (int): recorded in the move log.
+    # Returns: array('i') of the linear ids whose state changed (empty if there is nothing to undo).
+    def undo(self, actor: int = PLAYER) -> array:
+        if not self.undo_stack:
+            return array("i")
+        entry = self.undo_stack.pop()
+        self.move_log.append(UNDO, actor, 0)
+        self.redo_stack.append((entry[0], entry[1]))
+        if entry[0] == FLAG:
+            _, i, was_won = entry
+            self._apply_flag(i)
+            self.did_win = was_won
+            return array("i", (i,))
+        _, i, ids, hit_mine, was_won = entry
+        if not hit_mine:
+            board = self.board_mgr
+            revealed, add = board.revealed, board.covered.add
+            for j in ids:
+                revealed[j] = False
+                add(j)
+            self.revealed_safe_cells -= len(ids)
+            self.frontier.on_covered(ids)
+            self._notify(ids)
+        self.is_game_over = False
+        self.did_win = was_won
+        return array("i", ids)
+
+    # Make the latest undone move again.
+    # Parameters: actor (int): recorded in the move log.
+    # Returns: array('i') of the linear ids whose state changed (empty if there is nothing to redo).
+    def redo(self, actor: int = PLAYER) -> array:
+        if not self.redo_stack:
+            return array("i")
+        kind, i = self.redo_stack.pop()
+        row, col = divmod(i, self.board_mgr.grid_size)
+        self._redoing = True
+        try:
+            if kind == FLAG:
+                return array("i", (i,)) if self.toggle_flag(row, col, actor) else array("i")
+            return self.reveal_cell_ids(row, col, actor)
+        finally:
+            self._redoing = False
+
+    # Exact mine probability of every covered cell given what is revealed and flagged (flags are trusted).
+    # Returns: ProbabilityMap -- .probability(row, col) per cell and .best_guess() for the safest cell.
+    # Before the first click every cell is equally likely (and the first click is always safe).
+    def mine_probabilities(self) -> ProbabilityMap:
+        return self.probability.compute(self.board_mgr, self.frontier, self.flags_placed)
+
     # Return True only if the flag layout exactly matches the mine layout:
     #  - every mined cell is flagged, AND
     # - no non-mined cell is flagged.
+    # Reads the running mismatch counter, so this is O(1) at any board size.
     def _all_mines_flagged(self) -> bool:
-        n = self.board_mgr.grid_size 
-        # Iterate over all row indices 0..n-1          
-        for r in range(n): 
-            # Iterate over all column indices 0..n-1                     
-            for c in range(n):                  
-                # Access the Cell at (r, c)
-                cell = self.board_mgr.get_cell(r, c)   
-                # If the cell's mine status and flag status differ, the configuration is not "perfect":
-                # mined but not flagged  OR safe but flagged
-                if cell.has_mine != cell.has_flag:
-                    # Early exit: as soon as one mismatch is found, it's not a perfect match
-                    return False                
-        # If we scanned every cell without mismatch, all mines are flagged AND no safe cell is flagged
-        return True                             
+        return self.mismatches == 0
+
+    # Rebuild the flag bookkeeping (flagged_ids, flags_placed, mismatches) for a game whose
+    # flag plane was filled in from outside, e.g. by snapshot.load_snapshot.
+    # Parameters: flagged_ids (iterable of int): linear ids of the flagged cells.
+    def restore_flags(self, flagged_ids):
+        self.flagged_ids = set(flagged_ids)
+        self.flags_placed = len(self.flagged_ids)
+        if self.is_first_click:
+            # No mines yet, so every flag is on a safe cell.
+            self.mismatches = self.flags_placed
+        else:
+            self._count_mismatches()
+
+    # Recount mismatches from scratch: every mine counts once, except flagged ones, and
+    # every flag on a safe cell counts once. Only looks at the flagged cells.
+    def _count_mismatches(self):
+        mines = self.board_mgr.mines
+        flagged_mines = sum(1 for i in self.flagged_ids if mines[i])
+        self.mismatches = self.board_mgr.mine_count + len(self.flagged_ids) - 2 * flagged_mines
 
-    
     # Perform the classic Minesweeper "cascade" from a starting cell: reveal the starting safe cell; if its neighbor_count == 0, expand
     # to all 8-directional neighbors, continuing until the zero region and its numbered boundaries are exposed.
-    # Parameters: row (int): Starting row index.
-    #           - col (int): Starting column index.
-    # Returns: None 
-    # Uses an explicit stack for iterative DFS.
-    # Maintains a visited set to avoid reprocessing the same coordinates.
-    # Skips mines, flagged cells, and already revealed cells.
-    # When a zero is revealed, pushes its neighbors on the stack.
-    def _flood_reveal(self, row: int, col: int, out_list: List[Tuple[int, int]]):
-        # Use an explicit stack for iterative depth first search (no recursion limits)
-        stack = [(row, col)]
-        # Tracks which coordinates have processed to avoid repeats.
-        visited = set()
-    
-        # Process until there are no more cells to visit.
-        while stack:
-            r, c = stack.pop()
-            # Skip cell has already been handled.
-            if (r, c) in visited:
-                continue
-            # Mark as handled so we don’t process it again.
-            visited.add((r, c))
-    
-            # Access the actual cell object.
-            cell = self.board_mgr.get_cell(r, c)
-            # Never automatically open revealed cells, flags, or mines.
-            if cell.is_revealed or cell.has_flag or cell.has_mine:
-                continue
-            
-            # Reveal this safe covered cell.
-            cell.is_revealed = True
-            # Increment global count used for win detection.
-            self.revealed_safe_cells += 1
-            out_list.append((r, c))
+    # Parameters: start (int): linear id of the starting cell (covered, unflagged, not a mine).
+    # Returns: array('i') of the linear ids revealed, in no particular order.
+    # Scanline fill over the zero cells: each popped seed grows into the longest run of covered,
+    # unflagged zeros on its row, which is revealed together with its two end cells. The rows
+    # above and below are then scanned one column past each end: numbered cells there are
+    # revealed, and each run of covered zeros is pushed as one new seed.
+    # No visited set is needed -- the revealed plane marks finished cells, and zero cells are only
+    # ever revealed as part of their own run. Mines never border a zero, so they are never reached.
+    def _flood_reveal(self, start: int) -> array:
+        board = self.board_mgr
+        n = board.grid_size
+        # Read the storage planes directly instead of going through get_cell()/neighbors().
+        flags, revealed, counts = board.flags, board.revealed, board.counts
+        discard = board.covered.discard
+        out = array("i")
+        append = out.append
+
+        if counts[start]:
+            # A numbered cell opens on its own.
+            revealed[start] = True
+            discard(start)
+            append(start)
+        else:
+            stack = [start]
+            while stack:
+                i = stack.pop()
+                # Seeds can be queued more than once; a revealed one already had its run filled.
+                if revealed[i]:
+                    continue
+                row_start = i - i % n
+                row_end = row_start + n - 1
+                # Grow the run of covered, unflagged zeros through i.
+                lo = hi = i
+                while lo > row_start and not counts[lo - 1] and not revealed[lo - 1] and not flags[lo - 1]:
+                    lo -= 1
+                while hi < row_end and not counts[hi + 1] and not revealed[hi + 1] and not flags[hi + 1]:
+                    hi += 1
+                # The run plus one cell past each end (numbered, flagged or already open).
+                left = lo - 1 if lo > row_start else lo
+                right = hi + 1 if hi < row_end else hi
+                for j in range(left, right + 1):
+                    if not revealed[j] and not flags[j]:
+                        revealed[j] = True
+                        discard(j)
+                        append(j)
+                # Every cell in the neighboring rows between left and right borders the run.
+                for shift in (-n, n):
+                    if not 0 <= row_start + shift < n * n:
+                        continue
+                    in_run = False
+                    for j in range(left + shift, right + shift + 1):
+                        if revealed[j] or flags[j]:
+                            in_run = False
+                        elif counts[j]:
+                            revealed[j] = True
+                            discard(j)
+                            append(j)
+                            in_run = False
+                        elif not in_run:
+                            # one seed per run of zeros
+                            stack.append(j)
+                            in_run = True
 
-            # Only expand when the number shown is zero.
-            if cell.neighbor_count == 0:
-                # Visit all 8 neighbors of the current cell
-                for nr, nc in self.board_mgr.neighbors(r, c):
-                    # Peek at the neighbor cell.
-                    ncell = self.board_mgr.get_cell(nr, nc)
-                     # Peek at the neighboring cell.
-                    if not ncell.is_revealed and not ncell.has_flag and not ncell.has_mine:
-                        # Schedule neighboring cell to be processed
-                        stack.append((nr, nc))
+        # Increment global count used for win detection.
+        self.revealed_safe_cells += len(out)
+        return out
     
     #Easy: The computer clicks on any hidden cell at random.
     def easy(self,reveal, setFLag):
-        untouched = self.board_mgr.untouched_cells()
-        cell_to_uncover = random.choice(untouched)
+        cell_to_uncover = self.board_mgr.random_untouched()
         #we have to set the flag state to false so that it doesn't place flags when flag_mode is on
         flag_state = setFLag(False)
         reveal(cell_to_uncover[0],cell_to_uncover[1])
@@ -228,6 +444,7 @@ class GameLogic:
     def medium(self,reveal,setFlag):
         #Iterate through the whole grid of cells
         size = len(self.board_mgr.grid)
+        revealed, flags = self.board_mgr.revealed, self.board_mgr.flags
         for row in range(size):
             for col in range(size):
                 cell = self.board_mgr.get_cell(row,col)
@@ -235,12 +452,10 @@ class GameLogic:
                     hidden = []
                     flagged = 0
                     #The next 5 lines get all the hidden and flagged cells
-                    neighboors = self.board_mgr.neighbors(row,col) #Gets list of neighboor coordinates
-                    for nrow,ncol in neighboors:
-                        #Iterates through the coordinates of each of the 8 neighboors
-                        neighboor = self.board_mgr.get_cell(nrow,ncol) 
-                        if not neighboor.is_revealed: hidden.append((nrow,ncol)) #checks if cell has been revealed
-                        if neighboor.has_flag: flagged += 1 #checks if cell is flagged
+                    for j in self.board_mgr.neighbor_ids(row * size + col): #Linear ids of the neighboors
+                        #Iterates through each of the 8 neighboors
+                        if not revealed[j]: hidden.append(divmod(j, size)) #checks if cell has been revealed
+                        if flags[j]: flagged += 1 #checks if cell is flagged
                     if len(hidden) == cell.neighbor_count:
                         #If the cell number is the same as the number of adjacent hidden tiles, flag all adjacent hidden tiles
                         for hrow,hcol in hidden:
@@ -0,0 +1,213 @@
+"""
+File: instrumentation.py
+Module: instrumentation
+Purpose:
+    Opt-in timing of the game's hot paths. enable() swaps the listed methods
+    (reveal, flood fill, mine placement, solver turns, GUI event handlers)
+    for timed wrappers; disable() puts the originals back, so nothing is
+    left in the call path while instrumentation is off. Each call records
+    its duration, the thread it ran on and, where it means something, how
+    many cells it touched (cells revealed, mines placed, moves decided).
+
+Inputs:
+    enable(targets=None, trace=True, max_events=1_000_000), disable(), reset()
+    targets: (module, "Class.method", cells) triples; cells(self, result) -> int or None
+
+Outputs:
+    stats() -> dict "Class.method" -> OpStats (count, total seconds, percentile(pct), cells)
+    summary() -> str table sorted by total time
+    write_chrome_trace(path): JSON for chrome://tracing or Perfetto, one
+        complete event per call on its thread's track (Tk loop vs. AI worker)
+
+Notes:
+    GUI methods are only wrapped when UI_renderer has already been imported,
+    so enabling instrumentation never pulls in tkinter. Wrappers look the
+    method up on the class, so callbacks bound before enable() (e.g. the
+    canvas click handler) keep calling the original.
+
+Created: 2026-10-17
+"""
+
+import functools
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# cells touched by a call, from its return value
+def _length(owner, result) -> Optional[int]:
+    return len(result)
+
+
+def _flag_delta(owner, result) -> Optional[int]:
+    return abs(result)
+
+
+DEFAULT_TARGETS: List[Tuple[str, str, Optional[Callable]]] = [
+    ("board_manager", "BoardManager.place_mines", lambda board, result: board.mine_count),
+    ("board_manager", "BoardManager.place_mine_ids", lambda board, result: board.mine_count),
+    ("board_manager", "BoardManager.compute_adjacent_mines", lambda board, result: board.grid_size ** 2),
+    ("game_logic", "GameLogic.reveal_cell", _length),
+    ("game_logic", "GameLogic.reveal_cell_ids", _length),
+    ("game_logic", "GameLogic._flood_reveal", _length),
+    ("game_logic", "GameLogic.toggle_flag", _flag_delta),
+    ("game_logic", "GameLogic.apply_moves", _length),
+    ("game_logic", "GameLogic.undo", _length),
+    ("game_logic", "GameLogic.redo", _length),
+    ("game_logic", "GameLogic.mine_probabilities", None),
+    ("AI_Solver", "AISolver.decide", _length),
+    ("AI_Solver", "AISolver.play_turn", None),
+    ("UI_renderer", "GameGUI.reveal", None),
+    ("UI_renderer", "GameGUI.addFlag", None),
+    ("UI_renderer", "GameGUI.flushCells", None),
+    ("UI_renderer", "GameGUI.pollAI", None),
+    ("UI_renderer", "GameGUI.startGame", None),
+]
+
+# modules that are wrapped only if something else imported them first
+_ONLY_IF_LOADED = {"UI_renderer"}
+
+
+# Timings of one instrumented method.
+class OpStats:
+    __slots__ = ("count", "total", "durations", "cells")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.durations = array("d")
+        self.cells = 0
+
+    # Nearest-rank percentile of the call durations, in seconds.
+    def percentile(self, pct: float) -> float:
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+
+_lock = threading.Lock()
+# (class, method name, original function) for every wrapped method
+_patched: List[Tuple[type, str, Callable]] = []
+_ops: Dict[str, OpStats] = {}
+# (name, thread id, start ns, duration ns, cells) per call, for the Chrome trace
+_events: List[Tuple[str, int, int, int, Optional[int]]] = []
+_threads: Dict[int, str] = {}
+_trace = True
+_max_events = 1_000_000
+_origin = time.perf_counter_ns()
+
+
+def _record(name: str, start: int, end: int, cells: Optional[int]):
+    with _lock:
+        op = _ops.get(name)
+        if op is None:
+            op = _ops[name] = OpStats()
+        op.count += 1
+        op.total += (end - start) / 1e9
+        op.durations.append((end - start) / 1e9)
+        if cells:
+            op.cells += cells
+        if _trace and len(_events) < _max_events:
+            tid = threading.get_ident()
+            if tid not in _threads:
+                _threads[tid] = threading.current_thread().name
+            _events.append((name, tid, start, end - start, cells))
+
+
+def _wrap(name: str, fn: Callable, cells: Optional[Callable]) -> Callable:
+    clock = time.perf_counter_ns
+
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        start = clock()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            _record(name, start, clock(), None)
+            raise
+        end = clock()
+        _record(name, start, end, None if cells is None else cells(args[0], result))
+        return result
+
+    return timed
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+# Wrap the target methods (DEFAULT_TARGETS when None). trace=False keeps only the
+# aggregate stats; max_events caps the calls kept for the Chrome trace.
+# Trace timestamps start from here unless calls recorded earlier are still kept.
+def enable(targets=None, trace: bool = True, max_events: int = 1_000_000):
+    global _trace, _max_events, _origin
+    if _patched:
+        return
+    _trace = trace
+    _max_events = max_events
+    with _lock:
+        if not _events:
+            _origin = time.perf_counter_ns()
+    for module_name, qualname, cells in (DEFAULT_TARGETS if targets is None else targets):
+        if module_name in _ONLY_IF_LOADED and module_name not in sys.modules:
+            continue
+        owner_name, method = qualname.split(".")
+        owner = getattr(importlib.import_module(module_name), owner_name)
+        original = owner.__dict__[method]
+        _patched.append((owner, method, original))
+        setattr(owner, method, _wrap(qualname, original, cells))
+
+
+# Put every original method back. Recorded data is kept until reset().
+def disable():
+    while _patched:
+        owner, method, original = _patched.pop()
+        setattr(owner, method, original)
+
+
+def reset():
+    global _origin
+    with _lock:
+        _ops.clear()
+        _events.clear()
+        _threads.clear()
+        _origin = time.perf_counter_ns()
+
+
+def stats() -> Dict[str, OpStats]:
+    with _lock:
+        return dict(_ops)
+
+
+def summary() -> str:
+    lines = [f"{'operation':<36} {'calls':>8} {'total ms':>10} {'mean ms':>9} {'p50 ms':>8} "
+             f"{'p90 ms':>8} {'p99 ms':>8} {'max ms':>8} {'cells':>10}"]
+    for name, op in sorted(stats().items(), key=lambda item: -item[1].total):
+        lines.append(f"{name:<36} {op.count:>8} {op.total * 1e3:>10.2f} {op.total / op.count * 1e3:>9.3f} "
+                     f"{op.percentile(50) * 1e3:>8.3f} {op.percentile(90) * 1e3:>8.3f} "
+                     f"{op.percentile(99) * 1e3:>8.3f} {max(op.durations) * 1e3:>8.3f} {op.cells:>10}")
+    return "\n".join(lines)
+
+
+# Chrome trace-event JSON: a complete ("X") event per recorded call, timestamps in microseconds
+# since the latest reset() or, if later, the first enable() after it, plus a name for each thread's track.
+def write_chrome_trace(path: str):
+    pid = os.getpid()
+    with _lock:
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in _threads.items()]
+        for name, tid, start, duration, cells in _events:
+            event = {"name": name, "cat": name.split(".")[0], "ph": "X", "pid": pid, "tid": tid,
+                     "ts": (start - _origin) / 1e3, "dur": duration / 1e3}
+            if cells is not None:
+                event["args"] = {"cells": cells}
+            events.append(event)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
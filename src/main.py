@@ -1,9 +1,35 @@
-from board_manager import BoardManager
-from game_logic import GameLogic
-from UI_renderer import GameGUI
+import argparse
+
+import instrumentation
 
 if __name__ == "__main__":
-    # make a board manager
-    gui = GameGUI()
-    # start Tkinter loop
-    gui.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Minesweeper")
+    parser.add_argument("--size", type=int, default=10, help="cells per side (default 10)")
+    parser.add_argument("--ui", choices=("tk", "cli"), default="tk",
+                        help="windowed Tk game (default) or the terminal front-end, which needs no display")
+    parser.add_argument("--renderer", choices=("auto", "buttons", "canvas"), default="auto",
+                        help="one button per cell, or a scrollable canvas for large boards")
+    parser.add_argument("--no-guess", action="store_true",
+                        help="deal boards that can be solved without guessing")
+    parser.add_argument("--profile", metavar="TRACE",
+                        help="time the hot paths, print a summary on exit and write a Chrome trace")
+    args = parser.parse_args()
+    # Tk is only imported for the windowed game
+    if args.ui == "tk":
+        from UI_renderer import GameGUI
+    else:
+        from cli import TerminalGame
+    # enabled once the front-end is imported (so its handlers are timed too) and before it
+    # is built (so the callbacks it binds are the timed ones)
+    if args.profile:
+        instrumentation.enable()
+    if args.ui == "tk":
+        game = GameGUI(args.size, args.renderer, args.no_guess)
+    else:
+        game = TerminalGame(args.size, no_guess=args.no_guess)
+    # start the Tkinter loop (or read terminal commands)
+    game.run()
+    if args.profile:
+        instrumentation.disable()
+        print(instrumentation.summary())
+        instrumentation.write_chrome_trace(args.profile)
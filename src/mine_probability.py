@@ -0,0 +1,208 @@
+"""
+File: mine_probability.py
+Module: MineProbability
+Purpose:
+    Exact mine probability for every covered cell, used for best-guess moves
+    by the Medium/Hard AI and for the player's hint.
+    Each frontier component's solutions (from ConstraintSolver, cached per
+    component) are tallied by mine count; the components are combined with
+    the global number of mines left, weighting every way of splitting those
+    mines between the frontier and the unconstrained interior cells by the
+    binomial count of interior placements.
+    A board without a mine count (the unbounded chunked_board board, whose
+    mine_count is infinite) has no global total to share out; every cell is
+    taken to hold a mine with the board's density instead, so components are
+    independent and the interior's probability is the density itself.
+
+Inputs:
+    board_mgr: BoardManager (or ChunkedGame.board_mgr), frontier: Frontier, flags_placed: int
+    solver: ConstraintSolver (optional; share one to share its component cache)
+
+Outputs:
+    compute(...) -> ProbabilityMap
+        .probability(row, col) -> float in [0, 1]
+        .best_guess(rng) -> ((row, col), probability) for the least likely mine
+
+Notes:
+    Flags are taken to be correct. Components over the solver's budget are
+    treated like interior cells, which is the only approximation made on
+    bounded boards. (Unbounded chunks hold a fixed number of mines each, so
+    the density prior is close to, not exactly, the true one there.)
+
+Created: 2026-10-17
+"""
+
+import random
+from math import exp, inf, lgamma
+from typing import Dict, List, Tuple
+
+from constraint_solver import ConstraintSolver
+
+
+# log of the binomial coefficient C(n, k)
+def _log_comb(n: int, k: int) -> float:
+    return lgamma(n + 1) - lgamma(k + 1) - lgamma(n - k + 1)
+
+
+# Convolve two mine-count distributions (lists indexed by number of mines).
+def _convolve(a: List[float], b: List[float]) -> List[float]:
+    out = [0.0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+class ProbabilityMap:
+    def __init__(self, board_mgr, frontier: Dict[int, float], interior: float, interior_cells: int):
+        self.board_mgr = board_mgr
+        # cell id -> mine probability, for every constrained (frontier-adjacent) covered cell
+        self.frontier = frontier
+        # shared probability of each of the `interior_cells` covered cells no number touches
+        # (inf on an unbounded board)
+        self.interior = interior
+        self.interior_cells = interior_cells
+
+    # Mine probability of (row, col): revealed cells are 0, flagged cells count as mines.
+    def probability(self, row: int, col: int) -> float:
+        i = self.board_mgr.cell_id(row, col)
+        if self.board_mgr.revealed[i]:
+            return 0.0
+        if self.board_mgr.flags[i]:
+            return 1.0
+        return self.frontier.get(i, self.interior)
+
+    # Pick an interior cell uniformly: sample the covered cells and skip frontier ones,
+    # falling back to listing the interior when it is only a small part of the covered cells.
+    def _random_interior(self, rng) -> int:
+        board = self.board_mgr
+        for _ in range(64):
+            i = board.cell_id(*board.random_untouched(rng))
+            if i not in self.frontier:
+                return i
+        return rng.choice([i for i in board.covered if i not in self.frontier])
+
+    # The covered cell least likely to be a mine, ties broken uniformly at random.
+    def best_guess(self, rng=random) -> Tuple[Tuple[int, int], float]:
+        position = self.board_mgr.position
+        best = min(self.frontier.values(), default=None)
+        if self.interior_cells and (best is None or self.interior <= best):
+            tied = [i for i, p in self.frontier.items() if p == self.interior]
+            # (an unbounded interior outweighs any number of tied frontier cells)
+            if self.interior_cells == inf or rng.randrange(self.interior_cells + len(tied)) < self.interior_cells:
+                return position(self._random_interior(rng)), self.interior
+            return position(rng.choice(tied)), self.interior
+        if best is None:
+            raise IndexError("no covered cells left")
+        tied = sorted(i for i, p in self.frontier.items() if p == best)
+        return position(rng.choice(tied)), best
+
+
+class MineProbability:
+    def __init__(self, solver: ConstraintSolver = None):
+        self.solver = solver if solver is not None else ConstraintSolver()
+
+    # Same probability for every covered cell (used when the board admits no exact answer).
+    @staticmethod
+    def _uniform(board_mgr, flags_placed: int) -> ProbabilityMap:
+        covered = len(board_mgr.covered)
+        p = min(1.0, max(0.0, (board_mgr.mine_count - flags_placed) / covered)) if covered else 0.0
+        return ProbabilityMap(board_mgr, {}, p, covered)
+
+    def compute(self, board_mgr, frontier, flags_placed: int) -> ProbabilityMap:
+        if board_mgr.mine_count == inf:
+            return self._compute_unbounded(board_mgr, frontier)
+        solver = self.solver
+        safe, mines, remaining = solver.reduce(solver.constraints(board_mgr, frontier))
+        probs: Dict[int, float] = {i: 0.0 for i in safe}
+        probs.update((i, 1.0) for i in mines)
+
+        # per solved component: mine-count distribution and per-variable hits, scaled so
+        # the largest count is 1 (keeps products of many components in float range)
+        dists: List[List[float]] = []
+        hit_tables: List[Tuple[Tuple[int, ...], Dict[int, List[float]]]] = []
+        for component in solver.components(remaining):
+            solution = solver.solve_component(component)
+            if solution is None or not solution.by_mines:
+                continue
+            scale = max(count for count, _ in solution.by_mines.values())
+            dist = [0.0] * (max(solution.by_mines) + 1)
+            hits = {}
+            for k, (count, var_hits) in solution.by_mines.items():
+                dist[k] = count / scale
+                hits[k] = [h / scale for h in var_hits]
+            dists.append(dist)
+            hit_tables.append((solution.variables, hits))
+
+        constrained = sum(len(variables) for variables, _ in hit_tables)
+        interior_cells = len(board_mgr.covered) - constrained - len(safe) - len(mines)
+        mines_left = board_mgr.mine_count - flags_placed - len(mines)
+
+        # weight of putting m mines in the interior, relative to the most likely m
+        feasible = [m for m in range(max(0, mines_left - sum(len(d) - 1 for d in dists)), mines_left + 1)
+                    if 0 <= m <= interior_cells]
+        if not feasible:
+            # the flags contradict the numbers; fall back to a uniform estimate
+            return self._uniform(board_mgr, flags_placed)
+        top = max(_log_comb(interior_cells, m) for m in feasible)
+
+        def interior_weight(frontier_mines: int) -> float:
+            m = mines_left - frontier_mines
+            if m < 0 or m > interior_cells:
+                return 0.0
+            return exp(_log_comb(interior_cells, m) - top)
+
+        # distributions of all components but one, via prefix/suffix products
+        count = len(dists)
+        prefix = [[1.0]]
+        for d in dists:
+            prefix.append(_convolve(prefix[-1], d))
+        suffix = [[1.0]] * (count + 1)
+        for c in range(count - 1, -1, -1):
+            suffix[c] = _convolve(dists[c], suffix[c + 1])
+        total = prefix[-1]
+
+        z = 0.0
+        interior_mines = 0.0
+        for k, t in enumerate(total):
+            if t:
+                w = t * interior_weight(k)
+                z += w
+                interior_mines += w * (mines_left - k)
+        if z <= 0.0:
+            return self._uniform(board_mgr, flags_placed)
+
+        for c, (variables, hits) in enumerate(hit_tables):
+            others = _convolve(prefix[c], suffix[c + 1])
+            # weight of this component holding k mines, given the rest of the board
+            rest = {k: sum(o * interior_weight(k + r) for r, o in enumerate(others) if o)
+                    for k in hits}
+            for idx, v in enumerate(variables):
+                probs[v] = min(1.0, sum(var_hits[idx] * rest[k] for k, var_hits in hits.items()) / z)
+
+        interior = interior_mines / z / interior_cells if interior_cells else 0.0
+        return ProbabilityMap(board_mgr, probs, interior, interior_cells)
+
+    # Every cell a mine with probability `density`, independently: a component's solution with
+    # k mines then weighs odds^k (odds = density / (1 - density)), and no cell a number does not
+    # touch learns anything, so the interior stays at the density.
+    def _compute_unbounded(self, board_mgr, frontier) -> ProbabilityMap:
+        solver = self.solver
+        density = board_mgr.density
+        odds = density / (1 - density)
+        safe, mines, remaining = solver.reduce(solver.constraints(board_mgr, frontier))
+        probs: Dict[int, float] = {i: 0.0 for i in safe}
+        probs.update((i, 1.0) for i in mines)
+        for component in solver.components(remaining):
+            solution = solver.solve_component(component)
+            if solution is None or not solution.by_mines:
+                continue
+            # scaled by the lightest mine count's weight (keeps odds^k in float range)
+            low = min(solution.by_mines)
+            weights = {k: odds ** (k - low) for k in solution.by_mines}
+            z = sum(count * weights[k] for k, (count, _) in solution.by_mines.items())
+            for idx, v in enumerate(solution.variables):
+                probs[v] = min(1.0, sum(var_hits[idx] * weights[k]
+                                        for k, (_, var_hits) in solution.by_mines.items()) / z)
+        return ProbabilityMap(board_mgr, probs, density, inf)
@@ -0,0 +1,113 @@
+"""
+File: move_log.py
+Module: MoveLog
+Purpose:
+    Compact append-only record of the moves that changed a game, written by
+    GameLogic. Together with the board's seed it is enough to rebuild the game
+    exactly (see replay.py), and it can be saved as a small binary trace file.
+
+Inputs:
+    append(kind, actor, index) for every effective reveal / flag toggle, undo and redo.
+
+    Move(kind, row, col, confidence): a typed move as returned by the AI solvers.
+
+Outputs:
+    iteration -> (kind, actor, linear cell index) tuples
+    save_trace(path, game) / load_trace(path) -> (grid_size, mine_count, seed, MoveLog, history)
+
+Notes:
+    Each move is one unsigned 64-bit word: index << 3 | kind << 1 | actor.
+    Trace file: a fixed little-endian header (magic, version, grid size,
+    mine count, seed, undo history length) followed by the raw words. The
+    history length matters because a replay with a shorter history evicts
+    moves the recorded game could still undo; version 1 files, written
+    before it was recorded, load with history None (the game's default).
+
+Created: 2026-10-17
+"""
+
+import struct
+import sys
+from array import array
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+# move kinds (UNDO / REDO step through GameLogic's history; their index is unused)
+REVEAL = 0
+FLAG = 1
+UNDO = 2
+REDO = 3
+
+# who made the move
+PLAYER = 0
+AI = 1
+
+
+
+# One move as decided by an AI solver: kind is REVEAL or FLAG (a flag move toggles the flag),
+# confidence the solver's probability that the move is right (None when it has no estimate).
+class Move(NamedTuple):
+    kind: int
+    row: int
+    col: int
+    confidence: Optional[float] = None
+
+
+_MAGIC = b"MSWL"
+_VERSION = 2
+_HEADER = struct.Struct("<4sHIIQI")
+# version 1: no history length
+_HEADER_V1 = struct.Struct("<4sHIIQ")
+
+
+class MoveLog:
+    def __init__(self, words: array = None):
+        self.words = words if words is not None else array("Q")
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def append(self, kind: int, actor: int, index: int):
+        self.words.append(index << 3 | kind << 1 | actor)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        for word in self.words:
+            yield (word >> 1) & 3, word & 1, word >> 3
+
+    def to_bytes(self) -> bytes:
+        words = self.words
+        if sys.byteorder != "little":
+            words = array("Q", words)
+            words.byteswap()
+        return words.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MoveLog":
+        words = array("Q")
+        words.frombytes(data)
+        if sys.byteorder != "little":
+            words.byteswap()
+        return cls(words)
+
+
+# Write the game's board parameters, seed, undo history length and move log to `path`.
+def save_trace(path: str, game) -> None:
+    board = game.board_mgr
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, board.grid_size, board.mine_count, board.seed,
+                             game.undo_stack.maxlen))
+        f.write(game.move_log.to_bytes())
+
+
+# Read a trace written by save_trace(): (grid_size, mine_count, seed, MoveLog, history),
+# history being None for version 1 traces.
+def load_trace(path: str) -> Tuple[int, int, int, MoveLog, Optional[int]]:
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = struct.unpack_from("<4sH", data)
+    if magic != _MAGIC or version not in (1, _VERSION):
+        raise ValueError("not a move-log trace file")
+    if version == 1:
+        _, _, grid_size, mine_count, seed = _HEADER_V1.unpack_from(data)
+        return grid_size, mine_count, seed, MoveLog.from_bytes(data[_HEADER_V1.size:]), None
+    _, _, grid_size, mine_count, seed, history = _HEADER.unpack_from(data)
+    return grid_size, mine_count, seed, MoveLog.from_bytes(data[_HEADER.size:]), history
@@ -0,0 +1,182 @@
+"""
+File: no_guess.py
+Module: no_guess
+Purpose:
+    Generate boards that can be solved from the first click by deduction
+    alone, so neither a player nor the Medium/Hard AI is ever forced into a
+    50/50 guess. A candidate board is an ordinary random placement; it is
+    kept only if replaying it with the constraint solver (plus the global
+    mine count) reveals every safe cell without guessing.
+
+    Checking a board costs a whole solver game, so NoGuessPool runs the
+    generator on a process pool and keeps boards ready ahead of time, keyed
+    by (grid_size, mine_count, first-click cell). GameLogic takes one on the
+    first click through its board_source hook and falls back to random
+    placement, without waiting, when none is ready.
+
+Inputs:
+    grid_size, mine_count, first-click row and column, optional seed
+
+Outputs:
+    is_solvable(grid_size, mine_ids, first_row, first_col) -> bool
+    generate(grid_size, mine_count, first_row, first_col, seed=None, max_attempts=500)
+        -> tuple of linear mine ids, or None if no attempt was solvable
+    NoGuessPool(workers=None, depth=1, seed=None): prefetch(grid_size, mine_count, cells=None),
+        take(grid_size, mine_count, row, col) -> linear mine ids or None, close()
+
+Notes:
+    The square board has eight symmetries (rotations and mirrors) and
+    deduction does not care which way round the board is, so the pool only
+    generates for one first-click cell per symmetry class and turns the
+    board to fit the cell actually clicked.
+    Pool boards do not come from the BoardManager's seed, so a saved trace
+    (move_log.save_trace) of such a game does not replay to the same board.
+
+Created: 2026-10-17
+"""
+
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from board_manager import BoardManager
+from constraint_solver import ConstraintSolver
+from game_logic import GameLogic
+from move_log import AI
+
+# (grid_size, mine_count, canonical first-click cell)
+PoolKey = Tuple[int, int, Tuple[int, int]]
+
+# boards up to this many symmetry classes of first-click cells are prefetched for every class
+PREFETCH_ALL_CLASSES = 64
+
+
+# The eight symmetries of an n x n board, as maps of (row, col).
+def _symmetries(n: int):
+    last = n - 1
+    return (
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (last - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - c, last - r),
+    )
+
+
+# Representative of (row, col)'s symmetry class: the smallest cell it can be turned into.
+def canonical_cell(n: int, row: int, col: int) -> Tuple[int, int]:
+    return min(turn(row, col) for turn in _symmetries(n))
+
+
+# Turn a layout generated for first click `source` into one for first click `target`
+# (both in the same symmetry class).
+def transform_layout(n: int, mine_ids: Iterable[int], source: Tuple[int, int],
+                     target: Tuple[int, int]) -> List[int]:
+    for turn in _symmetries(n):
+        if turn(*source) == target:
+            out = []
+            for i in mine_ids:
+                r, c = turn(*divmod(i, n))
+                out.append(r * n + c)
+            return out
+    raise ValueError("cells are not related by a board symmetry")
+
+
+# Play the board from the first click using only forced moves: whatever the constraint
+# solver proves safe is revealed and whatever it proves mined is flagged. Once every mine
+# is flagged the remaining covered cells are safe. True if that clears the board.
+def is_solvable(grid_size: int, mine_ids: Sequence[int], first_row: int, first_col: int,
+                solver: Optional[ConstraintSolver] = None) -> bool:
+    n = grid_size
+    # the layout comes from board_source, so the board's own RNG is never drawn from; a fixed
+    # seed keeps it from seeding itself off the global `random` state
+    board = BoardManager(n, len(mine_ids), compact=True, lazy_counts=True, seed=0)
+    game = GameLogic(board, board_source=lambda *click: mine_ids)
+    game.reveal_cell_ids(first_row, first_col)
+    solver = solver or ConstraintSolver()
+    while not game.is_game_over:
+        safe, mines = solver.deduce(board, game.frontier)
+        for i in mines:
+            game.toggle_flag(*divmod(i, n), AI)
+        if not safe:
+            if game.flags_placed != board.mine_count:
+                # nothing is forced: solving on would take a guess
+                return False
+            safe = list(board.covered)
+        for i in sorted(safe):
+            game.reveal_cell_ids(*divmod(i, n), AI)
+    return game.did_win
+
+
+# Draw random boards for this first click until one passes is_solvable. Attempt k's board
+# seed comes from "seed:k", so a seed always leads to the same board. Runs in pool workers.
+def generate(grid_size: int, mine_count: int, first_row: int, first_col: int,
+             seed: Optional[int] = None, max_attempts: int = 500) -> Optional[Tuple[int, ...]]:
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    solver = ConstraintSolver()
+    n = grid_size
+    for attempt in range(max_attempts):
+        board_seed = random.Random(f"{seed}:{attempt}").getrandbits(63)
+        board = BoardManager(n, mine_count, compact=True, lazy_counts=True, seed=board_seed)
+        board.place_mines(first_row, first_col)
+        mine_ids = tuple(i for i in range(n * n) if board.mines[i])
+        if is_solvable(n, mine_ids, first_row, first_col, solver):
+            return mine_ids
+    return None
+
+
+class NoGuessPool:
+    # workers: processes for the generator (default: all cores);
+    # depth: boards kept in flight or ready per key
+    def __init__(self, workers: Optional[int] = None, depth: int = 1, seed: Optional[int] = None):
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.depth = depth
+        self.rng = random.Random(seed)
+        # key -> futures of boards being generated or ready, oldest first
+        self.boards: Dict[PoolKey, deque] = {}
+
+    # keep `depth` boards queued or ready for this key
+    def _top_up(self, key: PoolKey):
+        queued = self.boards.setdefault(key, deque())
+        n, mines, (row, col) = key
+        while len(queued) < self.depth:
+            queued.append(self.executor.submit(generate, n, mines, row, col, self.rng.getrandbits(63)))
+
+    # Start generating boards for these first-click cells (default: every symmetry class on
+    # smaller boards, the corner and the centre on large ones).
+    def prefetch(self, grid_size: int, mine_count: int, cells: Optional[Iterable[Tuple[int, int]]] = None):
+        n = grid_size
+        if cells is None:
+            classes = {canonical_cell(n, r, c) for r in range((n + 1) // 2) for c in range((n + 1) // 2)}
+            cells = classes if len(classes) <= PREFETCH_ALL_CLASSES else [(0, 0), (n // 2, n // 2)]
+        for row, col in cells:
+            self._top_up((n, mine_count, canonical_cell(n, row, col)))
+
+    # A ready no-guess layout for this first click, or None at once if none has finished
+    # (the key is queued either way, so the next game of this shape is likelier to get one).
+    # Matches GameLogic's board_source signature.
+    def take(self, grid_size: int, mine_count: int, row: int, col: int) -> Optional[List[int]]:
+        source = canonical_cell(grid_size, row, col)
+        key = (grid_size, mine_count, source)
+        queued = self.boards.get(key, ())
+        layout = None
+        for future in queued:
+            if future.done():
+                queued.remove(future)
+                if future.exception() is None:
+                    layout = future.result()
+                break
+        self._top_up(key)
+        if layout is None:
+            return None
+        return transform_layout(grid_size, layout, source, (row, col))
+
+    # stop the workers and drop every board not yet taken
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+        self.boards.clear()
@@ -0,0 +1,134 @@
+"""
+File: replay.py
+Module: replay
+Purpose:
+    Headless replay engine: rebuild a game from its board seed and move log
+    (see move_log.py) by feeding the logged moves straight into GameLogic, with
+    no rendering. Used to reproduce bug reports and solver games exactly, and
+    to step through a game move by move.
+
+Inputs:
+    replay(grid_size, mine_count, seed, log, compact=False, upto=None, history=None)
+    Command line: python3 replay.py show trace.mlog [--upto N] [--board]
+                  python3 replay.py bench trace.mlog [--repeat 100] [--compact]
+                  python3 replay.py record trace.mlog [--difficulty Hard] [--size 16]
+                                  [--mines 40] [--seed 0]
+
+Outputs:
+    replay(...) -> GameLogic in the state reached after the replayed moves
+    render_text(board_mgr, show_mines=False) -> str (one text line per board row)
+
+Created: 2026-10-17
+"""
+
+import argparse
+import time
+from typing import Optional
+
+from board_manager import BoardManager
+from game_logic import UNDO_LIMIT, GameLogic
+from move_log import FLAG, REDO, REVEAL, UNDO, MoveLog, load_trace
+
+
+# Rebuild the game after the first `upto` moves of `log` (all of them by default).
+# The replayed game writes its own move log, which matches the replayed part of `log`.
+# `history` must be the recorded game's undo history length (as saved in its trace; the
+# GameLogic default when None): with a shorter one, the replayed game forgets moves the
+# recorded game could still undo, and later UNDO records do nothing.
+def replay(grid_size: int, mine_count: int, seed: int, log: MoveLog,
+           compact: bool = False, upto: Optional[int] = None, history: Optional[int] = None) -> GameLogic:
+    game = GameLogic(BoardManager(grid_size, mine_count, compact=compact, seed=seed),
+                     history=UNDO_LIMIT if history is None else history)
+    n = grid_size
+    for step, (kind, actor, index) in enumerate(log):
+        if upto is not None and step >= upto:
+            break
+        row, col = divmod(index, n)
+        if kind == REVEAL:
+            game.reveal_cell(row, col, actor)
+        elif kind == FLAG:
+            game.toggle_flag(row, col, actor)
+        elif kind == UNDO:
+            game.undo(actor)
+        elif kind == REDO:
+            game.redo(actor)
+        else:
+            raise ValueError(f"unknown move kind {kind} at step {step}")
+    return game
+
+
+# Text picture of the board: '#' covered, 'F' flag, '.' empty, digits for counts,
+# and '*' for mines that are not flagged when show_mines is set (e.g. once the game is over).
+def render_text(board_mgr, show_mines: bool = False) -> str:
+    n = board_mgr.grid_size
+    mines, flags, revealed, counts = board_mgr.mines, board_mgr.flags, board_mgr.revealed, board_mgr.counts
+    lines = []
+    for r in range(n):
+        row = []
+        for i in range(r * n, r * n + n):
+            if flags[i]:
+                row.append("F")
+            elif show_mines and mines[i]:
+                row.append("*")
+            elif not revealed[i]:
+                row.append("#")
+            else:
+                row.append(str(counts[i]) if counts[i] else ".")
+        lines.append("".join(row))
+    return "\n".join(lines)
+
+
+def _summary(game: GameLogic) -> str:
+    if game.is_game_over:
+        state = "won" if game.did_win else "lost"
+    else:
+        state = "in progress"
+    return (f"{state}: {game.revealed_safe_cells}/{game.total_safe_cells} safe cells revealed, "
+            f"{game.flags_placed} flags, {len(game.move_log)} moves")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a Minesweeper move-log trace headlessly")
+    commands = parser.add_subparsers(dest="command", required=True)
+    show = commands.add_parser("show", help="replay a trace and print the resulting state")
+    show.add_argument("trace")
+    show.add_argument("--upto", type=int, default=None, help="stop after this many moves")
+    show.add_argument("--board", action="store_true", help="print the board as text")
+    bench = commands.add_parser("bench", help="time repeated replays of a trace")
+    bench.add_argument("trace")
+    bench.add_argument("--repeat", type=int, default=100)
+    bench.add_argument("--compact", action="store_true", help="use compact board storage")
+    record = commands.add_parser("record", help="play one seeded solver game and save its trace")
+    record.add_argument("trace")
+    record.add_argument("--difficulty", choices=("Easy", "Medium", "Hard"), default="Hard")
+    record.add_argument("--size", type=int, default=16)
+    record.add_argument("--mines", type=int, default=40)
+    record.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        # imported here so replaying never pulls in the solvers
+        from simulate import play_game
+        play_game(args.difficulty, args.size, args.mines, args.seed, trace=args.trace)
+        grid_size, mine_count, seed, log, history = load_trace(args.trace)
+        print(f"saved {len(log)} moves to {args.trace}")
+        print(_summary(replay(grid_size, mine_count, seed, log, history=history)))
+        return
+
+    grid_size, mine_count, seed, log, history = load_trace(args.trace)
+    print(f"{grid_size}x{grid_size}, {mine_count} mines, seed {seed}, {len(log)} moves")
+    if args.command == "show":
+        game = replay(grid_size, mine_count, seed, log, upto=args.upto, history=history)
+        print(_summary(game))
+        if args.board:
+            print(render_text(game.board_mgr, show_mines=game.is_game_over))
+    else:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            replay(grid_size, mine_count, seed, log, compact=args.compact, history=history)
+        elapsed = time.perf_counter() - start
+        print(f"{args.repeat / elapsed:.1f} replays/s, {args.repeat * len(log) / elapsed:.0f} moves/s")
+
+
+if __name__ == "__main__":
+    main()
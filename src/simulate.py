@@ -0,0 +1,196 @@
+"""
+File: simulate.py
+Module: simulate
+Purpose:
+    Headless batch simulation of the AI solvers. Each game is played by an
+    AISolver alone against GameLogic/BoardManager (no tkinter): every turn the
+    solver decides a batch of moves and GameLogic.apply_moves makes them, from the first
+    click until it hits a mine or reveals every safe cell, and the runner
+    reports throughput, per-turn latency and win rate.
+
+Inputs:
+    Command line: python3 simulate.py [--difficulties Easy Medium Hard] [--sizes 10 16]
+                  [--densities 0.15] [--games 1000] [--seed 0] [--compact] [--no-guess]
+                  [--profile trace.json]
+
+Outputs:
+    A plain-text table: games/sec, moves/sec, p50/p90/p99 turn latency and
+    win rate per (difficulty, board size, mine density). With --profile, also
+    the instrumentation summary and a Chrome trace of every timed call.
+
+Created: 2026-10-17
+"""
+
+import argparse
+import random
+import time
+from typing import List, Optional
+
+from board_manager import BoardManager
+from game_logic import GameLogic
+from AI_Solver import AISolver
+from move_log import AI, save_trace
+from no_guess import generate
+import instrumentation
+
+DIFFICULTIES = ("Easy", "Medium", "Hard")
+
+
+# Outcome of one simulated game.
+class GameResult:
+    __slots__ = ("won", "stalled", "turns", "moves", "turn_times")
+
+    def __init__(self, won: bool, stalled: bool, turns: int, moves: int, turn_times: List[float]):
+        self.won = won
+        self.stalled = stalled
+        self.turns = turns
+        self.moves = moves
+        self.turn_times = turn_times
+
+
+# Aggregate of many games; merge() combines partial results from separate runs.
+class SimulationStats:
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.stalls = 0
+        self.turns = 0
+        self.moves = 0
+        self.elapsed = 0.0
+        self.turn_times: List[float] = []
+
+    def add(self, result: GameResult):
+        self.games += 1
+        self.wins += result.won
+        self.stalls += result.stalled
+        self.turns += result.turns
+        self.moves += result.moves
+        self.turn_times.extend(result.turn_times)
+
+    def merge(self, other: "SimulationStats"):
+        self.games += other.games
+        self.wins += other.wins
+        self.stalls += other.stalls
+        self.turns += other.turns
+        self.moves += other.moves
+        self.elapsed += other.elapsed
+        self.turn_times.extend(other.turn_times)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    # Nearest-rank percentile of the per-turn latencies, in seconds.
+    def percentile(self, pct: float) -> float:
+        if not self.turn_times:
+            return 0.0
+        ordered = sorted(self.turn_times)
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+    # games/sec and moves/sec over the wall-clock time of the run
+    def rates(self):
+        if not self.elapsed:
+            return 0.0, 0.0
+        return self.games / self.elapsed, self.moves / self.elapsed
+
+
+# Mines for a board of the given size and density, leaving room for the 3x3 first-click safe zone.
+def mines_for(grid_size: int, density: float) -> int:
+    return max(0, min(round(density * grid_size * grid_size), grid_size * grid_size - 9))
+
+
+# Play one complete game with the solver alone. A game that makes no progress for
+# `stall_limit` turns in a row (e.g. a solver stuck flagging) is stopped and counted as stalled.
+# A seed fixes both the board and the solver's choices (each has its own RNG; the global
+# `random` state is left alone), so the game can be replayed from the seed and its move log;
+# `trace` names a file to save that trace to (see move_log.save_trace).
+# no_guess=True plays a board that deduction alone can solve (no_guess.generate, from the same
+# seed); such a game's trace does not replay, since its board does not come from place_mines.
+def play_game(difficulty: str, grid_size: int, mine_count: int, seed: Optional[int] = None,
+              compact: bool = False, stall_limit: int = 3, trace: Optional[str] = None,
+              no_guess: bool = False) -> GameResult:
+    board = BoardManager(grid_size, mine_count, compact=compact, seed=seed)
+    board_source = None
+    if no_guess:
+        board_source = lambda n, mines, row, col: generate(n, mines, row, col, seed=board.seed)
+    game = GameLogic(board, board_source=board_source)
+    solver = AISolver(difficulty, board, game, seed=f"{board.seed}:solver")
+    turn_times = []
+    moves = 0
+    idle = 0
+    clock = time.perf_counter
+    while not game.is_game_over and idle < stall_limit:
+        before = (game.revealed_safe_cells, game.flags_placed)
+        start = clock()
+        turn = solver.decide()
+        game.apply_moves(turn, AI)
+        turn_times.append(clock() - start)
+        moves += len(turn)
+        idle = idle + 1 if (game.revealed_safe_cells, game.flags_placed) == before else 0
+    won = game.is_game_over and game.did_win
+    if trace:
+        save_trace(trace, game)
+    return GameResult(won, not game.is_game_over, len(turn_times), moves, turn_times)
+
+
+# Seed of game number `index` in a run started from `seed`; tournament.py uses it too, so both
+# play the same games for the same --seed. String seeding hashes the whole string, so runs
+# from different seeds (7 and 8, say) share no games and are independent samples.
+def game_seed(seed: int, index: int) -> int:
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+# Play `games` games of one configuration; game k uses game_seed(seed, k) when a seed is given.
+def run(difficulty: str, grid_size: int, mine_count: int, games: int,
+        seed: Optional[int] = None, compact: bool = False, no_guess: bool = False) -> SimulationStats:
+    stats = SimulationStats()
+    start = time.perf_counter()
+    for k in range(games):
+        stats.add(play_game(difficulty, grid_size, mine_count,
+                            None if seed is None else game_seed(seed, k), compact, no_guess=no_guess))
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+HEADER = (f"{'difficulty':>10} {'size':>5} {'mines':>6} {'games':>6} {'win %':>6} "
+          f"{'games/s':>9} {'moves/s':>10} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+
+
+def format_row(difficulty: str, grid_size: int, mine_count: int, stats: SimulationStats) -> str:
+    games_per_s, moves_per_s = stats.rates()
+    return (f"{difficulty:>10} {grid_size:>5} {mine_count:>6} {stats.games:>6} {stats.win_rate * 100:>6.1f} "
+            f"{games_per_s:>9.1f} {moves_per_s:>10.0f} {stats.percentile(50) * 1e3:>8.3f} "
+            f"{stats.percentile(90) * 1e3:>8.3f} {stats.percentile(99) * 1e3:>8.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless AI solver simulation")
+    parser.add_argument("--difficulties", nargs="+", choices=DIFFICULTIES, default=list(DIFFICULTIES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.15])
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--compact", action="store_true", help="use compact board storage")
+    parser.add_argument("--no-guess", action="store_true", help="play boards solvable without guessing")
+    parser.add_argument("--profile", metavar="TRACE", help="time the hot paths and write a Chrome trace here")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        instrumentation.enable()
+    print(HEADER)
+    for difficulty in args.difficulties:
+        for size in args.sizes:
+            for density in args.densities:
+                mines = mines_for(size, density)
+                stats = run(difficulty, size, mines, args.games, args.seed, args.compact, args.no_guess)
+                print(format_row(difficulty, size, mines, stats))
+    if args.profile:
+        instrumentation.disable()
+        print()
+        print(instrumentation.summary())
+        instrumentation.write_chrome_trace(args.profile)
+
+
+if __name__ == "__main__":
+    main()
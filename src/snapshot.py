@@ -0,0 +1,244 @@
+"""
+File: snapshot.py
+Module: snapshot
+Purpose:
+    Save a game's state (BoardManager planes plus GameLogic counters) to a
+    compact binary snapshot and load it back, so long or very large games
+    can be suspended, shipped and analyzed. Mines, flags and revealed cells
+    are stored as bit-planes, one bit per cell, cut into tiles of
+    tile_cells consecutive cells. The file is append-only: a later save
+    writes only the tiles that changed since the previous one, which the
+    writer learns from the game's change notifications (reveals, flags,
+    undo/redo), so a save costs the tiles touched, not the board.
+
+Inputs:
+    save_snapshot(path, game, tile_cells=65536) / SnapshotWriter(path, game, tile_cells=65536)
+    load_snapshot(path, compact=True) / resume_snapshot(path, compact=True)
+
+Outputs:
+    SnapshotWriter.save() -> number of tiles appended; SnapshotWriter.close() stops tracking
+    load_snapshot(...) -> GameLogic in the saved state (lazy neighbor counts; empty move log)
+    resume_snapshot(...) -> SnapshotWriter whose .game is the loaded game and whose save()
+        keeps appending to the same file
+
+Notes:
+    Layout (little-endian): header "<4sHIIIQ" (b"MSWS", version, grid size,
+    mine count, tile_cells, seed), then records, each a "<BI" head:
+      TILE  (1, tile index) + mines, flags, revealed bits of the tile, tile_cells / 8 bytes each
+      STATE (2, state bits)  no payload; closes a save
+    A tile's latest record wins. Records after the last STATE belong to a save
+    that did not finish and are ignored. Bits are stored most significant
+    first, so packing and unpacking are single int/format conversions.
+    The loader memory-maps the file, walks the record heads to find each
+    tile's latest bits and expands whole tiles at a time; nothing is parsed
+    cell by cell, and neighbor counts are left to be computed when read.
+
+Created: 2026-10-17
+"""
+
+import mmap
+import struct
+from array import array
+
+from board_manager import BoardManager
+from covered_index import CoveredIndex
+from game_logic import GameLogic
+
+_MAGIC = b"MSWS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHIIIQ")
+_RECORD = struct.Struct("<BI")
+
+# record kinds
+TILE = 1
+STATE = 2
+
+# STATE bits
+_MINES_PLACED = 1
+_GAME_OVER = 2
+_WON = 4
+
+# cells per tile by default (8 KiB per plane)
+TILE_CELLS = 1 << 16
+
+# byte-per-cell (0 or not) <-> ASCII binary digits, for int(..., 2) and format(..., "b")
+_TO_DIGITS = b"0" + b"1" * 255
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+# One bit per cell, first cell in the top bit of the first byte. len(cells) is a multiple of 8.
+def pack_bits(cells: bytes) -> bytes:
+    return int(cells.translate(_TO_DIGITS), 2).to_bytes(len(cells) // 8, "big")
+
+
+# Back to one 0/1 byte per cell, for the first `count` cells.
+def unpack_bits(packed: bytes, count: int) -> bytes:
+    bits = format(int.from_bytes(packed, "big"), f"0{len(packed) * 8}b")
+    return bits.encode("ascii").translate(_FROM_DIGITS)[:count]
+
+
+# Linear ids of the cells whose byte is 1.
+def _ids(cells: bytes) -> array:
+    out = array("i")
+    i = cells.find(1)
+    while i != -1:
+        out.append(i)
+        i = cells.find(1, i + 1)
+    return out
+
+
+def _state_bits(game) -> int:
+    return ((0 if game.is_first_click else _MINES_PLACED) | (_GAME_OVER if game.is_game_over else 0)
+            | (_WON if game.did_win else 0))
+
+
+class SnapshotWriter:
+    # Start the snapshot file with a full save of `game`; with `resume_at` (a byte offset just
+    # past a complete save of this game, see resume_snapshot) keep appending to the file instead.
+    def __init__(self, path: str, game, tile_cells: int = TILE_CELLS, resume_at: int = None):
+        if tile_cells <= 0 or tile_cells % 8:
+            raise ValueError("tile_cells must be a positive multiple of 8")
+        self.path = path
+        self.game = game
+        self.tile_cells = tile_cells
+        # tiles changed since the last save (every tile when `everything` is set)
+        self.dirty = set()
+        self.everything = resume_at is None
+        game.watchers.append(self._changed)
+        if resume_at is None:
+            board = game.board_mgr
+            with open(path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, board.grid_size, board.mine_count, tile_cells,
+                                     board.seed))
+            # the last STATE written
+            self.state = None
+            self.save()
+        else:
+            # drop the records of a save that did not finish
+            with open(path, "r+b") as f:
+                f.truncate(resume_at)
+            self.state = _state_bits(game)
+
+    # GameLogic watcher: mark the tiles holding the changed cells
+    def _changed(self, ids):
+        if ids is None:
+            self.everything = True
+        elif not self.everything:
+            tile_cells = self.tile_cells
+            self.dirty.update(i // tile_cells for i in ids)
+
+    # Stop tracking the game's changes (save() then only writes state changes).
+    def close(self):
+        if self._changed in self.game.watchers:
+            self.game.watchers.remove(self._changed)
+
+    # Packed mines, flags and revealed bits of one tile.
+    def _pack_tile(self, tile: int) -> bytes:
+        board = self.game.board_mgr
+        start = tile * self.tile_cells
+        stop = min(start + self.tile_cells, board.grid_size ** 2)
+        pad = bytes(self.tile_cells - (stop - start))
+        return b"".join(pack_bits(bytes(plane[start:stop]) + pad)
+                        for plane in (board.mines, board.flags, board.revealed))
+
+    # Append the tiles that changed since the last save, then a STATE record.
+    def save(self) -> int:
+        if self.everything:
+            tiles = range(-(-self.game.board_mgr.grid_size ** 2 // self.tile_cells))
+        else:
+            tiles = sorted(self.dirty)
+        records = [_RECORD.pack(TILE, tile) + self._pack_tile(tile) for tile in tiles]
+        self.dirty.clear()
+        self.everything = False
+        state = _state_bits(self.game)
+        if records or state != self.state:
+            records.append(_RECORD.pack(STATE, state))
+            self.state = state
+            with open(self.path, "ab") as f:
+                f.write(b"".join(records))
+        return max(0, len(records) - 1)
+
+
+# Write a full snapshot of `game`; the returned writer appends later changes with save().
+def save_snapshot(path: str, game, tile_cells: int = TILE_CELLS) -> SnapshotWriter:
+    return SnapshotWriter(path, game, tile_cells)
+
+
+# Rebuild the game saved in `path`. Covered cells, flag bookkeeping and the frontier are
+# derived from the planes with whole-board int operations, not per-cell scans.
+def load_snapshot(path: str, compact: bool = True) -> GameLogic:
+    return _read(path, compact)[0]
+
+
+# Load the game saved in `path` and return a writer that appends its later changes to the
+# same file (after dropping any unfinished save); the game is the writer's .game.
+def resume_snapshot(path: str, compact: bool = True) -> SnapshotWriter:
+    game, tile_cells, end = _read(path, compact)
+    return SnapshotWriter(path, game, tile_cells, resume_at=end)
+
+
+# (game, tile_cells, byte offset just past the last complete save)
+def _read(path: str, compact: bool):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if len(data) < _HEADER.size:
+            raise ValueError("not a board snapshot file")
+        magic, version, n, mine_count, tile_cells, seed = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a board snapshot file")
+        plane_bytes = tile_cells // 8
+        # tile -> offset of its latest committed bits
+        latest, pending, state, end = {}, {}, None, None
+        pos = _HEADER.size
+        while pos + _RECORD.size <= len(data):
+            kind, value = _RECORD.unpack_from(data, pos)
+            pos += _RECORD.size
+            if kind == TILE:
+                if pos + 3 * plane_bytes > len(data):
+                    break
+                pending[value] = pos
+                pos += 3 * plane_bytes
+            elif kind == STATE:
+                latest.update(pending)
+                pending.clear()
+                state = value
+                end = pos
+            else:
+                raise ValueError(f"corrupt snapshot record at byte {pos - _RECORD.size}")
+        if state is None:
+            raise ValueError("snapshot holds no complete save")
+
+        board = BoardManager(n, mine_count, compact=compact, seed=seed, lazy_counts=True)
+        cells = n * n
+        for tile, offset in latest.items():
+            start = tile * tile_cells
+            stop = min(start + tile_cells, cells)
+            for k, plane in enumerate((board.mines, board.flags, board.revealed)):
+                bits = data[offset + k * plane_bytes:offset + (k + 1) * plane_bytes]
+                plane[start:stop] = unpack_bits(bits, stop - start)
+
+    game = GameLogic(board)
+    game.is_first_click = not state & _MINES_PLACED
+    game.is_game_over = bool(state & _GAME_OVER)
+    game.did_win = bool(state & _WON)
+    revealed = bytes(board.revealed[0:cells])
+    flags = bytes(board.flags[0:cells])
+    # a lost game's mine is never marked revealed, so every revealed cell is safe
+    game.revealed_safe_cells = revealed.count(1)
+    game.restore_flags(_ids(flags))
+
+    # Planes as ints with one byte (0 or 1) per cell, cell i in byte i: bitwise operations
+    # then act on all cells at once, and shifting by 8 bits moves one cell along.
+    ones = int.from_bytes(b"\x01" * cells, "little")
+    shown = int.from_bytes(revealed, "little")
+    hidden = shown ^ ones
+    board.covered = CoveredIndex.from_mask(
+        ((shown | int.from_bytes(flags, "little")) ^ ones).to_bytes(cells, "little"))
+    # revealed cells next to a hidden one: spread `hidden` one cell sideways (never across
+    # a row end) and then one row up and down
+    not_first = int.from_bytes((b"\x00" + b"\x01" * (n - 1)) * n, "little")
+    not_last = int.from_bytes((b"\x01" * (n - 1) + b"\x00") * n, "little")
+    spread = hidden | ((hidden << 8) & not_first) | ((hidden >> 8) & not_last)
+    spread |= (spread << 8 * n) | (spread >> 8 * n)
+    border = (shown & spread).to_bytes(cells, "little")
+    game.frontier.rebuild(_ids(border))
+    return game, tile_cells, end
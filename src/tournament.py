@@ -0,0 +1,120 @@
+"""
+File: tournament.py
+Module: tournament
+Purpose:
+    Evaluate AI solver difficulties at scale by spreading headless games
+    (simulate.play_game) over a process pool. Games are cut into fixed-size
+    chunks of game indices and every game's seed is derived from the master
+    seed and its index alone (simulate.game_seed, so the games are the ones
+    simulate.py plays for the same seed), and results are identical for any
+    worker count.
+    Chunk results stream back as they finish and are merged into aggregate
+    statistics: win rate with a 95% Wilson confidence interval, mean and
+    percentile turn time, and throughput.
+
+Inputs:
+    Command line: python3 tournament.py [--difficulties Medium Hard] [--sizes 16]
+                  [--densities 0.15] [--games 10000] [--seed 0] [--workers N] [--chunk 100]
+
+Outputs:
+    A plain-text table per (difficulty, board size, mine density).
+
+Created: 2026-10-17
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import sqrt
+from typing import Optional, Tuple
+
+from simulate import DIFFICULTIES, SimulationStats, game_seed, mines_for, play_game
+
+
+# 95% Wilson score interval for `wins` out of `games`.
+def wilson_interval(wins: int, games: int, z: float = 1.96) -> Tuple[float, float]:
+    if not games:
+        return 0.0, 0.0
+    p = wins / games
+    denom = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denom
+    half = z * sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+# Worker entry point: play games [start, stop) of the tournament and return their merged stats.
+def play_chunk(difficulty: str, grid_size: int, mine_count: int, master_seed: int,
+               start: int, stop: int, compact: bool = False) -> SimulationStats:
+    stats = SimulationStats()
+    began = time.perf_counter()
+    for index in range(start, stop):
+        stats.add(play_game(difficulty, grid_size, mine_count, game_seed(master_seed, index), compact))
+    stats.elapsed = time.perf_counter() - began
+    return stats
+
+
+# Play `games` games of one configuration across `workers` processes (1 = in this process).
+# `elapsed` of the result is the tournament's wall-clock time.
+def run_tournament(difficulty: str, grid_size: int, mine_count: int, games: int, master_seed: int,
+                   workers: Optional[int] = None, chunk: int = 100, compact: bool = False,
+                   progress=None) -> SimulationStats:
+    workers = workers or os.cpu_count() or 1
+    chunks = [(start, min(start + chunk, games)) for start in range(0, games, chunk)]
+    total = SimulationStats()
+    began = time.perf_counter()
+    if workers == 1:
+        for start, stop in chunks:
+            total.merge(play_chunk(difficulty, grid_size, mine_count, master_seed, start, stop, compact))
+            if progress:
+                progress(total)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = [pool.submit(play_chunk, difficulty, grid_size, mine_count, master_seed,
+                                   start, stop, compact)
+                       for start, stop in chunks]
+            for future in as_completed(pending):
+                total.merge(future.result())
+                if progress:
+                    progress(total)
+    total.elapsed = time.perf_counter() - began
+    return total
+
+
+HEADER = (f"{'difficulty':>10} {'size':>5} {'mines':>6} {'games':>7} {'win %':>6} {'95% CI':>15} "
+          f"{'mean ms':>8} {'p99 ms':>8} {'games/s':>9} {'stalls':>6}")
+
+
+def format_row(difficulty: str, grid_size: int, mine_count: int, stats: SimulationStats) -> str:
+    low, high = wilson_interval(stats.wins, stats.games)
+    mean_ms = sum(stats.turn_times) / len(stats.turn_times) * 1e3 if stats.turn_times else 0.0
+    games_per_s, _ = stats.rates()
+    return (f"{difficulty:>10} {grid_size:>5} {mine_count:>6} {stats.games:>7} {stats.win_rate * 100:>6.2f} "
+            f"{f'{low * 100:.2f}-{high * 100:.2f}':>15} {mean_ms:>8.3f} {stats.percentile(99) * 1e3:>8.3f} "
+            f"{games_per_s:>9.1f} {stats.stalls:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-process AI solver tournament")
+    parser.add_argument("--difficulties", nargs="+", choices=DIFFICULTIES, default=["Medium", "Hard"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0.15])
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0, help="master seed")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=100, help="games per work unit")
+    parser.add_argument("--compact", action="store_true", help="use compact board storage")
+    args = parser.parse_args(argv)
+
+    print(HEADER)
+    for difficulty in args.difficulties:
+        for size in args.sizes:
+            for density in args.densities:
+                mines = mines_for(size, density)
+                stats = run_tournament(difficulty, size, mines, args.games, args.seed,
+                                       args.workers, args.chunk, args.compact)
+                print(format_row(difficulty, size, mines, stats))
+
+
+if __name__ == "__main__":
+    main()
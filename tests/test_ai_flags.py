@@ -0,0 +1,43 @@
+"""
+File: test_ai_flags.py
+Purpose:
+    Check that the Medium and Hard rules never spend a turn on a flag when no
+    flags are left (a wrong player flag can use the last one up), and that
+    the frontier cells they could not act on stay marked for the next turn.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from AI_Solver import AISolver
+from board_manager import BoardManager
+from game_logic import GameLogic
+from move_log import FLAG
+
+
+# 5x5 board with its one mine in the corner at (0, 0) and the only flag on the safe cell (4, 4)
+def out_of_flags():
+    board = BoardManager(5, 1)
+    game = GameLogic(board, board_source=lambda n, mines, row, col: [0])
+    game.toggle_flag(4, 4)
+    game.reveal_cell_ids(2, 2)
+    return board, game
+
+
+@pytest.mark.parametrize("difficulty", ["Medium", "Hard"])
+def test_no_flag_without_flags_left(difficulty):
+    board, game = out_of_flags()
+    # the three cells around the mine all say "flag (0, 0)"
+    waiting = {1, 5, 6}
+    assert waiting <= game.frontier.dirty
+    moves = AISolver(difficulty, board, game, seed=0).decide()
+    assert moves and all(move.kind != FLAG for move in moves)
+    assert waiting <= game.frontier.dirty
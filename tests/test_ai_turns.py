@@ -0,0 +1,67 @@
+"""
+File: test_ai_turns.py
+Purpose:
+    Check that a solver turn never loses frontier cells: cancelling it part
+    way, or dropping the moves it returns, leaves every dirty cell that could
+    still need a look in the frontier's dirty set.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from AI_Solver import AISolver
+from board_manager import BoardManager
+from game_logic import GameLogic
+
+
+# threading.Event stand-in that reports "set" from its `after`-th check on
+class CancelAfter:
+    def __init__(self, after):
+        self.checks = 0
+        self.after = after
+
+    def is_set(self):
+        self.checks += 1
+        return self.checks > self.after
+
+
+def opened(seed):
+    game = GameLogic(BoardManager(16, 40, seed=seed))
+    game.reveal_cell_ids(8, 8)
+    return game
+
+
+@pytest.mark.parametrize("difficulty", ["Medium", "Hard"])
+def test_cancelled_turn_keeps_dirty_cells(difficulty):
+    cancelled = 0
+    for seed in range(10):
+        for after in (1, 2, 5, 20):
+            game = opened(seed)
+            dirty = set(game.frontier.dirty)
+            if not AISolver(difficulty, game.board_mgr, game, seed=0).decide(CancelAfter(after)):
+                cancelled += 1
+                assert game.frontier.dirty == dirty
+    assert cancelled
+
+
+@pytest.mark.parametrize("difficulty", ["Medium", "Hard"])
+def test_dropped_moves_are_not_forgotten(difficulty):
+    for seed in range(10):
+        game = opened(seed)
+        if game.is_game_over:
+            continue
+        board = game.board_mgr
+        moves = AISolver(difficulty, board, game, seed=0).decide()
+        # every certain move still has a dirty frontier cell next to it to be found from again
+        for move in moves:
+            if move.confidence == 1.0:
+                i = move.row * board.grid_size + move.col
+                assert game.frontier.dirty.intersection(board.neighbor_ids(i)), (seed, move)
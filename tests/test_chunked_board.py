@@ -0,0 +1,92 @@
+"""
+File: test_chunked_board.py
+Purpose:
+    Check the unbounded board: its flood fill opens exactly what a plain
+    breadth-first reference opens, the solver view's neighbor ids match the
+    board's neighbors, the incremental frontier matches a fresh scan, and
+    the Hard solver plays it without a wrong certain move.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from collections import deque
+
+import pytest
+
+from AI_Solver import AISolver
+from chunked_board import ChunkedGame
+from move_log import FLAG
+
+
+# cells a reveal of (row, col) must open: the zero region and its numbered edge, skipping flags
+def reference_cascade(board, row, col):
+    opened, queue = {(row, col)}, deque([(row, col)])
+    while queue:
+        r, c = queue.popleft()
+        if board.count(r, c) == 0:
+            for cell in board.neighbors(r, c):
+                if cell not in opened and not board.is_revealed(*cell) and not board.is_flagged(*cell):
+                    opened.add(cell)
+                    queue.append(cell)
+    return opened
+
+
+# frontier entries worked out from scratch over every revealed cell
+def scanned_frontier(game):
+    view, board = game.board_mgr, game.board
+    cs = board.chunk_size
+    cells = {}
+    for key, plane in board.revealed.items():
+        for k in range(cs * cs):
+            if plane[k] and view.counts[(key, k)]:
+                around = view.neighbor_ids((key, k))
+                hidden = sum(1 for j in around if not view.revealed[j])
+                flagged = sum(1 for j in around if view.flags[j])
+                if hidden:
+                    cells[(key, k)] = [hidden, flagged]
+    return cells
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_flood_matches_reference(seed):
+    game = ChunkedGame(0.12, seed=seed, chunk_size=8)
+    game.reveal_cell(0, 0)
+    for row, col in [(40, -30), (-25, 17), (60, 60)]:
+        game.toggle_flag(row + 1, col)
+        if game.board.is_mine(row, col) or game.board.is_revealed(row, col):
+            continue
+        expected = reference_cascade(game.board, row, col)
+        assert set(game.reveal_cell(row, col)) == expected
+    assert game.frontier.cells == scanned_frontier(game)
+
+
+def test_neighbor_ids_match_neighbors():
+    view = ChunkedGame(0.1, seed=0, chunk_size=4).board_mgr
+    for row in range(-9, 9):
+        for col in range(-9, 9):
+            cell = view.cell_id(row, col)
+            assert view.position(cell) == (row, col)
+            assert sorted(view.neighbor_ids(cell)) == sorted(view.cell_id(r, c)
+                                                             for r, c in view.board.neighbors(row, col))
+
+
+def test_hard_plays_unbounded_board():
+    for seed in range(4):
+        game = ChunkedGame(0.18, seed=seed, chunk_size=16)
+        ai = AISolver("Hard", game.board_mgr, game, seed=seed)
+        for _ in range(400):
+            if game.is_game_over:
+                break
+            moves = ai.decide()
+            for move in moves:
+                if move.confidence == 1.0:
+                    assert game.board.is_mine(move.row, move.col) == (move.kind == FLAG)
+            game.apply_moves(moves)
+        assert game.frontier.cells == scanned_frontier(game)
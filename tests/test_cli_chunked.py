@@ -0,0 +1,41 @@
+"""
+File: test_cli_chunked.py
+Purpose:
+    Check that the terminal front-end plays the unbounded board: a reveal
+    opens cells, the view moves to far-off (negative) coordinates, a mine
+    ends the game, and a solver takes its turns there.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cli import ChunkedTerminalGame
+
+
+def test_chunked_game_in_terminal():
+    out = []
+    game = ChunkedTerminalGame(8, 0.15, seed=3, write=out.append)
+    game.run(["5 5", "f 1 1", "g -40 -40"])
+    assert game.game.revealed_safe_cells > 1
+    assert game.game.flags_placed == 1
+    assert out[-1].split("\n")[game.grid_size // 2 + 3].lstrip().startswith("-40 ")
+    board = game.game.board
+    mine = next((r, c) for r in range(-50, -30) for c in range(-50, -30) if board.is_mine(r, c))
+    game.command(f"{mine[0] + 1} {mine[1] + 1}")
+    assert game.game.is_game_over
+    assert out[-2] == "You have hit a mine. Game over."
+
+
+def test_chunked_game_against_hard():
+    out = []
+    game = ChunkedTerminalGame(8, 0.15, seed=3, write=out.append, ai="Hard")
+    game.run(["5 5", "h"])
+    assert out[-3].startswith("AI: ")
+    assert game.game.flags_placed or game.game.revealed_safe_cells > 54
+    assert out[-1].startswith("Safest cell:")
@@ -0,0 +1,101 @@
+"""
+File: test_constraint_solver.py
+Purpose:
+    Check ConstraintSolver.deduce against brute force on 4x4 boards: every
+    mine layout of the constrained cells is tried, and deduce must return
+    exactly the cells that are safe (or mines) in all layouts the revealed
+    numbers allow. Also check that the component cache recomputes a changed
+    component and evicts its oldest entry.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import sys
+from itertools import product
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from board_manager import BoardManager
+from constraint_solver import ConstraintSolver
+from game_logic import GameLogic
+
+
+# A 4x4 game on a random layout of `mines` mines, with the first click and a few more
+# safe cells revealed and some mines flagged.
+def random_position(seed, mines):
+    rng = random.Random(seed)
+    layout = []
+
+    def source(n, count, row, col):
+        layout.extend(rng.sample([i for i in range(n * n) if i != row * n + col], count))
+        return layout
+
+    game = GameLogic(BoardManager(4, mines, seed=seed), board_source=source)
+    board = game.board_mgr
+    game.reveal_cell(rng.randrange(4), rng.randrange(4))
+    for _ in range(rng.randint(0, 3)):
+        safe = [i for i in board.covered if not board.mines[i]]
+        if game.is_game_over or not safe:
+            break
+        game.reveal_cell(*divmod(rng.choice(safe), 4))
+    for i in layout:
+        if rng.random() < 0.3 and not board.revealed[i]:
+            game.toggle_flag(*divmod(i, 4))
+    return game
+
+
+# cells no revealed number touches are left out: only the numbers constrain deduce
+def forced_cells(board):
+    revealed = [i for i in range(16) if board.revealed[i]]
+    unknown = sorted({j for i in revealed for j in board.neighbor_ids(i)
+                      if not board.revealed[j] and not board.flags[j]})
+    always = {j: set() for j in unknown}
+    for values in product((0, 1), repeat=len(unknown)):
+        mine = dict(zip(unknown, values))
+        if all(board.counts[i] == sum(1 if board.flags[j] else mine.get(j, 0)
+                                      for j in board.neighbor_ids(i)) for i in revealed):
+            for j in unknown:
+                always[j].add(mine[j])
+    safe = {j for j, seen in always.items() if seen == {0}}
+    mines = {j for j, seen in always.items() if seen == {1}}
+    return safe, mines
+
+
+@pytest.mark.parametrize("mines", [2, 3, 4, 6])
+@pytest.mark.parametrize("seed", range(15))
+def test_deduce_matches_brute_force(mines, seed):
+    game = random_position(seed, mines)
+    if game.is_game_over:
+        return
+    board = game.board_mgr
+    safe, found_mines = ConstraintSolver().deduce(board, game.frontier)
+    expected_safe, expected_mines = forced_cells(board)
+    assert safe == expected_safe
+    assert found_mines == expected_mines
+    assert not any(board.mines[i] for i in safe)
+    assert all(board.mines[i] for i in found_mines)
+
+
+def test_cache_recomputes_changed_component():
+    solver = ConstraintSolver(cache_size=2)
+    component = [(frozenset({1, 2, 3}), 1), (frozenset({3, 4}), 1)]
+    first = solver.solve_component(component)
+    assert solver.solve_component(list(reversed(component))) is first
+
+    # same cells, one more mine: a new key, solved afresh
+    changed = [(frozenset({1, 2, 3}), 2), (frozenset({3, 4}), 1)]
+    second = solver.solve_component(changed)
+    assert second is not first
+    assert second.totals() == (3, [2, 2, 2, 1])
+    assert first.totals() == (3, [1, 1, 1, 2])
+
+    # a third component pushes out the least recently used one
+    solver.solve_component([(frozenset({7, 8}), 1)])
+    assert solver.solve_component(changed) is second
+    assert solver.solve_component(component) is not first
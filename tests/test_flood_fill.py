@@ -0,0 +1,106 @@
+"""
+File: test_flood_fill.py
+Purpose:
+    Check the scanline flood fill (GameLogic._flood_reveal) against a plain
+    depth-first reference on object, compact and lazy-count boards, with
+    player flags in the way, and check the state kept alongside it after
+    every reveal: the covered index, the frontier, the flag mismatch count
+    and the revealed-cell counter.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from board_manager import BoardManager
+from frontier import Frontier
+from game_logic import GameLogic
+
+LAYOUTS = [
+    {"compact": False, "lazy_counts": False},
+    {"compact": True, "lazy_counts": False},
+    {"compact": False, "lazy_counts": True},
+    {"compact": True, "lazy_counts": True},
+]
+
+
+def mine_count_around(board, i):
+    return sum(1 for j in board.neighbor_ids(i) if board.mines[j])
+
+
+# cells a reveal of `start` must open when the cells in `shown` are already open:
+# depth-first over zero cells, stopping at flags
+def reference_reveal(board, start, shown):
+    opened, stack = {start}, [start]
+    while stack:
+        i = stack.pop()
+        if mine_count_around(board, i):
+            continue
+        for j in board.neighbor_ids(i):
+            if j not in opened and j not in shown and not board.flags[j]:
+                opened.add(j)
+                stack.append(j)
+    return opened
+
+
+def check_state(game):
+    board = game.board_mgr
+    cells = board.grid_size ** 2
+    revealed = {i for i in range(cells) if board.revealed[i]}
+    flagged = {i for i in range(cells) if board.flags[i]}
+    assert set(board.covered) == set(range(cells)) - revealed - flagged
+    assert len(board.covered) == cells - len(revealed) - len(flagged)
+    assert game.revealed_safe_cells == len(revealed)
+    assert game.mismatches == sum(1 for i in range(cells) if bool(board.mines[i]) != (i in flagged))
+    for i in revealed:
+        assert board.counts[i] == mine_count_around(board, i)
+    scanned = Frontier(board)
+    scanned.rebuild()
+    assert game.frontier.cells == scanned.cells
+
+
+@pytest.mark.parametrize("layout", LAYOUTS, ids=["object", "compact", "object-lazy", "compact-lazy"])
+@pytest.mark.parametrize("seed", range(9))
+def test_flood_matches_reference(layout, seed):
+    rng = random.Random(seed)
+    n = rng.choice([1, 2, 5, 12, 23, 30])
+    mines = rng.randint(0, max(0, n * n - 9) // 4) if seed % 3 == 0 else max(0, n * n - 9) // 5
+    game = GameLogic(BoardManager(n, mines, seed=seed, **layout))
+    board = game.board_mgr
+    # flags on random cells, some before the first click
+    for _ in range(rng.randint(0, n)):
+        game.toggle_flag(rng.randrange(n), rng.randrange(n))
+    for _ in range(40):
+        if game.is_game_over:
+            break
+        row, col = board.random_untouched(rng)
+        i = row * n + col
+        # keep playing after a mine now and then would end it
+        if not game.is_first_click and board.mines[i] and rng.random() < 0.9:
+            continue
+        before = {j for j in range(n * n) if board.revealed[j]}
+        if game.is_first_click:
+            # mines go in on the first reveal, so the reference can only be worked out after it
+            opened = set(game.reveal_cell_ids(row, col))
+            after = {j for j in range(n * n) if board.revealed[j]}
+            assert opened == after - before
+            assert opened == reference_reveal(board, i, before)
+        elif board.mines[i]:
+            assert list(game.reveal_cell_ids(row, col)) == [i]
+            assert game.is_game_over and not game.did_win
+            continue
+        else:
+            expected = reference_reveal(board, i, before)
+            assert set(game.reveal_cell_ids(row, col)) == expected
+        check_state(game)
+        if rng.random() < 0.5:
+            game.toggle_flag(rng.randrange(n), rng.randrange(n))
+            check_state(game)
@@ -0,0 +1,53 @@
+"""
+File: test_mine_edits.py
+Purpose:
+    Check that BoardManager.add_mine / remove_mine keep every neighbor count
+    equal to a full compute_adjacent_mines() recount, on object, compact and
+    lazy-count boards, after random sequences of edits.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from board_manager import BoardManager
+
+LAYOUTS = [
+    {"compact": False, "lazy_counts": False},
+    {"compact": True, "lazy_counts": False},
+    {"compact": False, "lazy_counts": True},
+    {"compact": True, "lazy_counts": True},
+]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS, ids=["object", "compact", "object-lazy", "compact-lazy"])
+@pytest.mark.parametrize("seed", range(6))
+def test_incremental_counts_match_recount(layout, seed):
+    rng = random.Random(seed)
+    n = rng.choice([1, 2, 7, 16])
+    board = BoardManager(n, (n * n) // 8, seed=seed, **layout)
+    board.place_mines(rng.randrange(n), rng.randrange(n))
+    for _ in range(4 * n * n):
+        row, col = rng.randrange(n), rng.randrange(n)
+        if rng.random() < 0.5:
+            board.add_mine(row, col)
+        else:
+            board.remove_mine(row, col)
+        # read a few counts between edits so lazy boards have cached values to forget
+        board.counts[rng.randrange(n * n)]
+
+    mines = [board.mines[i] for i in range(n * n)]
+    assert board.mine_count == sum(1 for m in mines if m)
+    reference = BoardManager(n, 0, compact=True)
+    for i, m in enumerate(mines):
+        reference.mines[i] = m
+    reference.compute_adjacent_mines()
+    assert [board.counts[i] for i in range(n * n)] == [reference.counts[i] for i in range(n * n)]
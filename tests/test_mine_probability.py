@@ -0,0 +1,74 @@
+"""
+File: test_mine_probability.py
+Purpose:
+    Check MineProbability against brute force on 4x4 boards: every layout of
+    the remaining mines over the covered, unflagged cells is tried, and each
+    cell's probability must equal the share of the layouts consistent with
+    the revealed numbers that put a mine on it. One MineProbability follows
+    each game, so cached components are checked as the board changes.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import sys
+from itertools import combinations
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from board_manager import BoardManager
+from game_logic import GameLogic
+from mine_probability import MineProbability
+
+
+# flags are taken to be correct, as MineProbability does
+def exact_marginals(board, flags_placed):
+    revealed = [i for i in range(16) if board.revealed[i]]
+    unknown = [i for i in range(16) if not board.revealed[i] and not board.flags[i]]
+    hits = dict.fromkeys(unknown, 0)
+    total = 0
+    for layout in combinations(unknown, board.mine_count - flags_placed):
+        mine = set(layout)
+        if all(board.counts[i] == sum(1 for j in board.neighbor_ids(i) if board.flags[j] or j in mine)
+               for i in revealed):
+            total += 1
+            for j in layout:
+                hits[j] += 1
+    return {j: h / total for j, h in hits.items()}
+
+
+@pytest.mark.parametrize("mines", [2, 4, 6])
+@pytest.mark.parametrize("seed", range(12))
+def test_probabilities_match_brute_force(mines, seed):
+    rng = random.Random(seed)
+    layout = []
+
+    def source(n, count, row, col):
+        layout.extend(rng.sample([i for i in range(n * n) if i != row * n + col], count))
+        return layout
+
+    game = GameLogic(BoardManager(4, mines, seed=seed), board_source=source)
+    board = game.board_mgr
+    game.reveal_cell(rng.randrange(4), rng.randrange(4))
+    engine = MineProbability()
+    while not game.is_game_over:
+        pm = engine.compute(board, game.frontier, game.flags_placed)
+        exact = exact_marginals(board, game.flags_placed)
+        for i, p in exact.items():
+            assert pm.probability(*divmod(i, 4)) == pytest.approx(p, abs=1e-9)
+        (row, col), best = pm.best_guess(rng)
+        assert best == pytest.approx(min(exact.values()), abs=1e-9)
+        assert exact[row * 4 + col] == pytest.approx(best, abs=1e-9)
+        # reveal a safe cell or flag a mine, and look again
+        i = rng.choice(sorted(exact))
+        if board.mines[i]:
+            game.toggle_flag(*divmod(i, 4))
+        else:
+            game.reveal_cell(*divmod(i, 4))
+        if all(board.revealed[j] or board.flags[j] for j in range(16)):
+            break
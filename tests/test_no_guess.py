@@ -0,0 +1,28 @@
+"""
+File: test_no_guess.py
+Purpose:
+    Check that no-guess board generation is deterministic for a seed, that
+    the boards it deals pass the solvability check, and that neither touches
+    the global `random` state (seeded simulations rely on that).
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from no_guess import generate, is_solvable
+
+
+def test_generate_is_seeded_and_leaves_global_random_alone():
+    state = random.getstate()
+    first = generate(9, 10, 4, 4, seed=5)
+    assert first is not None
+    assert is_solvable(9, first, 4, 4)
+    assert generate(9, 10, 4, 4, seed=5) == first
+    assert random.getstate() == state
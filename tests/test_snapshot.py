@@ -0,0 +1,75 @@
+"""
+File: test_snapshot.py
+Purpose:
+    Check that snapshot saves append only the tiles a move touched (undo
+    included), and that a resumed snapshot keeps appending to the same file
+    so the game loads back in its latest state.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from board_manager import BoardManager
+from game_logic import GameLogic
+from snapshot import load_snapshot, resume_snapshot, save_snapshot
+
+
+def planes(game):
+    board = game.board_mgr
+    cells = board.grid_size ** 2
+    return [bytes(bool(x) for x in plane[0:cells]) for plane in (board.mines, board.flags, board.revealed)]
+
+
+def test_save_appends_only_touched_tiles(tmp_path):
+    path = str(tmp_path / "game.snap")
+    game = GameLogic(BoardManager(64, 400, compact=True, seed=3))
+    game.reveal_cell_ids(32, 32)
+    writer = save_snapshot(path, game, tile_cells=256)
+    assert writer.save() == 0
+    game.toggle_flag(0, 0)
+    assert writer.save() == 1
+    game.undo()
+    assert writer.save() == 1
+    assert planes(load_snapshot(path)) == planes(game)
+
+
+def test_resume_keeps_appending(tmp_path):
+    path = str(tmp_path / "game.snap")
+    game = GameLogic(BoardManager(40, 200, seed=7))
+    game.reveal_cell_ids(20, 20)
+    save_snapshot(path, game, tile_cells=64).close()
+    size = os.path.getsize(path)
+
+    writer = resume_snapshot(path)
+    resumed = writer.game
+    assert planes(resumed) == planes(game)
+    row, col = resumed.board_mgr.random_untouched(random.Random(0))
+    resumed.toggle_flag(row, col)
+    assert writer.save() == 1
+    assert os.path.getsize(path) > size
+    loaded = load_snapshot(path)
+    assert planes(loaded) == planes(resumed)
+    assert loaded.flags_placed == 1
+
+
+def test_resume_drops_unfinished_save(tmp_path):
+    path = str(tmp_path / "game.snap")
+    game = GameLogic(BoardManager(16, 30, seed=1))
+    game.reveal_cell_ids(8, 8)
+    writer = save_snapshot(path, game, tile_cells=64)
+    size = os.path.getsize(path)
+    game.toggle_flag(*game.board_mgr.random_untouched(random.Random(0)))
+    writer.save()
+    # cut the flag save short: its STATE record is lost
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) - 1)
+    writer = resume_snapshot(path)
+    assert os.path.getsize(path) == size
+    assert writer.game.flags_placed == 0
@@ -0,0 +1,199 @@
+"""
+File: test_undo_redo.py
+Purpose:
+    Check that GameLogic.undo() takes a game back through exactly the states
+    it passed on the way (covered index, frontier, flag mismatch count,
+    revealed-cell counter), that undoing the first reveal keeps the mines,
+    that the undo history forgets its oldest moves at `history`, and that a
+    saved trace -- undos, redos and evictions included -- replays to the
+    same game.
+
+Run: python -m pytest tests
+
+Created: 2026-10-17
+"""
+
+import os
+import random
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from board_manager import BoardManager
+from frontier import Frontier
+from game_logic import UNDO_LIMIT, GameLogic
+from move_log import load_trace, save_trace
+from replay import replay
+
+LAYOUTS = [
+    {"compact": False, "lazy_counts": False},
+    {"compact": True, "lazy_counts": True},
+]
+
+
+# everything a move can change, except the mines (placed once, on the first reveal)
+def snapshot(game):
+    board = game.board_mgr
+    cells = range(board.grid_size ** 2)
+    return (
+        [bool(board.revealed[i]) for i in cells],
+        [bool(board.flags[i]) for i in cells],
+        sorted(board.covered),
+        {i: list(counts) for i, counts in game.frontier.cells.items()},
+        game.revealed_safe_cells,
+        game.flags_placed,
+        game.is_game_over,
+        game.did_win,
+    )
+
+
+def mine_layout(board):
+    return [bool(board.mines[i]) for i in range(board.grid_size ** 2)]
+
+
+def check_state(game):
+    board = game.board_mgr
+    cells = range(board.grid_size ** 2)
+    revealed = {i for i in cells if board.revealed[i]}
+    flagged = {i for i in cells if board.flags[i]}
+    assert set(board.covered) == set(cells) - revealed - flagged
+    assert game.revealed_safe_cells == len(revealed)
+    if not game.is_first_click:
+        assert game.mismatches == sum(1 for i in cells if bool(board.mines[i]) != (i in flagged))
+    scanned = Frontier(board)
+    scanned.rebuild()
+    assert game.frontier.cells == scanned.cells
+    assert game.frontier.dirty <= set(game.frontier.cells)
+
+
+# a random reveal or flag toggle; False if it did not change the game
+def random_move(game, rng):
+    board = game.board_mgr
+    n = board.grid_size
+    if rng.random() < 0.3:
+        return bool(game.toggle_flag(rng.randrange(n), rng.randrange(n)))
+    row, col = board.random_untouched(rng)
+    # step around most mines so games last a while
+    if not game.is_first_click and board.mines[row * n + col] and rng.random() < 0.8:
+        return False
+    return len(game.reveal_cell_ids(row, col)) > 0
+
+
+@pytest.mark.parametrize("layout", LAYOUTS, ids=["object", "compact-lazy"])
+@pytest.mark.parametrize("seed", range(8))
+def test_undo_walks_back_through_every_state(layout, seed):
+    rng = random.Random(seed)
+    n = rng.choice([4, 8, 16])
+    game = GameLogic(BoardManager(n, n * n // 6, seed=seed, **layout))
+    states = [snapshot(game)]
+    for _ in range(60):
+        if game.is_game_over:
+            break
+        if random_move(game, rng):
+            states.append(snapshot(game))
+            check_state(game)
+    mines = mine_layout(game.board_mgr)
+
+    # every undo lands on the state before the move it takes back
+    for expected in reversed(states[:-1]):
+        assert len(game.undo()) > 0
+        assert snapshot(game) == expected
+        check_state(game)
+    assert len(game.undo()) == 0
+    assert game.frontier.cells == {} and game.frontier.dirty == set()
+    assert game.revealed_safe_cells == 0
+    assert mine_layout(game.board_mgr) == mines
+
+    # redo goes forward through the same states again
+    for expected in states[1:]:
+        assert len(game.redo()) > 0
+        assert snapshot(game) == expected
+        check_state(game)
+
+
+@pytest.mark.parametrize("history", [3, 1000])
+@pytest.mark.parametrize("seed", range(6))
+def test_trace_replays_undo_and_redo(tmp_path, history, seed):
+    rng = random.Random(seed)
+    game = GameLogic(BoardManager(12, 20, seed=seed), history=history)
+    for _ in range(80):
+        roll = rng.random()
+        if roll < 0.2:
+            game.undo()
+        elif roll < 0.3:
+            game.redo()
+        elif not game.is_game_over:
+            random_move(game, rng)
+    # finish by undoing everything the history still holds
+    while len(game.undo()):
+        check_state(game)
+
+    path = str(tmp_path / "game.trace")
+    save_trace(path, game)
+    grid_size, mine_count, seed_read, log, history_read = load_trace(path)
+    assert history_read == history
+    replayed = replay(grid_size, mine_count, seed_read, log, history=history_read)
+    assert snapshot(replayed) == snapshot(game)
+    assert mine_layout(replayed.board_mgr) == mine_layout(game.board_mgr)
+    assert replayed.mismatches == game.mismatches
+    assert replayed.move_log.to_bytes() == game.move_log.to_bytes()
+
+
+# a game kept more undo history than the default: its trace must replay with that history,
+# or the replayed game runs out of moves to undo before the recorded one did
+def test_trace_keeps_longer_history(tmp_path):
+    history = UNDO_LIMIT + 20
+    game = GameLogic(BoardManager(6, 10, seed=3), history=history)
+    game.toggle_flag(0, 2)
+    for _ in range(history - 1):
+        game.toggle_flag(0, 0)
+    while len(game.undo()):
+        pass
+    assert game.flags_placed == 0
+    path = str(tmp_path / "long.trace")
+    save_trace(path, game)
+    grid_size, mine_count, seed, log, history_read = load_trace(path)
+    assert history_read == history
+    assert snapshot(replay(grid_size, mine_count, seed, log, history=history_read)) == snapshot(game)
+    assert snapshot(replay(grid_size, mine_count, seed, log)) != snapshot(game)
+
+
+def test_history_forgets_oldest_moves():
+    game = GameLogic(BoardManager(6, 10, seed=1), history=4)
+    states = [snapshot(game)]
+    for col in range(6):
+        game.toggle_flag(0, col)
+        states.append(snapshot(game))
+    for expected in reversed(states[2:-1]):
+        game.undo()
+        assert snapshot(game) == expected
+    # the two oldest flags were evicted and stay put
+    assert len(game.undo()) == 0
+    assert snapshot(game) == states[2]
+
+
+def test_undo_of_first_reveal_keeps_mines():
+    game = GameLogic(BoardManager(9, 10, seed=4))
+    game.reveal_cell(4, 4)
+    mines = mine_layout(game.board_mgr)
+    assert sum(mines) == 10
+    game.undo()
+    assert not game.is_first_click
+    assert game.revealed_safe_cells == 0
+    assert mine_layout(game.board_mgr) == mines
+    # the next reveal plays on those mines instead of placing new ones
+    game.reveal_cell(0, 0)
+    assert mine_layout(game.board_mgr) == mines
+
+
+def test_version_one_trace_loads_without_history(tmp_path):
+    game = GameLogic(BoardManager(5, 3, seed=2))
+    game.reveal_cell(2, 2)
+    path = tmp_path / "old.trace"
+    path.write_bytes(struct.pack("<4sHIIQ", b"MSWL", 1, 5, 3, 2) + game.move_log.to_bytes())
+    grid_size, mine_count, seed, log, history = load_trace(str(path))
+    assert (grid_size, mine_count, seed, history) == (5, 3, 2, None)
+    assert snapshot(replay(grid_size, mine_count, seed, log, history=history)) == snapshot(game)